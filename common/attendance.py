@@ -1,83 +1,107 @@
 # common/attendance.py
 from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import cast, Date, func
-from database.models import Attendance, Employee
-from schema.attendance_schema import AttendanceCreate
-from typing import List, Dict
-from common.common import _require_admin
+from sqlalchemy import cast, Date, func, insert, select
+from sqlalchemy.exc import IntegrityError
+from database.models import Attendance, AttendanceDaily, Employee
+from schema.attendance_schema import AttendanceCreate, AttendanceResponse
+from typing import List, Dict, Optional
+from common.common import _check_date_range, _month_range, _require_admin
 from datetime import datetime, date, time
+from itertools import groupby
 from routers.auth import db_dependency, user_dependency
+from common.pagination import PageParams, apaginate, paginate
+from common.export import ExportFormat, stream_export
+from common.org import is_in_tree, subordinate_ids
+
+TEAM_RANGE_MAX_DAYS = 31
+SUMMARY_RANGE_MAX_DAYS = 366
+ROLLUP_BATCH_SIZE = 1000
 
 
 # === USER: CREATE ===
 def create_attendance(db: Session, punch_time, current_user: dict) -> Attendance:
     new_att = Attendance(punch_time=punch_time, fk_employee_id=current_user["id"])
     db.add(new_att)
+    _record_punch(db, current_user["id"], punch_time)
     db.commit()
     return new_att
 
 
 # === USER: READ OWN ===
-def get_my_attendance_all(db: Session, current_user: dict) -> List[Attendance]:
-    return (
-        db.query(Attendance)
-        .filter(Attendance.fk_employee_id == current_user["id"])
-        .all()
-    )
+async def get_my_attendance_all(
+    db: AsyncSession, current_user: dict, page: PageParams
+) -> List[Attendance]:
+    stmt = select(Attendance).filter(Attendance.fk_employee_id == current_user["id"])
+    return await apaginate(db, stmt, page, Attendance.attendance_id)
 
 
-def get_my_attendance_by_date(
-    db: db_dependency, user: user_dependency, punch_date: date
+async def get_my_attendance_by_date(
+    db: AsyncSession, user: user_dependency, punch_date: date, page: PageParams
 ):
     start_dt = datetime.combine(punch_date, time.min)
     end_dt = datetime.combine(punch_date, time.max)
 
-    return (
-        db.query(Attendance)
-        .filter(
-            Attendance.fk_employee_id == user["id"],
-            Attendance.punch_time >= start_dt,
-            Attendance.punch_time <= end_dt,
-        )
-        .order_by(Attendance.punch_time)
-        .all()
+    stmt = select(Attendance).filter(
+        Attendance.fk_employee_id == user["id"],
+        Attendance.punch_time >= start_dt,
+        Attendance.punch_time <= end_dt,
+    )
+    return await apaginate(
+        db, stmt, page, Attendance.punch_time, Attendance.attendance_id
     )
 
 
-# MANAGER: All direct reports' attendance on a given date
+# MANAGER: Team attendance on a given date, down to `depth` levels
 def get_manager_team_attendance_by_date(
     punch_date: date,
     db: Session,
     user: dict,
+    page: PageParams,
+    depth: int = 1,
 ) -> List[Attendance]:
-    # Real check: does ANY employee report to this user?
-    has_subordinates = (
-        db.query(Employee).filter(Employee.fk_manager_id == user["id"]).first()
+    start_dt = datetime.combine(punch_date, time.min)
+    end_dt = datetime.combine(punch_date, time.max)
+
+    # One semi-join on the org tree; no subordinates simply means no rows
+    query = _team_attendance_query(db, user["id"], depth).filter(
+        Attendance.punch_time.between(start_dt, end_dt)
+    )
+    return paginate(
+        query,
+        page,
+        Attendance.fk_employee_id,
+        Attendance.punch_time,
+        Attendance.attendance_id,
     )
 
-    if not has_subordinates:
-        return []  # No one reports to you → empty list (safe)
 
-    managed_ids = [
-        e.employee_id
-        for e in db.query(Employee.employee_id)
-        .filter(Employee.fk_manager_id == user["id"])
-        .all()
-    ]
+# MANAGER: Team attendance over a date range, grouped per employee
+def get_manager_team_attendance_by_range(
+    start_date: date,
+    end_date: date,
+    db: Session,
+    user: dict,
+    depth: int = 1,
+) -> List[Dict]:
+    _check_date_range(start_date, end_date, TEAM_RANGE_MAX_DAYS)
 
-    start_dt = datetime.combine(punch_date, time.min)
-    end_dt = datetime.combine(punch_date, time.max)
+    start_dt = datetime.combine(start_date, time.min)
+    end_dt = datetime.combine(end_date, time.max)
 
-    return (
-        db.query(Attendance)
-        .filter(
-            Attendance.fk_employee_id.in_(managed_ids),
-            Attendance.punch_time.between(start_dt, end_dt),
+    rows = (
+        _team_attendance_query(db, user["id"], depth)
+        .filter(Attendance.punch_time.between(start_dt, end_dt))
+        .order_by(
+            Attendance.fk_employee_id, Attendance.punch_time, Attendance.attendance_id
         )
-        .order_by(Attendance.fk_employee_id, Attendance.punch_time)
         .all()
     )
+    return [
+        {"employee_id": employee_id, "attendance": list(records)}
+        for employee_id, records in groupby(rows, key=lambda a: a.fk_employee_id)
+    ]
 
 
 # MANAGER: One specific subordinate's attendance on a date
@@ -86,17 +110,11 @@ def get_manager_subordinate_attendance_by_date(
     punch_date: date,
     db: Session,
     user: dict,
+    page: PageParams,
+    depth: int = 1,
 ) -> List[Attendance]:
-    # Security: employee must exist AND report directly to current user
-    employee = (
-        db.query(Employee)
-        .filter(
-            Employee.employee_id == employee_id, Employee.fk_manager_id == user["id"]
-        )
-        .first()
-    )
-
-    if not employee:
+    # Security: employee must sit within `depth` levels under the current user
+    if not is_in_tree(db, user["id"], employee_id, depth):
         raise HTTPException(
             status_code=404, detail="Employee not found under your management"
         )
@@ -104,40 +122,44 @@ def get_manager_subordinate_attendance_by_date(
     start_dt = datetime.combine(punch_date, time.min)
     end_dt = datetime.combine(punch_date, time.max)
 
-    return (
-        db.query(Attendance)
-        .filter(
-            Attendance.fk_employee_id == employee_id,
-            Attendance.punch_time.between(start_dt, end_dt),
-        )
-        .order_by(Attendance.punch_time)
-        .all()
+    query = db.query(Attendance).filter(
+        Attendance.fk_employee_id == employee_id,
+        Attendance.punch_time.between(start_dt, end_dt),
     )
+    return paginate(query, page, Attendance.punch_time, Attendance.attendance_id)
 
 
 # === ADMIN: READ ALL ===
-def get_all_attendance(db: Session, user: user_dependency):
+async def get_all_attendance(db: AsyncSession, user: user_dependency, page: PageParams):
     _require_admin(user=user)
-    return db.query(Attendance).all()
+    return await apaginate(db, select(Attendance), page, Attendance.attendance_id)
+
+
+def export_all_attendance(db: Session, user: user_dependency, fmt: ExportFormat):
+    _require_admin(user=user)
+    query = db.query(Attendance).order_by(Attendance.attendance_id)
+    return stream_export(query, AttendanceResponse, fmt, "attendance")
 
 
 def get_attendance_by_date_all_employees(
-    db: Session, punch_date: datetime, user: user_dependency
+    db: Session, punch_date: datetime, user: user_dependency, page: PageParams
 ):
     _require_admin(user=user)
     start_dt = datetime.combine(punch_date, time.min)
     end_dt = datetime.combine(punch_date, time.max)
 
-    return (
-        db.query(Attendance)
-        .filter(Attendance.punch_time >= start_dt, Attendance.punch_time <= end_dt)
-        .order_by(Attendance.punch_time)
-        .all()
+    query = db.query(Attendance).filter(
+        Attendance.punch_time >= start_dt, Attendance.punch_time <= end_dt
     )
+    return paginate(query, page, Attendance.punch_time, Attendance.attendance_id)
 
 
 def get_attendance_by_date_one_employee(
-    db: Session, employee_id: int, punch_date: datetime, user: user_dependency
+    db: Session,
+    employee_id: int,
+    punch_date: datetime,
+    user: user_dependency,
+    page: PageParams,
 ):
     _require_admin(user=user)
     employee = db.query(Employee).filter(Employee.employee_id == employee_id).first()
@@ -148,20 +170,16 @@ def get_attendance_by_date_one_employee(
     start_dt = datetime.combine(punch_date, time.min)
     end_dt = datetime.combine(punch_date, time.max)
 
-    return (
-        db.query(Attendance)
-        .filter(
-            Attendance.punch_time >= start_dt,
-            Attendance.punch_time <= end_dt,
-            Attendance.fk_employee_id == employee_id,
-        )
-        .order_by(Attendance.punch_time)
-        .all()
+    query = db.query(Attendance).filter(
+        Attendance.punch_time >= start_dt,
+        Attendance.punch_time <= end_dt,
+        Attendance.fk_employee_id == employee_id,
     )
+    return paginate(query, page, Attendance.punch_time, Attendance.attendance_id)
 
 
 def get_all_attendance_of_employee(
-    db: Session, employee_id: int, user: user_dependency
+    db: Session, employee_id: int, user: user_dependency, page: PageParams
 ):
     _require_admin(user=user)
     employee = db.query(Employee).filter(Employee.employee_id == employee_id).first()
@@ -169,7 +187,152 @@ def get_all_attendance_of_employee(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Employee Not Founds"
         )
-    records = (
-        db.query(Attendance).filter(Attendance.fk_employee_id == employee_id).all()
+    query = db.query(Attendance).filter(Attendance.fk_employee_id == employee_id)
+    return paginate(query, page, Attendance.attendance_id)
+
+
+# === DAILY ROLLUP ===
+def get_my_attendance_summary(
+    db: Session, user: dict, start_date: date, end_date: date, page: PageParams
+) -> List[AttendanceDaily]:
+    _check_date_range(start_date, end_date, SUMMARY_RANGE_MAX_DAYS)
+    query = db.query(AttendanceDaily).filter(
+        AttendanceDaily.fk_employee_id == user["id"],
+        AttendanceDaily.work_date.between(start_date, end_date),
+    )
+    return paginate(
+        query, page, AttendanceDaily.work_date, AttendanceDaily.attendance_daily_id
+    )
+
+
+def get_manager_team_attendance_summary(
+    db: Session,
+    user: dict,
+    start_date: date,
+    end_date: date,
+    page: PageParams,
+    depth: int = 1,
+) -> List[AttendanceDaily]:
+    _check_date_range(start_date, end_date, SUMMARY_RANGE_MAX_DAYS)
+    query = db.query(AttendanceDaily).filter(
+        AttendanceDaily.fk_employee_id.in_(subordinate_ids(user["id"], depth)),
+        AttendanceDaily.work_date.between(start_date, end_date),
+    )
+    return paginate(
+        query,
+        page,
+        AttendanceDaily.fk_employee_id,
+        AttendanceDaily.work_date,
+        AttendanceDaily.attendance_daily_id,
+    )
+
+
+def get_attendance_summary_by_month(
+    db: Session, user: user_dependency, year: int, month: int, page: PageParams
+) -> List[AttendanceDaily]:
+    _require_admin(user=user)
+    start, next_start = _month_range(year, month)
+    query = db.query(AttendanceDaily).filter(
+        AttendanceDaily.work_date >= start.date(),
+        AttendanceDaily.work_date < next_start.date(),
     )
-    return records
+    return paginate(
+        query,
+        page,
+        AttendanceDaily.fk_employee_id,
+        AttendanceDaily.work_date,
+        AttendanceDaily.attendance_daily_id,
+    )
+
+
+def rebuild_attendance_daily(
+    db: Session, start_date: Optional[date] = None, end_date: Optional[date] = None
+) -> int:
+    """Recompute the daily rollup from raw punches and return the rows written.
+
+    Without bounds the whole table is rebuilt; the backfill job passes one
+    month at a time so the aggregate never has to be held in memory at once.
+    """
+    work_date = func.date(Attendance.punch_time, type_=Date)
+    punches = db.query(
+        Attendance.fk_employee_id,
+        work_date,
+        func.min(Attendance.punch_time),
+        func.max(Attendance.punch_time),
+        func.count(Attendance.attendance_id),
+    ).group_by(Attendance.fk_employee_id, work_date)
+    stale = db.query(AttendanceDaily)
+    if start_date:
+        punches = punches.filter(
+            Attendance.punch_time >= datetime.combine(start_date, time.min)
+        )
+        stale = stale.filter(AttendanceDaily.work_date >= start_date)
+    if end_date:
+        punches = punches.filter(
+            Attendance.punch_time <= datetime.combine(end_date, time.max)
+        )
+        stale = stale.filter(AttendanceDaily.work_date <= end_date)
+
+    rows = [
+        {
+            "fk_employee_id": employee_id,
+            "work_date": day,
+            "first_punch": first,
+            "last_punch": last,
+            "punch_count": count,
+            "worked_seconds": int((last - first).total_seconds()),
+        }
+        for employee_id, day, first, last, count in punches.all()
+    ]
+    stale.delete(synchronize_session=False)
+    for i in range(0, len(rows), ROLLUP_BATCH_SIZE):
+        db.execute(insert(AttendanceDaily), rows[i : i + ROLLUP_BATCH_SIZE])
+    db.commit()
+    return len(rows)
+
+
+# === Helper Functions ===
+def _team_attendance_query(db: Session, manager_id: int, depth: int):
+    return db.query(Attendance).filter(
+        Attendance.fk_employee_id.in_(subordinate_ids(manager_id, depth))
+    )
+
+
+def _locked_day(db: Session, employee_id: int, work_date: date):
+    return (
+        db.query(AttendanceDaily)
+        .filter(
+            AttendanceDaily.fk_employee_id == employee_id,
+            AttendanceDaily.work_date == work_date,
+        )
+        .with_for_update()
+        .first()
+    )
+
+
+def _record_punch(db: Session, employee_id: int, punch_time: datetime):
+    # Stored punch times are naive wall-clock values; match them
+    punch_time = punch_time.replace(tzinfo=None)
+    day = _locked_day(db, employee_id, punch_time.date())
+    if day is None:
+        # No row to lock yet, so a concurrent first punch can insert it too.
+        # The loser rolls back to the savepoint and updates the winner's row.
+        try:
+            with db.begin_nested():
+                db.add(
+                    AttendanceDaily(
+                        fk_employee_id=employee_id,
+                        work_date=punch_time.date(),
+                        first_punch=punch_time,
+                        last_punch=punch_time,
+                        punch_count=1,
+                        worked_seconds=0,
+                    )
+                )
+            return
+        except IntegrityError:
+            day = _locked_day(db, employee_id, punch_time.date())
+    day.first_punch = min(day.first_punch, punch_time)
+    day.last_punch = max(day.last_punch, punch_time)
+    day.punch_count += 1
+    day.worked_seconds = int((day.last_punch - day.first_punch).total_seconds())
@@ -1,4 +1,9 @@
+from datetime import date, datetime
 from fastapi import HTTPException, status
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+from typing import Callable, Dict, List, Optional
+from schema.bulk_schema import BulkOutcome
 
 
 def _require_admin(user: dict):
@@ -6,3 +11,78 @@ def _require_admin(user: dict):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required"
         )
+
+
+def _month_range(year: int, month: int):
+    """Return the half-open ``[start, next_start)`` bounds of a calendar month."""
+    try:
+        start = datetime(year, month, 1)
+        next_start = datetime(year + month // 12, month % 12 + 1, 1)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid year or month"
+        )
+    return start, next_start
+
+
+def _in_month(column, year: int, month: int):
+    # Range predicate instead of extract() so the column's index can be used
+    start, next_start = _month_range(year, month)
+    return and_(column >= start, column < next_start)
+
+
+def _check_date_range(start_date: date, end_date: date, max_days: int):
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must not be before start_date",
+        )
+    if (end_date - start_date).days >= max_days:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range cannot exceed {max_days} days",
+        )
+
+
+def _bulk_update_status(
+    db: Session,
+    id_column,
+    status_column,
+    ids: List[int],
+    new_status,
+    manager_id: int,
+    check: Optional[Callable[[Session, List[int]], Dict[int, BulkOutcome]]] = None,
+) -> List[dict]:
+    """Set ``status_column`` on every row in ``ids`` that ``manager_id`` manages.
+
+    One query sorts the ids into missing, someone else's and ours; one
+    ``UPDATE ... WHERE id IN (...) AND fk_manager_id = :me`` applies the
+    change, and a single commit covers the whole batch. ``check`` may veto
+    some of our ids first, inside the same transaction, by returning an
+    outcome for each.
+    """
+    model = id_column.class_
+    owners = dict(
+        db.query(id_column, model.fk_manager_id).filter(id_column.in_(ids)).all()
+    )
+    mine = [item_id for item_id, owner in owners.items() if owner == manager_id]
+    vetoed = check(db, mine) if check and mine else {}
+    mine = [item_id for item_id in mine if item_id not in vetoed]
+    if mine:
+        db.query(model).filter(
+            id_column.in_(mine), model.fk_manager_id == manager_id
+        ).update({status_column: new_status})
+    db.commit()
+
+    results = []
+    for item_id in dict.fromkeys(ids):
+        if item_id not in owners:
+            outcome = BulkOutcome.not_found
+        elif owners[item_id] != manager_id:
+            outcome = BulkOutcome.forbidden
+        elif item_id in vetoed:
+            outcome = vetoed[item_id]
+        else:
+            outcome = BulkOutcome.updated
+        results.append({"id": item_id, "outcome": outcome})
+    return results
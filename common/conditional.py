@@ -0,0 +1,117 @@
+# common/conditional.py
+import hashlib
+from typing import Callable, List
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from database.models import DataVersion
+from routers.auth import db_dependency, user_dependency
+
+# Per-user data: browsers may keep it but must revalidate before every use
+CACHE_CONTROL = "private, no-cache"
+ETAG_HEADER = "ETag"
+
+
+# === VERSION COUNTERS ===
+def bump_version(db: Session, resource: str, employee_id: int) -> None:
+    """Mark ``resource`` as changed for ``employee_id``; call before commit."""
+    updated = (
+        db.query(DataVersion)
+        .filter(
+            DataVersion.resource == resource, DataVersion.employee_id == employee_id
+        )
+        .update(
+            {DataVersion.version: DataVersion.version + 1},
+            synchronize_session=False,
+        )
+    )
+    if not updated:
+        db.add(DataVersion(resource=resource, employee_id=employee_id, version=1))
+
+
+def bump_versions(
+    db: Session, resource: str, employee_ids: List[int], batch_size: int = 1000
+) -> None:
+    """Set-based ``bump_version`` for bulk writes, ``batch_size`` ids at a time."""
+    for i in range(0, len(employee_ids), batch_size):
+        batch = employee_ids[i : i + batch_size]
+        existing = {
+            employee_id
+            for (employee_id,) in db.query(DataVersion.employee_id).filter(
+                DataVersion.resource == resource, DataVersion.employee_id.in_(batch)
+            )
+        }
+        db.query(DataVersion).filter(
+            DataVersion.resource == resource, DataVersion.employee_id.in_(existing)
+        ).update(
+            {DataVersion.version: DataVersion.version + 1},
+            synchronize_session=False,
+        )
+        new_rows = [
+            {"resource": resource, "employee_id": employee_id, "version": 1}
+            for employee_id in batch
+            if employee_id not in existing
+        ]
+        if new_rows:
+            db.execute(insert(DataVersion), new_rows)
+
+
+def data_version(db: Session, resource: str, employee_id: int) -> int:
+    version = (
+        db.query(DataVersion.version)
+        .filter(
+            DataVersion.resource == resource, DataVersion.employee_id == employee_id
+        )
+        .scalar()
+    )
+    return version or 0
+
+
+def employee_version(resource: str) -> Callable[[Session, dict], str]:
+    return lambda db, user: f"{user['id']}:{data_version(db, resource, user['id'])}"
+
+
+# === DEPENDENCY ===
+def conditional_get(version: Callable[[Session, dict], str]):
+    """Router dependency answering ``If-None-Match`` before the handler runs.
+
+    ``version(db, user)`` must change whenever the response could; it is
+    hashed with the URL into a weak ETag. On a match the request ends here
+    with an empty 304, so neither the list query nor serialization runs.
+    """
+
+    def dependency(
+        request: Request, response: Response, db: db_dependency, user: user_dependency
+    ):
+        tag = _etag(str(request.url), version(db, user))
+        headers = {
+            ETAG_HEADER: tag,
+            "Cache-Control": CACHE_CONTROL,
+            "Vary": "Authorization",
+        }
+        if _matches(request.headers.get("if-none-match"), tag):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+        response.headers.update(headers)
+
+    return Depends(dependency)
+
+
+# === Helper Functions ===
+def _etag(url: str, version: str) -> str:
+    digest = hashlib.sha256(f"{url}|{version}".encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def _matches(if_none_match, tag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" name the same representation
+    opaque = tag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
@@ -0,0 +1,141 @@
+# common/dashboard.py
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional
+from sqlalchemy import and_, exists, func, literal, select, union_all
+from sqlalchemy.orm import Session
+from database.models import (
+    AttendanceDaily,
+    Employee,
+    ExpenseClaim,
+    LeaveApplication,
+    Regularization,
+    Status,
+)
+from schema.dashboard_schema import CheckInStatus
+from common.org import subordinate_ids
+
+DASHBOARD_RECENT_DEFAULT = 5
+DASHBOARD_RECENT_MAX = 50
+
+# key -> (model, manager column, status column, newest-first order)
+_INBOXES = {
+    "leave_applications": (
+        LeaveApplication,
+        LeaveApplication.fk_manager_id,
+        LeaveApplication.leave_status,
+        LeaveApplication.leave_application_id.desc(),
+    ),
+    "expense_claims": (
+        ExpenseClaim,
+        ExpenseClaim.fk_manager_id,
+        ExpenseClaim.claim_status,
+        ExpenseClaim.claim_id.desc(),
+    ),
+    "regularizations": (
+        Regularization,
+        Regularization.fk_manager_id,
+        Regularization.regularization_status,
+        Regularization.regularization_id.desc(),
+    ),
+}
+
+
+def get_manager_dashboard(
+    db: Session,
+    user: dict,
+    recent: int = DASHBOARD_RECENT_DEFAULT,
+    on_date: Optional[date] = None,
+    depth: int = 1,
+) -> dict:
+    """Everything a manager's landing page shows, in five queries.
+
+    One UNION ALL of per-inbox ``GROUP BY status`` counts, one query per
+    inbox for the ``recent`` newest pending items (each served by its
+    ``(fk_manager_id, status, ...)`` index), and one for the team's
+    check-in state on ``on_date`` from the daily attendance rollup.
+    """
+    on_date = on_date or date.today()
+    counts = _status_counts(db, user["id"])
+    dashboard = {
+        key: {
+            "counts": counts.get(key, {}),
+            "recent_pending": db.query(model)
+            .filter(manager_column == user["id"], status_column == Status.Pending)
+            .order_by(newest_first)
+            .limit(recent)
+            .all(),
+        }
+        for key, (
+            model,
+            manager_column,
+            status_column,
+            newest_first,
+        ) in _INBOXES.items()
+    }
+    return {
+        "on_date": on_date,
+        **dashboard,
+        "team": _team_today(db, user["id"], on_date, depth),
+    }
+
+
+# === Helper Functions ===
+def _status_counts(db: Session, manager_id: int) -> Dict[str, Dict[str, int]]:
+    grouped = union_all(
+        *(
+            select(literal(key).label("inbox"), status_column, func.count())
+            .where(manager_column == manager_id)
+            .group_by(status_column)
+            for key, (_, manager_column, status_column, _) in _INBOXES.items()
+        )
+    )
+    counts: Dict[str, Dict[str, int]] = {}
+    for key, inbox_status, count in db.execute(grouped):
+        counts.setdefault(key, {})[Status(inbox_status).name.lower()] = count
+    return counts
+
+
+def _team_today(db: Session, manager_id: int, on_date: date, depth: int) -> List[dict]:
+    day_start = datetime.combine(on_date, time.min)
+    on_leave = exists().where(
+        LeaveApplication.fk_employee_id == Employee.employee_id,
+        LeaveApplication.leave_status == Status.Approved,
+        LeaveApplication.from_date < day_start + timedelta(days=1),
+        LeaveApplication.end_date >= day_start,
+    )
+    rows = (
+        db.query(
+            Employee.employee_id,
+            Employee.first_name,
+            Employee.last_name,
+            AttendanceDaily.first_punch,
+            AttendanceDaily.last_punch,
+            AttendanceDaily.punch_count,
+            on_leave.label("on_leave"),
+        )
+        .outerjoin(
+            AttendanceDaily,
+            and_(
+                AttendanceDaily.fk_employee_id == Employee.employee_id,
+                AttendanceDaily.work_date == on_date,
+            ),
+        )
+        .filter(Employee.employee_id.in_(subordinate_ids(manager_id, depth)))
+        .order_by(Employee.employee_id)
+    )
+    return [
+        {
+            "employee_id": row.employee_id,
+            "first_name": row.first_name,
+            "last_name": row.last_name,
+            "status": (
+                CheckInStatus.present
+                if row.first_punch
+                else CheckInStatus.on_leave if row.on_leave else CheckInStatus.absent
+            ),
+            "first_punch": row.first_punch,
+            "last_punch": row.last_punch,
+            "punch_count": row.punch_count or 0,
+        }
+        for row in rows
+    ]
@@ -5,6 +5,11 @@ from database.models import Department
 from typing import Dict, Any
 from routers.auth import db_dependency, user_dependency
 from common.common import _require_admin
+from common.reference_cache import ReferenceCache, default_channel
+
+department_cache = ReferenceCache(
+    Department.department_id, Department.department_name, channel=default_channel()
+)
 
 
 def _get_department_by_id(db: db_dependency, department_id: int) -> Department:
@@ -17,23 +22,29 @@ def _get_department_by_id(db: db_dependency, department_id: int) -> Department:
 
 
 def _get_department_by_name(db: db_dependency, department_name: str) -> Department:
-    department = (
-        db.query(Department)
-        .filter(Department.department_name.ilike(department_name.strip()))
-        .first()
-    )
-    if not department:
+    cached = department_cache.by_name(db, department_name)
+    if not cached:
         raise HTTPException(status_code=404, detail="Department not found")
-    return department
+    return _get_department_by_id(db, cached.department_id)
+
+
+def _department_name_taken(
+    db: db_dependency, department_name: str, exclude_id: int = None
+) -> bool:
+    cached = department_cache.by_name(db, department_name)
+    return cached is not None and cached.department_id != exclude_id
 
 
 # === READ ===
 def get_all_departments(db: db_dependency, user: user_dependency):
-    return db.query(Department).all()
+    return department_cache.all(db)
 
 
 def get_department_by_id(db: db_dependency, department_id: int):
-    return _get_department_by_id(db, department_id)
+    department = department_cache.by_id(db, department_id)
+    if not department:
+        raise HTTPException(status_code=404, detail="Department not found")
+    return department
 
 
 # === ADMIN: CREATE ===
@@ -41,17 +52,15 @@ def create_department(
     db: db_dependency, department_name: str, user: dict
 ) -> Department:
     _require_admin(user)
+    department_cache.refresh(db)
     department_name = department_name.strip()
-    if (
-        db.query(Department)
-        .filter(Department.department_name.ilike(department_name))
-        .first()
-    ):
+    if _department_name_taken(db, department_name):
         raise HTTPException(status_code=400, detail="Department already exists")
 
     new_department = Department(department_name=department_name)
     db.add(new_department)
     db.commit()
+    department_cache.invalidate()
     return new_department
 
 
@@ -60,23 +69,18 @@ def update_department_by_id(
     db: db_dependency, department_id: int, new_department_name: str, user: dict
 ) -> Department:
     _require_admin(user)
+    department_cache.refresh(db)
     department = _get_department_by_id(db, department_id)
 
     new_name = new_department_name.strip()
-    if (
-        db.query(Department)
-        .filter(
-            Department.department_name.ilike(new_name),
-            Department.department_id != department_id,
-        )
-        .first()
-    ):
+    if _department_name_taken(db, new_name, exclude_id=department_id):
         raise HTTPException(
             status_code=400, detail="Department with this name already exists"
         )
 
     department.department_name = new_name
     db.commit()
+    department_cache.invalidate()
     return department
 
 
@@ -88,16 +92,18 @@ def update_department_by_name(
     user: dict,
 ) -> Department:
     _require_admin(user)
+    department_cache.refresh(db)
     department = _get_department_by_name(db, current_department_name)
 
     new_name = new_department_name.strip()
-    if db.query(Department).filter(Department.department_name.ilike(new_name)).first():
+    if _department_name_taken(db, new_name):
         raise HTTPException(
             status_code=400, detail="Department with this name already exists"
         )
 
     department.department_name = new_name
     db.commit()
+    department_cache.invalidate()
     return department
 
 
@@ -106,9 +112,11 @@ def delete_department_by_id(
     db: db_dependency, department_id: int, user: dict
 ) -> Dict[str, str]:
     _require_admin(user)
+    department_cache.refresh(db)
     department = _get_department_by_id(db, department_id)
     db.delete(department)
     db.commit()
+    department_cache.invalidate()
     return {"detail": "Department deleted successfully"}
 
 
@@ -117,7 +125,9 @@ def delete_department_by_name(
     db: db_dependency, department_name: str, user: dict
 ) -> Dict[str, str]:
     _require_admin(user)
+    department_cache.refresh(db)
     department = _get_department_by_name(db, department_name)
     db.delete(department)
     db.commit()
+    department_cache.invalidate()
     return {"detail": "Department deleted successfully"}
@@ -1,15 +1,34 @@
 # /employee.py
-from database.models import Employee
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models import (
+    Employee,
+    ExpenseClaim,
+    LeaveApplication,
+    Regularization,
+    WorkLocation,
+)
+from database.common import hash_password
 from fastapi import HTTPException, status
 from schema.employee_schema import EmployeeCreate, EmployeeUpdate
-from typing import List
+from typing import List, Optional
 from routers.auth import db_dependency, user_dependency
 from common.common import _require_admin
+from common.pagination import PageParams, apaginate, paginate
+from common.org import (
+    add_to_tree,
+    is_in_tree,
+    move_subtree,
+    remove_from_tree,
+    subordinate_ids,
+)
 
 
 # === PUBLIC / SHARED ===
-def get_current_user_employee(db: db_dependency, user: user_dependency) -> Employee:
-    employee = db.query(Employee).filter(Employee.employee_id == user["id"]).first()
+async def get_current_user_employee(
+    db: AsyncSession, user: user_dependency
+) -> Employee:
+    employee = await db.get(Employee, user["id"])
     if not employee:
         raise HTTPException(
             status_code=404, detail="Employee profile not found"
@@ -18,19 +37,21 @@ def get_current_user_employee(db: db_dependency, user: user_dependency) -> Emplo
 
 
 # === ADMIN ONLY ===
-def get_all_employees(db: db_dependency, user: user_dependency) -> List[Employee]:
+async def get_all_employees(
+    db: AsyncSession, user: user_dependency, page: PageParams
+) -> List[Employee]:
     if not user.get("is_admin"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required"
         )
-    return db.query(Employee).all()
+    return await apaginate(db, select(Employee), page, Employee.employee_id)
 
 
-def get_employee_by_id(
-    employee_id: int, db: db_dependency, user: user_dependency
+async def get_employee_by_id(
+    employee_id: int, db: AsyncSession, user: user_dependency
 ) -> Employee:
     _require_admin(user)
-    employee = db.query(Employee).filter(Employee.employee_id == employee_id).first()
+    employee = await db.get(Employee, employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     return employee
@@ -56,9 +77,14 @@ def create_employee(
             status_code=status.HTTP_409_CONFLICT,
             detail="Employee with this email already exists",
         )
+    _check_location(db, employee_data.fk_location_id)
 
-    new_employee = Employee(**employee_data.model_dump())
+    values = employee_data.model_dump()
+    values["password"] = hash_password(values["password"])
+    new_employee = Employee(**values)
     db.add(new_employee)
+    db.flush()
+    add_to_tree(db, new_employee.employee_id, new_employee.fk_manager_id)
     db.commit()
     db.refresh(new_employee)
     return new_employee
@@ -73,8 +99,7 @@ def update_employee_by_id(
     _require_admin(user)
     employee = _get_employee_or_404(db, employee_id)
 
-    for key, value in update_data.model_dump(exclude_unset=True).items():
-        setattr(employee, key, value)
+    _apply_employee_updates(db, employee, update_data)
 
     db.commit()
     db.refresh(employee)
@@ -89,8 +114,7 @@ def update_employee_by_email(
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
-    for key, value in update_data.model_dump(exclude_unset=True).items():
-        setattr(employee, key, value)
+    _apply_employee_updates(db, employee, update_data)
 
     db.commit()
     db.refresh(employee)
@@ -102,6 +126,8 @@ def delete_employee_by_id(
 ) -> dict:
     _require_admin(user)
     employee = _get_employee_or_404(db, employee_id)
+    remove_from_tree(db, employee.employee_id)
+    _detach_managed(db, employee.employee_id)
     db.delete(employee)
     db.commit()
     return {"detail": "Employee deleted successfully"}
@@ -114,17 +140,28 @@ def delete_employee_by_email(
     employee = db.query(Employee).filter(Employee.email == email).first()
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
+    remove_from_tree(db, employee.employee_id)
+    _detach_managed(db, employee.employee_id)
     db.delete(employee)
     db.commit()
     return {"detail": "Employee deleted successfully"}
 
 
 # === MANAGER ONLY ===
+def get_subordinates(
+    db: db_dependency, user: user_dependency, depth: int, page: PageParams
+) -> List[Employee]:
+    query = db.query(Employee).filter(
+        Employee.employee_id.in_(subordinate_ids(user["id"], depth))
+    )
+    return paginate(query, page, Employee.employee_id)
+
+
 def get_subordinate_by_id(
-    employee_id: int, db: db_dependency, user: user_dependency
+    employee_id: int, db: db_dependency, user: user_dependency, depth: int = 1
 ) -> Employee:
     employee = _get_employee_or_404(db, employee_id)
-    if employee.fk_manager_id != user["id"]:
+    if not is_in_tree(db, user["id"], employee.employee_id, depth):
         raise HTTPException(
             status_code=404, detail="Employee not found under your management"
         )
@@ -132,12 +169,12 @@ def get_subordinate_by_id(
 
 
 def get_subordinate_by_email(
-    email: str, db: db_dependency, user: user_dependency
+    email: str, db: db_dependency, user: user_dependency, depth: int = 1
 ) -> Employee:
     employee = db.query(Employee).filter(Employee.email == email).first()
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
-    if employee.fk_manager_id != user["id"]:
+    if not is_in_tree(db, user["id"], employee.employee_id, depth):
         raise HTTPException(
             status_code=404, detail="Employee not found under your management"
         )
@@ -150,3 +187,36 @@ def _get_employee_or_404(db, employee_id: int) -> Employee:
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     return employee
+
+
+def _apply_employee_updates(db, employee: Employee, update_data: EmployeeUpdate):
+    values = update_data.model_dump(exclude_unset=True)
+    _check_location(db, values.get("fk_location_id"))
+    if values.get("password"):
+        values["password"] = hash_password(values["password"])
+    if "fk_manager_id" in values and values["fk_manager_id"] != employee.fk_manager_id:
+        move_subtree(db, employee.employee_id, values["fk_manager_id"])
+
+    for key, value in values.items():
+        setattr(employee, key, value)
+
+
+def _check_location(db, location_id: Optional[int]):
+    if location_id is not None and not db.get(WorkLocation, location_id):
+        raise HTTPException(status_code=404, detail="Location not found")
+
+
+def _detach_managed(db, manager_id: int):
+    """Clear ``fk_manager_id`` wherever it points at ``manager_id``.
+
+    Direct reports become unmanaged, matching the closure table, and
+    requests waiting on this manager leave their inbox. Without this the
+    delete breaks the foreign keys MySQL and the local SQLite engine enforce.
+    """
+    for model in (Employee, ExpenseClaim, LeaveApplication, Regularization):
+        db.execute(
+            update(model)
+            .where(model.fk_manager_id == manager_id)
+            .values(fk_manager_id=None)
+            .execution_options(synchronize_session=False)
+        )
@@ -0,0 +1,235 @@
+# common/employee_import.py
+import csv
+import io
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+from pydantic import ValidationError
+from sqlalchemy import insert, literal, select
+from sqlalchemy.orm import Session
+from database.common import IMPORT_BCRYPT_ROUNDS, hash_password
+from database.models import Employee, EmployeeHierarchy, WorkLocation
+from schema.employee_schema import EmployeeCreate
+from common.common import _require_admin
+from common.department import department_cache
+from common.export import ExportFormat
+from common.role import role_cache
+from routers.auth import HASH_WORKERS
+
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_MAX_ERRORS = 1000
+
+# Columns that may name a reference row instead of giving its id
+_REFERENCES = (
+    ("department", "fk_department_id", department_cache),
+    ("role", "fk_role_id", role_cache),
+)
+
+
+class _Report:
+    def __init__(self):
+        self.total = 0
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+
+    def fail(self, row: int, email: Optional[str], errors: List[str]):
+        self.failed += 1
+        if len(self.errors) < IMPORT_MAX_ERRORS:
+            self.errors.append({"row": row, "email": email, "errors": errors})
+
+
+def import_employees(
+    db: Session, file: BinaryIO, fmt: ExportFormat, user: dict, dry_run: bool = False
+) -> dict:
+    """Create employees from a CSV or NDJSON upload, one chunk at a time.
+
+    Rows take the ``EmployeeCreate`` fields. ``department`` and ``role`` may
+    name a department/role instead of giving its id, and ``manager_email``
+    may name a manager already on file or earlier in the upload. Bad rows
+    are reported and skipped; the rest are committed together, or rolled
+    back when ``dry_run`` is set. Only the current ``IMPORT_CHUNK_SIZE`` rows
+    are held in memory.
+    """
+    _require_admin(user)
+    start = time.perf_counter()
+    report = _Report()
+    rows = _read_rows(file, fmt)
+    location_ids = set(db.scalars(select(WorkLocation.location_id)))
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as hasher:
+        while chunk := list(islice(rows, IMPORT_CHUNK_SIZE)):
+            report.total += len(chunk)
+            _import_chunk(db, chunk, report, hasher, location_ids)
+
+    if dry_run:
+        db.rollback()
+    else:
+        db.commit()
+    elapsed = time.perf_counter() - start
+    return {
+        "total_rows": report.total,
+        "created": report.created,
+        "failed": report.failed,
+        "errors": report.errors,
+        "errors_truncated": report.failed > len(report.errors),
+        "dry_run": dry_run,
+        "duration_ms": round(elapsed * 1000, 2),
+        "rows_per_second": round(report.created / elapsed, 1),
+    }
+
+
+# === Helper Functions ===
+def _read_rows(file: BinaryIO, fmt: ExportFormat) -> Iterator[Tuple[int, object]]:
+    """Yield ``(line number, raw row)`` pairs without reading the whole file."""
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    if fmt == ExportFormat.csv:
+        reader = csv.DictReader(text)
+        for row in reader:
+            # Empty cells mean "not given", so optional fields keep defaults
+            yield reader.line_num, {k: v for k, v in row.items() if k and v}
+        return
+    for line_no, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError:
+            yield line_no, None
+
+
+def _import_chunk(
+    db: Session, chunk: list, report: _Report, hasher, location_ids: Set[int]
+):
+    candidates = []
+    for line_no, raw in chunk:
+        if not isinstance(raw, dict):
+            report.fail(line_no, None, ["Row is not a JSON object"])
+            continue
+        parsed, errors = _parse_row(db, raw, location_ids)
+        if errors:
+            report.fail(line_no, raw.get("email"), errors)
+        else:
+            candidates.append((line_no, *parsed))
+
+    # One IN query per chunk covers both the file and earlier chunks
+    emails = [employee.email for _, employee, _ in candidates]
+    taken = set(db.scalars(select(Employee.email).where(Employee.email.in_(emails))))
+    manager_ids = {
+        e.fk_manager_id for _, e, m in candidates if e.fk_manager_id and not m
+    }
+    known_managers = set(
+        db.scalars(
+            select(Employee.employee_id).where(Employee.employee_id.in_(manager_ids))
+        )
+    )
+    pending = []
+    for line_no, employee, manager_email in candidates:
+        if employee.email in taken:
+            report.fail(line_no, employee.email, ["email: already exists"])
+        elif (
+            employee.fk_manager_id
+            and not manager_email
+            and employee.fk_manager_id not in known_managers
+        ):
+            report.fail(line_no, employee.email, ["fk_manager_id: unknown employee"])
+        else:
+            taken.add(employee.email)
+            pending.append((line_no, employee, manager_email))
+
+    # Managers may appear earlier in the same chunk, so insert in waves
+    while pending:
+        wanted = {m for _, _, m in pending if m}
+        manager_by_email = dict(
+            db.execute(
+                select(Employee.email, Employee.employee_id).where(
+                    Employee.email.in_(wanted)
+                )
+            ).all()
+        )
+        ready = [p for p in pending if not p[2] or p[2] in manager_by_email]
+        if not ready:
+            for line_no, employee, manager_email in pending:
+                report.fail(
+                    line_no,
+                    employee.email,
+                    [f"manager_email: no employee '{manager_email}'"],
+                )
+            return
+        _insert_wave(db, ready, manager_by_email, hasher)
+        report.created += len(ready)
+        pending = [p for p in pending if p[2] and p[2] not in manager_by_email]
+
+
+def _parse_row(db: Session, raw: dict, location_ids: Set[int]):
+    values = dict(raw)
+    errors, unresolved = [], set()
+    for name_field, id_field, cache in _REFERENCES:
+        name = values.pop(name_field, None)
+        if name is not None:
+            found = cache.by_name(db, str(name))
+            if found is None:
+                errors.append(f"{name_field}: unknown '{name}'")
+                unresolved.add(id_field)
+                continue
+            values[id_field] = getattr(found, cache.id_column.key)
+        elif str(values.get(id_field, "")).isdigit():
+            if cache.by_id(db, int(values[id_field])) is None:
+                errors.append(f"{id_field}: unknown id {values[id_field]}")
+    location_id = str(values.get("fk_location_id", ""))
+    if location_id.isdigit() and int(location_id) not in location_ids:
+        errors.append(f"fk_location_id: unknown id {location_id}")
+    manager_email = values.pop("manager_email", None)
+
+    try:
+        employee = EmployeeCreate.model_validate(values)
+    except ValidationError as exc:
+        errors.extend(
+            f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}"
+            for e in exc.errors()
+            # Already reported against the name that failed to resolve
+            if e["loc"][0] not in unresolved
+        )
+        return None, errors
+    return (employee, manager_email), errors
+
+
+def _insert_wave(db: Session, ready: list, manager_by_email: Dict[str, int], hasher):
+    passwords = hasher.map(
+        lambda employee: hash_password(employee.password, IMPORT_BCRYPT_ROUNDS),
+        [employee for _, employee, _ in ready],
+    )
+    rows = []
+    for (_, employee, manager_email), password in zip(ready, passwords):
+        values = employee.model_dump()
+        values["password"] = password
+        if manager_email:
+            values["fk_manager_id"] = manager_by_email[manager_email]
+        rows.append(values)
+    db.execute(insert(Employee), rows)
+
+    new_ids = list(
+        db.scalars(
+            select(Employee.employee_id).where(
+                Employee.email.in_([row["email"] for row in rows])
+            )
+        )
+    )
+    db.execute(
+        insert(EmployeeHierarchy),
+        [{"ancestor_id": i, "descendant_id": i, "depth": 0} for i in new_ids],
+    )
+    # Managers are already in the tree: earlier waves, chunks or existing rows
+    db.execute(
+        insert(EmployeeHierarchy).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(
+                EmployeeHierarchy.ancestor_id,
+                Employee.employee_id,
+                EmployeeHierarchy.depth + literal(1),
+            )
+            .join(Employee, Employee.fk_manager_id == EmployeeHierarchy.descendant_id)
+            .where(Employee.employee_id.in_(new_ids)),
+        )
+    )
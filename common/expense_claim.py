@@ -3,13 +3,17 @@ from sqlalchemy.orm import Session
 from database.models import ExpenseClaim, Employee
 from schema.expense_claim_schema import (
     ExpenseClaimCreate,
+    ExpenseClaimResponse,
+    ExpenseClaimBulkStatusUpdate,
     ExpenseClaimStatusUpdate,
     Status,
 )
 from fastapi import HTTPException, status
 from datetime import datetime, timezone
 from typing import List
-from sqlalchemy import extract
+from common.common import _bulk_update_status, _in_month
+from common.pagination import PageParams, paginate
+from common.export import ExportFormat, stream_export
 
 
 def _get_claim_or_404(db: Session, claim_id: int) -> ExpenseClaim:
@@ -52,17 +56,13 @@ def delete_expense_claim(db: Session, claim_id: int, user: dict) -> None:
 
 
 def get_my_claims_by_status(
-    db: Session, status: Status, user: dict
+    db: Session, status: Status, user: dict, page: PageParams
 ) -> List[ExpenseClaim]:
-    return (
-        db.query(ExpenseClaim)
-        .filter(
-            ExpenseClaim.fk_employee_id == user["id"],
-            ExpenseClaim.claim_status == status,
-        )
-        .order_by(ExpenseClaim.claim_date.desc())
-        .all()
+    query = db.query(ExpenseClaim).filter(
+        ExpenseClaim.fk_employee_id == user["id"],
+        ExpenseClaim.claim_status == status,
     )
+    return paginate(query, page, ExpenseClaim.claim_date.desc(), ExpenseClaim.claim_id)
 
 
 def get_my_claim_by_id(db: Session, claim_id: int, user: dict) -> ExpenseClaim:
@@ -73,18 +73,13 @@ def get_my_claim_by_id(db: Session, claim_id: int, user: dict) -> ExpenseClaim:
 
 
 def get_my_claims_by_month(
-    db: Session, year: int, month: int, user: dict
+    db: Session, year: int, month: int, user: dict, page: PageParams
 ) -> List[ExpenseClaim]:
-    return (
-        db.query(ExpenseClaim)
-        .filter(
-            ExpenseClaim.fk_employee_id == user["id"],
-            extract("year", ExpenseClaim.claim_date) == year,
-            extract("month", ExpenseClaim.claim_date) == month,
-        )
-        .order_by(ExpenseClaim.claim_date.desc())
-        .all()
+    query = db.query(ExpenseClaim).filter(
+        ExpenseClaim.fk_employee_id == user["id"],
+        _in_month(ExpenseClaim.claim_date, year, month),
     )
+    return paginate(query, page, ExpenseClaim.claim_date.desc(), ExpenseClaim.claim_id)
 
 
 # ADMIN
@@ -92,53 +87,60 @@ def get_claim_by_id_admin(db: Session, claim_id: int) -> ExpenseClaim:
     return _get_claim_or_404(db, claim_id)
 
 
-def get_all_claims_by_employee_admin(db: Session, emp_id: int) -> List[ExpenseClaim]:
-    claims = (
-        db.query(ExpenseClaim)
-        .filter(ExpenseClaim.fk_employee_id == emp_id)
-        .order_by(ExpenseClaim.claim_date.desc())
-        .all()
+def get_all_claims_by_employee_admin(
+    db: Session, emp_id: int, page: PageParams
+) -> List[ExpenseClaim]:
+    query = db.query(ExpenseClaim).filter(ExpenseClaim.fk_employee_id == emp_id)
+    claims = paginate(
+        query, page, ExpenseClaim.claim_date.desc(), ExpenseClaim.claim_id
     )
     if not claims:
         raise HTTPException(status_code=404, detail="No claims found")
     return claims
 
 
-def get_claims_by_status_admin(db: Session, status: Status) -> List[ExpenseClaim]:
-    claims = db.query(ExpenseClaim).filter(ExpenseClaim.claim_status == status).all()
+def get_claims_by_status_admin(
+    db: Session, status: Status, page: PageParams
+) -> List[ExpenseClaim]:
+    query = db.query(ExpenseClaim).filter(ExpenseClaim.claim_status == status)
+    claims = paginate(query, page, ExpenseClaim.claim_id)
     if not claims:
         raise HTTPException(status_code=404, detail=f"No {status.value} claims")
     return claims
 
 
-def get_claims_by_month_admin(db: Session, year: int, month: int) -> List[ExpenseClaim]:
-    claims = (
-        db.query(ExpenseClaim)
-        .filter(
-            extract("year", ExpenseClaim.claim_date) == year,
-            extract("month", ExpenseClaim.claim_date) == month,
-        )
-        .all()
+def get_claims_by_month_admin(
+    db: Session, year: int, month: int, page: PageParams
+) -> List[ExpenseClaim]:
+    query = db.query(ExpenseClaim).filter(
+        _in_month(ExpenseClaim.claim_date, year, month)
     )
+    claims = paginate(query, page, ExpenseClaim.claim_id)
     if not claims:
         raise HTTPException(status_code=404, detail="No claims in this month")
     return claims
 
 
+def export_claims_by_month_admin(db: Session, year: int, month: int, fmt: ExportFormat):
+    query = (
+        db.query(ExpenseClaim)
+        .filter(_in_month(ExpenseClaim.claim_date, year, month))
+        .order_by(ExpenseClaim.claim_id)
+    )
+    return stream_export(
+        query, ExpenseClaimResponse, fmt, f"expense-claims-{year}-{month:02d}"
+    )
+
+
 def get_claims_by_employee_and_month_any(
-    db: Session, emp_id: int, year: int, month: int
+    db: Session, emp_id: int, year: int, month: int, page: PageParams
 ) -> List[ExpenseClaim]:
-    from sqlalchemy import extract
-
-    claims = (
-        db.query(ExpenseClaim)
-        .filter(
-            ExpenseClaim.fk_employee_id == emp_id,
-            extract("year", ExpenseClaim.claim_date) == year,
-            extract("month", ExpenseClaim.claim_date) == month,
-        )
-        .order_by(ExpenseClaim.claim_date.desc())
-        .all()
+    query = db.query(ExpenseClaim).filter(
+        ExpenseClaim.fk_employee_id == emp_id,
+        _in_month(ExpenseClaim.claim_date, year, month),
+    )
+    claims = paginate(
+        query, page, ExpenseClaim.claim_date.desc(), ExpenseClaim.claim_id
     )
     if not claims:
         raise HTTPException(
@@ -171,50 +173,36 @@ def get_manager_claim_by_id(db: Session, claim_id: int, user: dict) -> ExpenseCl
 
 
 def get_manager_claims_by_status(
-    db: Session, status: Status, user: dict
+    db: Session, status: Status, user: dict, page: PageParams
 ) -> List[ExpenseClaim]:
-    return (
-        db.query(ExpenseClaim)
-        .filter(
-            ExpenseClaim.fk_manager_id == user["id"],
-            ExpenseClaim.claim_status == status,
-        )
-        .order_by(ExpenseClaim.claim_date.desc())
-        .all()
+    query = db.query(ExpenseClaim).filter(
+        ExpenseClaim.fk_manager_id == user["id"],
+        ExpenseClaim.claim_status == status,
     )
+    return paginate(query, page, ExpenseClaim.claim_date.desc(), ExpenseClaim.claim_id)
 
 
 def get_manager_claims_by_month(
-    db: Session, year: int, month: int, user: dict
+    db: Session, year: int, month: int, user: dict, page: PageParams
 ) -> List[ExpenseClaim]:
-    return (
-        db.query(ExpenseClaim)
-        .filter(
-            ExpenseClaim.fk_manager_id == user["id"],
-            extract("year", ExpenseClaim.claim_date) == year,
-            extract("month", ExpenseClaim.claim_date) == month,
-        )
-        .order_by(ExpenseClaim.claim_date.desc())
-        .all()
+    query = db.query(ExpenseClaim).filter(
+        ExpenseClaim.fk_manager_id == user["id"],
+        _in_month(ExpenseClaim.claim_date, year, month),
     )
+    return paginate(query, page, ExpenseClaim.claim_date.desc(), ExpenseClaim.claim_id)
 
 
 def get_manager_claims_by_employee_and_month(
-    db: Session, emp_id: int, year: int, month: int, user: dict
+    db: Session, emp_id: int, year: int, month: int, user: dict, page: PageParams
 ) -> List[ExpenseClaim]:
     from common.employee import get_subordinate_by_id
 
     get_subordinate_by_id(employee_id=emp_id, db=db, user=user)
-    return (
-        db.query(ExpenseClaim)
-        .filter(
-            ExpenseClaim.fk_employee_id == emp_id,
-            extract("year", ExpenseClaim.claim_date) == year,
-            extract("month", ExpenseClaim.claim_date) == month,
-        )
-        .order_by(ExpenseClaim.claim_date.desc())
-        .all()
+    query = db.query(ExpenseClaim).filter(
+        ExpenseClaim.fk_employee_id == emp_id,
+        _in_month(ExpenseClaim.claim_date, year, month),
     )
+    return paginate(query, page, ExpenseClaim.claim_date.desc(), ExpenseClaim.claim_id)
 
 
 def manager_update_status(
@@ -226,3 +214,16 @@ def manager_update_status(
     db.commit()
     db.refresh(claim)
     return claim
+
+
+def manager_bulk_update_status(
+    db: Session, update: ExpenseClaimBulkStatusUpdate, user: dict
+) -> List[dict]:
+    return _bulk_update_status(
+        db,
+        ExpenseClaim.claim_id,
+        ExpenseClaim.claim_status,
+        update.ids,
+        update.claim_status,
+        user["id"],
+    )
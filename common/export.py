@@ -0,0 +1,70 @@
+# common/export.py
+import csv
+import io
+import json
+from enum import Enum
+from typing import Iterable, Iterator, Type
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+EXPORT_BATCH_SIZE = 1000
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+_MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+}
+
+
+def _ndjson_chunks(rows: Iterable, schema: Type[BaseModel]) -> Iterator[str]:
+    buffer = []
+    for row in rows:
+        buffer.append(json.dumps(schema.model_validate(row).model_dump(mode="json")))
+        if len(buffer) >= EXPORT_BATCH_SIZE:
+            yield "\n".join(buffer) + "\n"
+            buffer = []
+    if buffer:
+        yield "\n".join(buffer) + "\n"
+
+
+def _csv_chunks(rows: Iterable, schema: Type[BaseModel]) -> Iterator[str]:
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(schema.model_fields))
+    writer.writeheader()
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(schema.model_validate(row).model_dump(mode="json"))
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+    yield out.getvalue()
+
+
+def stream_export(
+    query, schema: Type[BaseModel], fmt: ExportFormat, filename: str
+) -> StreamingResponse:
+    """Stream ``query`` as NDJSON or CSV without materialising the result.
+
+    Rows are fetched from a server-side cursor in batches of
+    ``EXPORT_BATCH_SIZE`` and written out as soon as each batch arrives.
+    """
+    return stream_rows(query.yield_per(EXPORT_BATCH_SIZE), schema, fmt, filename)
+
+
+def stream_rows(
+    rows: Iterable, schema: Type[BaseModel], fmt: ExportFormat, filename: str
+) -> StreamingResponse:
+    """Stream rows from any iterable, e.g. a generator computing them on the fly."""
+    chunks = _csv_chunks if fmt == ExportFormat.csv else _ndjson_chunks
+    return StreamingResponse(
+        chunks(rows, schema),
+        media_type=_MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{fmt.value}"'
+        },
+    )
@@ -0,0 +1,111 @@
+# common/health.py
+import asyncio
+import os
+import time
+from typing import Dict, Optional, Tuple, Union
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from common.metrics import pool_state
+
+# Readiness results are reused for this long, so probes add no load
+HEALTH_CACHE_TTL = float(os.getenv("HEALTH_CACHE_TTL", 2))
+# A SELECT 1 slower than this (waiting for a pooled connection included) fails
+HEALTH_DB_TIMEOUT = float(os.getenv("HEALTH_DB_TIMEOUT", 2))
+HEALTH_MAX_LOOP_LAG_MS = float(os.getenv("HEALTH_MAX_LOOP_LAG_MS", 250))
+
+
+class ReadinessProbe:
+    """Whether this worker can serve requests, checked at most every ``ttl`` seconds.
+
+    Each check runs a timed ``SELECT 1`` on every engine and measures how
+    long the event loop takes to get back to a task that yielded. Probes
+    arriving while a check runs wait for it rather than starting another.
+    """
+
+    def __init__(
+        self,
+        engines: Dict[str, Union[Engine, AsyncEngine]],
+        ttl: float = HEALTH_CACHE_TTL,
+        db_timeout: float = HEALTH_DB_TIMEOUT,
+        max_loop_lag_ms: float = HEALTH_MAX_LOOP_LAG_MS,
+    ):
+        self.engines = engines
+        self.ttl = ttl
+        self.db_timeout = db_timeout
+        self.max_loop_lag_ms = max_loop_lag_ms
+        self._result: Optional[Tuple[bool, dict]] = None
+        self._started_at = self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def check(self) -> Tuple[bool, dict]:
+        """``(ready, report)``; ``report`` matches ``ReadinessResponse``."""
+        requested = time.monotonic()
+        if self._result is None or requested >= self._expires_at:
+            async with self._lock:
+                # A check that started after this probe arrived is fresh enough
+                if self._result is None or self._started_at < requested:
+                    self._started_at = time.monotonic()
+                    self._result = await self._run()
+                    self._expires_at = time.monotonic() + self.ttl
+                    return self._result[0], {**self._result[1], "cached": False}
+        return self._result[0], {**self._result[1], "cached": True}
+
+    # === Helper Functions ===
+    async def _run(self) -> Tuple[bool, dict]:
+        lag_ms = await _loop_lag_ms()
+        checks = await asyncio.gather(
+            *(self._check_engine(engine) for engine in self.engines.values())
+        )
+        databases = dict(zip(self.engines, checks))
+        event_loop = {"ok": lag_ms <= self.max_loop_lag_ms, "lag_ms": round(lag_ms, 2)}
+        ready = event_loop["ok"] and all(check["ok"] for check in checks)
+        return ready, {
+            "status": "ready" if ready else "unavailable",
+            "event_loop": event_loop,
+            "databases": databases,
+        }
+
+    async def _check_engine(self, engine: Union[Engine, AsyncEngine]) -> dict:
+        start, error = time.perf_counter(), None
+        try:
+            if isinstance(engine, AsyncEngine):
+                await asyncio.wait_for(_select_one_async(engine), self.db_timeout)
+            else:
+                # An executor future, unlike run_in_threadpool, stops waiting
+                # on timeout; the thread finishes the checkout on its own
+                future = asyncio.get_running_loop().run_in_executor(
+                    None, _select_one, engine
+                )
+                await asyncio.wait_for(future, self.db_timeout)
+        except asyncio.TimeoutError:
+            error = f"SELECT 1 took longer than {self.db_timeout:g}s"
+        except Exception as exc:
+            # The class only: driver messages can name hosts and users
+            error = type(exc).__name__
+        pool = getattr(engine, "sync_engine", engine).pool
+        return {
+            "ok": error is None,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+            "error": error,
+            **(pool_state(pool) or {}),
+        }
+
+
+def _select_one(engine: Engine) -> None:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+async def _select_one_async(engine: AsyncEngine) -> None:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _loop_lag_ms() -> float:
+    """Time for the loop to come back to a task that yields once: the work
+    queued ahead of it, which is how long any request waits to be picked up."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await asyncio.sleep(0)
+    return (loop.time() - start) * 1000
@@ -4,6 +4,10 @@ from database.models import Leave, Employee
 from schema.leave_schema import LeaveCreate
 from typing import List
 from fastapi import HTTPException, status
+from common.pagination import PageParams, paginate
+from common.conditional import bump_version
+
+LEAVE_VERSION = "leave"
 
 
 def _get_leave_or_404(db: Session, employee_id: int, year: int) -> Leave:
@@ -24,13 +28,11 @@ def get_leave_by_employee_and_year(db: Session, employee_id: int, year: int) ->
     return _get_leave_or_404(db, employee_id, year)
 
 
-def get_all_leaves_by_employee_id(db: Session, employee_id: int) -> List[Leave]:
-    leaves = (
-        db.query(Leave)
-        .filter(Leave.fk_employee_id == employee_id)
-        .order_by(Leave.assign_year)
-        .all()
-    )
+def get_all_leaves_by_employee_id(
+    db: Session, employee_id: int, page: PageParams
+) -> List[Leave]:
+    query = db.query(Leave).filter(Leave.fk_employee_id == employee_id)
+    leaves = paginate(query, page, Leave.assign_year, Leave.leave_id)
     if not leaves:
         raise HTTPException(
             status_code=404, detail=f"No leave records found for employee {employee_id}"
@@ -56,6 +58,7 @@ def create_leave(db: Session, leave_in: LeaveCreate) -> Leave:
 
     db_leave = Leave(**leave_in.model_dump())
     db.add(db_leave)
+    bump_version(db, LEAVE_VERSION, leave_in.fk_employee_id)
     db.commit()
     db.refresh(db_leave)
     return db_leave
@@ -68,10 +71,12 @@ def delete_leave(db: Session, leave_id: int) -> None:
             status_code=404, detail=f"Leave record with ID {leave_id} not found"
         )
     db.delete(leave)
+    bump_version(db, LEAVE_VERSION, leave.fk_employee_id)
     db.commit()
 
 
 def delete_leave_by_employee_and_year(db: Session, employee_id: int, year: int) -> None:
     leave = _get_leave_or_404(db, employee_id, year)
     db.delete(leave)
+    bump_version(db, LEAVE_VERSION, employee_id)
     db.commit()
@@ -1,23 +1,40 @@
 # common/leave_application.py
-from sqlalchemy.orm import Session
-from database.models import LeaveApplication, Employee
+from sqlalchemy import and_, func, literal
+from sqlalchemy.orm import Session, aliased
+from database.models import LeaveApplication, Employee, Regularization
 from schema.leave_application_schema import (
     LeaveApplicationCreate,
+    LeaveApplicationBulkStatusUpdate,
     LeaveApplicationStatusUpdate,
+    OverlapKind,
     Status,
 )
 from fastapi import HTTPException, status
-from datetime import datetime, timezone
-from typing import List
-from sqlalchemy import extract
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional
+from common.common import _bulk_update_status, _in_month
+from common.pagination import PageParams, paginate
+from common.leave_ledger import apply_status_change, apply_status_changes
+from common.work_calendar import employee_working_days
+from schema.bulk_schema import BulkOutcome
 
 
-def _get_leave_app_or_404(db: Session, app_id: int) -> LeaveApplication:
-    app = (
-        db.query(LeaveApplication)
-        .filter(LeaveApplication.leave_application_id == app_id)
-        .first()
+# Applications that hold their days: an overlapping request must be refused
+ACTIVE_STATUSES = (Status.Pending, Status.Approved)
+OVERLAP_REPORT_MAX = 1000
+
+
+def _get_leave_app_or_404(
+    db: Session, app_id: int, for_update: bool = False
+) -> LeaveApplication:
+    query = db.query(LeaveApplication).filter(
+        LeaveApplication.leave_application_id == app_id
     )
+    if for_update:
+        # Locked and re-read, so a concurrent status change is seen before
+        # the balance delta is worked out from the current status
+        query = query.with_for_update().populate_existing()
+    app = query.first()
     if not app:
         raise HTTPException(status_code=404, detail="Leave application not found")
     return app
@@ -30,14 +47,24 @@ def create_leave_application(
     if not emp or not emp.fk_manager_id:
         raise HTTPException(status_code=400, detail="No manager assigned")
 
-    total_days = (app_in.end_date.date() - app_in.from_date.date()).days + 1
+    clash = find_overlapping_leave(
+        db, user["id"], app_in.from_date.date(), app_in.end_date.date()
+    )
+    if clash:
+        _raise_overlap(clash)
+
+    total_days = employee_working_days(
+        db, emp.fk_location_id, app_in.from_date.date(), app_in.end_date.date()
+    )
+    if not total_days:
+        raise HTTPException(status_code=400, detail="Leave range has no working days")
 
     app = LeaveApplication(
         **app_in.model_dump(),
         total_days=total_days,
         fk_employee_id=user["id"],
         fk_manager_id=emp.fk_manager_id,
-        leave_status=Status.Pending
+        leave_status=Status.Pending,
     )
     db.add(app)
     db.commit()
@@ -58,16 +85,17 @@ def delete_leave_application(db: Session, app_id: int, user: dict) -> None:
 
 
 def get_my_applications_by_status(
-    db: Session, user: dict, status: Status
+    db: Session, user: dict, status: Status, page: PageParams
 ) -> List[LeaveApplication]:
-    return (
-        db.query(LeaveApplication)
-        .filter(
-            LeaveApplication.fk_employee_id == user["id"],
-            LeaveApplication.leave_status == status,
-        )
-        .order_by(LeaveApplication.from_date.desc())
-        .all()
+    query = db.query(LeaveApplication).filter(
+        LeaveApplication.fk_employee_id == user["id"],
+        LeaveApplication.leave_status == status,
+    )
+    return paginate(
+        query,
+        page,
+        LeaveApplication.from_date.desc(),
+        LeaveApplication.leave_application_id,
     )
 
 
@@ -79,17 +107,14 @@ def get_my_application_by_id(db: Session, app_id: int, user: dict) -> LeaveAppli
 
 
 def get_my_applications_by_month(
-    db: Session, year: int, month: int, user: dict
+    db: Session, year: int, month: int, user: dict, page: PageParams
 ) -> List[LeaveApplication]:
-    return (
-        db.query(LeaveApplication)
-        .filter(
-            LeaveApplication.fk_employee_id == user["id"],
-            extract("year", LeaveApplication.from_date) == year,
-            extract("month", LeaveApplication.from_date) == month,
-        )
-        .order_by(LeaveApplication.from_date)
-        .all()
+    query = db.query(LeaveApplication).filter(
+        LeaveApplication.fk_employee_id == user["id"],
+        _in_month(LeaveApplication.from_date, year, month),
+    )
+    return paginate(
+        query, page, LeaveApplication.from_date, LeaveApplication.leave_application_id
     )
 
 
@@ -98,12 +123,15 @@ def get_application_by_id_admin(db: Session, app_id: int) -> LeaveApplication:
     return _get_leave_app_or_404(db, app_id)
 
 
-def get_all_by_employee_admin(db: Session, emp_id: int) -> List[LeaveApplication]:
-    apps = (
-        db.query(LeaveApplication)
-        .filter(LeaveApplication.fk_employee_id == emp_id)
-        .order_by(LeaveApplication.from_date.desc())
-        .all()
+def get_all_by_employee_admin(
+    db: Session, emp_id: int, page: PageParams
+) -> List[LeaveApplication]:
+    query = db.query(LeaveApplication).filter(LeaveApplication.fk_employee_id == emp_id)
+    apps = paginate(
+        query,
+        page,
+        LeaveApplication.from_date.desc(),
+        LeaveApplication.leave_application_id,
     )
     if not apps:
         raise HTTPException(status_code=404, detail="No leave applications found")
@@ -111,16 +139,12 @@ def get_all_by_employee_admin(db: Session, emp_id: int) -> List[LeaveApplication
 
 
 def get_all_by_month_admin(
-    db: Session, year: int, month: int
+    db: Session, year: int, month: int, page: PageParams
 ) -> List[LeaveApplication]:
-    apps = (
-        db.query(LeaveApplication)
-        .filter(
-            extract("year", LeaveApplication.from_date) == year,
-            extract("month", LeaveApplication.from_date) == month,
-        )
-        .all()
+    query = db.query(LeaveApplication).filter(
+        _in_month(LeaveApplication.from_date, year, month)
     )
+    apps = paginate(query, page, LeaveApplication.leave_application_id)
     if not apps:
         raise HTTPException(status_code=404, detail="No applications in this month")
     return apps
@@ -129,8 +153,8 @@ def get_all_by_month_admin(
 def admin_update_status(
     db: Session, app_id: int, update: LeaveApplicationStatusUpdate
 ) -> LeaveApplication:
-    app = _get_leave_app_or_404(db, app_id)
-    app.leave_status = update.leave_status
+    app = _get_leave_app_or_404(db, app_id, for_update=True)
+    apply_status_change(db, app, update.leave_status)
     app.updated_at = datetime.now(timezone.utc)
     db.commit()
     db.refresh(app)
@@ -139,9 +163,9 @@ def admin_update_status(
 
 # Manager
 def get_manager_application_by_id(
-    db: Session, app_id: int, user: dict
+    db: Session, app_id: int, user: dict, for_update: bool = False
 ) -> LeaveApplication:
-    app = _get_leave_app_or_404(db, app_id)
+    app = _get_leave_app_or_404(db, app_id, for_update)
     if app.fk_manager_id != user["id"]:
         raise HTTPException(
             status_code=403, detail="Leave Application not found under your management"
@@ -150,53 +174,174 @@ def get_manager_application_by_id(
 
 
 def get_manager_applications_by_status(
-    db: Session, status: Status, user: dict
+    db: Session, status: Status, user: dict, page: PageParams
 ) -> List[LeaveApplication]:
-    return (
-        db.query(LeaveApplication)
-        .filter(
-            LeaveApplication.fk_manager_id == user["id"],
-            LeaveApplication.leave_status == status,
-        )
-        .order_by(LeaveApplication.from_date)
-        .all()
+    query = db.query(LeaveApplication).filter(
+        LeaveApplication.fk_manager_id == user["id"],
+        LeaveApplication.leave_status == status,
+    )
+    return paginate(
+        query, page, LeaveApplication.from_date, LeaveApplication.leave_application_id
     )
 
 
 def get_manager_applications_by_month(
-    db: Session, year: int, month: int, user: dict
+    db: Session, year: int, month: int, user: dict, page: PageParams
 ) -> List[LeaveApplication]:
-    return (
-        db.query(LeaveApplication)
-        .filter(
-            LeaveApplication.fk_manager_id == user["id"],
-            extract("year", LeaveApplication.from_date) == year,
-            extract("month", LeaveApplication.from_date) == month,
-        )
-        .all()
+    query = db.query(LeaveApplication).filter(
+        LeaveApplication.fk_manager_id == user["id"],
+        _in_month(LeaveApplication.from_date, year, month),
     )
+    return paginate(query, page, LeaveApplication.leave_application_id)
 
 
 def get_manager_applications_by_employee(
-    db: Session, emp_id: int, user: dict
+    db: Session, emp_id: int, user: dict, page: PageParams
 ) -> List[LeaveApplication]:
     from common.employee import get_subordinate_by_id
 
     get_subordinate_by_id(employee_id=emp_id, db=db, user=user)
-    return (
-        db.query(LeaveApplication)
-        .filter(LeaveApplication.fk_employee_id == emp_id)
-        .order_by(LeaveApplication.from_date.desc())
-        .all()
+    query = db.query(LeaveApplication).filter(LeaveApplication.fk_employee_id == emp_id)
+    return paginate(
+        query,
+        page,
+        LeaveApplication.from_date.desc(),
+        LeaveApplication.leave_application_id,
     )
 
 
 def manager_update_status(
     db: Session, app_id: int, update: LeaveApplicationStatusUpdate, user: dict
 ) -> LeaveApplication:
-    app = get_manager_application_by_id(db, app_id, user)
-    app.leave_status = update.leave_status
+    app = get_manager_application_by_id(db, app_id, user, for_update=True)
+    apply_status_change(db, app, update.leave_status)
     app.updated_at = datetime.now(timezone.utc)
     db.commit()
     db.refresh(app)
     return app
+
+
+def manager_bulk_update_status(
+    db: Session, update: LeaveApplicationBulkStatusUpdate, user: dict
+) -> List[dict]:
+    return _bulk_update_status(
+        db,
+        LeaveApplication.leave_application_id,
+        LeaveApplication.leave_status,
+        update.ids,
+        update.leave_status,
+        user["id"],
+        check=lambda db, ids: _debit_or_credit(db, ids, update.leave_status),
+    )
+
+
+def _debit_or_credit(db: Session, app_ids: List[int], new_status: Status) -> dict:
+    apps = (
+        db.query(LeaveApplication)
+        .filter(LeaveApplication.leave_application_id.in_(app_ids))
+        .order_by(LeaveApplication.leave_application_id)
+        .with_for_update()
+        .all()
+    )
+    overdrawn = apply_status_changes(db, apps, new_status)
+    return {app_id: BulkOutcome.insufficient_balance for app_id in overdrawn}
+
+
+# Overlaps
+def find_overlapping_leave(
+    db: Session,
+    employee_id: int,
+    start: date,
+    end: date,
+    statuses=ACTIVE_STATUSES,
+) -> Optional[LeaveApplication]:
+    """The employee's first application in ``statuses`` covering any day from
+    ``start`` to ``end``, found with one range scan of the
+    ``(fk_employee_id, from_date, end_date)`` index."""
+    return (
+        db.query(LeaveApplication)
+        .filter(
+            LeaveApplication.fk_employee_id == employee_id,
+            LeaveApplication.from_date
+            < datetime.combine(end + timedelta(days=1), time.min),
+            LeaveApplication.end_date >= datetime.combine(start, time.min),
+            LeaveApplication.leave_status.in_(statuses),
+        )
+        .order_by(LeaveApplication.from_date, LeaveApplication.leave_application_id)
+        .first()
+    )
+
+
+def get_overlap_report(db: Session) -> dict:
+    """Every overlapping pair in the company, from one UNION ALL statement.
+
+    Pending/Approved applications are paired with each other, and Approved
+    applications with the employee's Pending/Approved regularizations;
+    overlap is on calendar days, as leave is counted.
+    """
+    first, second = aliased(LeaveApplication), aliased(LeaveApplication)
+    leave_pairs = (
+        db.query(
+            literal(OverlapKind.leave_application.value).label("kind"),
+            first.fk_employee_id.label("fk_employee_id"),
+            first.leave_application_id.label("leave_application_id"),
+            second.leave_application_id.label("other_id"),
+        )
+        .join(
+            second,
+            and_(
+                second.fk_employee_id == first.fk_employee_id,
+                second.leave_application_id > first.leave_application_id,
+                func.date(second.from_date) <= func.date(first.end_date),
+                func.date(second.end_date) >= func.date(first.from_date),
+                second.leave_status.in_(ACTIVE_STATUSES),
+            ),
+        )
+        .filter(first.leave_status.in_(ACTIVE_STATUSES))
+    )
+    regularization_pairs = (
+        db.query(
+            literal(OverlapKind.regularization.value),
+            LeaveApplication.fk_employee_id,
+            LeaveApplication.leave_application_id,
+            Regularization.regularization_id,
+        )
+        .join(
+            Regularization,
+            and_(
+                Regularization.fk_employee_id == LeaveApplication.fk_employee_id,
+                func.date(Regularization.regularization_start_time)
+                <= func.date(LeaveApplication.end_date),
+                func.date(Regularization.regularization_end_time)
+                >= func.date(LeaveApplication.from_date),
+                Regularization.regularization_status.in_(ACTIVE_STATUSES),
+            ),
+        )
+        .filter(LeaveApplication.leave_status == Status.Approved)
+    )
+    pairs = leave_pairs.union_all(regularization_pairs).subquery()
+    rows = (
+        db.query(pairs)
+        .order_by(
+            pairs.c.fk_employee_id,
+            pairs.c.leave_application_id,
+            pairs.c.kind,
+            pairs.c.other_id,
+        )
+        .limit(OVERLAP_REPORT_MAX + 1)
+        .all()
+    )
+    return {
+        "overlaps": [row._asdict() for row in rows[:OVERLAP_REPORT_MAX]],
+        "truncated": len(rows) > OVERLAP_REPORT_MAX,
+    }
+
+
+def _raise_overlap(clash: LeaveApplication):
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=(
+            f"Overlaps leave application {clash.leave_application_id} "
+            f"({clash.from_date:%Y-%m-%d} to {clash.end_date:%Y-%m-%d})"
+        ),
+    )
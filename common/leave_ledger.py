@@ -0,0 +1,239 @@
+# common/leave_ledger.py
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+from fastapi import HTTPException, status
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import Session
+from database.models import (
+    Leave,
+    LeaveApplication,
+    LeaveLedgerEntry,
+    LedgerReason,
+    Status,
+)
+from common.conditional import bump_versions
+from common.leave import LEAVE_VERSION
+
+RECONCILE_BATCH_SIZE = 1000
+RECONCILE_MAX_REPORTED = 1000
+
+
+# === STATUS CHANGES ===
+def apply_status_change(
+    db: Session, app: LeaveApplication, new_status: Status
+) -> LeaveApplication:
+    """Move one application to ``new_status``, debiting or crediting its balance."""
+    if apply_status_changes(db, [app], new_status):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Insufficient leave balance for {app.from_date.year}",
+        )
+    app.leave_status = new_status
+    return app
+
+
+def apply_status_changes(
+    db: Session, apps: List[LeaveApplication], new_status: Status
+) -> Set[int]:
+    """Write the balance deltas for moving ``apps`` to ``new_status``.
+
+    Entering Approved debits ``total_days`` from the ``Leave`` row of the
+    year the leave starts in; leaving Approved (a rejection or a revoked
+    approval) credits it back. The affected rows are read ``FOR UPDATE``
+    in one query, so concurrent approvals for the same employee queue up
+    instead of both spending the same days. Returns the ids that would
+    overdraw (or have no allocation to debit); their balances are left
+    alone and the caller must not change their status. Does not commit.
+    """
+    moves = [(app, _delta(app, new_status)) for app in apps]
+    moves = [(app, delta) for app, delta in moves if delta]
+    if not moves:
+        return set()
+
+    employee_ids = {app.fk_employee_id for app, _ in moves}
+    years = {app.from_date.year for app, _ in moves}
+    leaves = {
+        (leave.fk_employee_id, leave.assign_year): leave
+        for leave in db.query(Leave)
+        .filter(Leave.fk_employee_id.in_(employee_ids), Leave.assign_year.in_(years))
+        .order_by(Leave.leave_id)
+        .with_for_update()
+    }
+
+    overdrawn, touched, now = set(), set(), datetime.now(timezone.utc)
+    for app, delta in moves:
+        leave = leaves.get((app.fk_employee_id, app.from_date.year))
+        if leave is None:
+            # Nothing to restore once an allocation is gone; nothing to spend yet
+            if delta < 0:
+                overdrawn.add(app.leave_application_id)
+            continue
+        if leave.balance_leave + delta < 0:
+            overdrawn.add(app.leave_application_id)
+            continue
+        leave.balance_leave += delta
+        db.add(
+            LeaveLedgerEntry(
+                employee_id=leave.fk_employee_id,
+                assign_year=leave.assign_year,
+                leave_application_id=app.leave_application_id,
+                delta=delta,
+                reason=LedgerReason.Approval if delta < 0 else LedgerReason.Reversal,
+                created_at=now,
+            )
+        )
+        touched.add(leave.fk_employee_id)
+    bump_versions(db, LEAVE_VERSION, sorted(touched))
+    return overdrawn
+
+
+def adjust_balances(db: Session, deltas: Dict[tuple, int], reason: LedgerReason):
+    """Add ``deltas[(employee_id, year)]`` to each balance, with a ledger entry.
+
+    For corrections such as recounted leave days: no overdraw check, and
+    rows with no ``Leave`` allocation are skipped. Does not commit.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    leaves = (
+        db.query(Leave)
+        .filter(
+            Leave.fk_employee_id.in_({employee_id for employee_id, _ in deltas}),
+            Leave.assign_year.in_({year for _, year in deltas}),
+        )
+        .order_by(Leave.leave_id)
+        .with_for_update()
+    )
+    touched, now = set(), datetime.now(timezone.utc)
+    for leave in leaves:
+        delta = deltas.get((leave.fk_employee_id, leave.assign_year))
+        if not delta:
+            continue
+        leave.balance_leave += delta
+        db.add(
+            LeaveLedgerEntry(
+                employee_id=leave.fk_employee_id,
+                assign_year=leave.assign_year,
+                delta=delta,
+                reason=reason,
+                created_at=now,
+            )
+        )
+        touched.add(leave.fk_employee_id)
+    bump_versions(db, LEAVE_VERSION, sorted(touched))
+
+
+# === RECONCILIATION ===
+def reconcile_leave_balances(
+    db: Session, year: Optional[int] = None, fix: bool = False
+) -> dict:
+    """Recompute every balance from approved applications and report drift.
+
+    The expected balance is ``total_leave`` less the days of the year's
+    Approved applications, summed in one grouped query. With ``fix`` the
+    drifted rows are corrected in batches and each correction is written
+    to the ledger as a Reconciliation entry, all in one commit.
+    """
+    start = time.perf_counter()
+    used = _approved_days(db, year)
+    leaves = db.query(
+        Leave.leave_id,
+        Leave.fk_employee_id,
+        Leave.assign_year,
+        Leave.total_leave,
+        Leave.balance_leave,
+    ).order_by(Leave.leave_id)
+    if year is not None:
+        leaves = leaves.filter(Leave.assign_year == year)
+
+    checked, drifted = 0, []
+    for leave_id, employee_id, assign_year, total, balance in leaves.yield_per(
+        RECONCILE_BATCH_SIZE
+    ):
+        checked += 1
+        expected = (total or 0) - used.get((employee_id, assign_year), 0)
+        if balance != expected:
+            drifted.append(
+                {
+                    "leave_id": leave_id,
+                    "fk_employee_id": employee_id,
+                    "assign_year": assign_year,
+                    "balance_leave": balance,
+                    "expected_balance": expected,
+                    "drift": (balance or 0) - expected,
+                }
+            )
+
+    if fix and drifted:
+        _apply_corrections(db, drifted)
+    db.commit()
+    return {
+        "year": year,
+        "checked": checked,
+        "drifted": len(drifted),
+        "fixed": fix,
+        "drift": drifted[:RECONCILE_MAX_REPORTED],
+        "drift_truncated": len(drifted) > RECONCILE_MAX_REPORTED,
+        "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+    }
+
+
+# === Helper Functions ===
+def _delta(app: LeaveApplication, new_status: Status) -> int:
+    was_approved = app.leave_status == Status.Approved
+    if was_approved == (new_status == Status.Approved):
+        return 0
+    days = app.total_days or 0
+    return days if was_approved else -days
+
+
+def _approved_days(db: Session, year: Optional[int]) -> Dict[tuple, int]:
+    app_year = func.extract("year", LeaveApplication.from_date)
+    query = db.query(
+        LeaveApplication.fk_employee_id,
+        app_year,
+        func.sum(LeaveApplication.total_days),
+    ).filter(LeaveApplication.leave_status == Status.Approved)
+    if year is not None:
+        query = query.filter(
+            LeaveApplication.from_date >= datetime(year, 1, 1),
+            LeaveApplication.from_date < datetime(year + 1, 1, 1),
+        )
+    return {
+        (employee_id, int(app_year)): int(days or 0)
+        for employee_id, app_year, days in query.group_by(
+            LeaveApplication.fk_employee_id, app_year
+        )
+    }
+
+
+def _apply_corrections(db: Session, drifted: List[dict]) -> None:
+    now = datetime.now(timezone.utc)
+    for i in range(0, len(drifted), RECONCILE_BATCH_SIZE):
+        batch = drifted[i : i + RECONCILE_BATCH_SIZE]
+        db.execute(
+            update(Leave),
+            [
+                {"leave_id": row["leave_id"], "balance_leave": row["expected_balance"]}
+                for row in batch
+            ],
+        )
+        db.execute(
+            insert(LeaveLedgerEntry),
+            [
+                {
+                    "employee_id": row["fk_employee_id"],
+                    "assign_year": row["assign_year"],
+                    "leave_application_id": None,
+                    "delta": -row["drift"],
+                    "reason": LedgerReason.Reconciliation,
+                    "created_at": now,
+                }
+                for row in batch
+            ],
+        )
+        bump_versions(
+            db, LEAVE_VERSION, sorted({row["fk_employee_id"] for row in batch})
+        )
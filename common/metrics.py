@@ -0,0 +1,241 @@
+# common/metrics.py
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Prometheus text exposition format
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30)
+
+Labels = Tuple[str, ...]
+
+
+class Metric:
+    """One metric family: a value (or histogram) per combination of labels.
+
+    Observations may come from the event loop and from worker threads at
+    once, so updates take a lock; it is uncontended almost always.
+    """
+
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Labels, object] = {}
+        self._lock = threading.Lock()
+        registry.append(self)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            lines.extend(self._samples(labels, value))
+        return lines
+
+    def _samples(self, labels: Labels, value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {value}"]
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str) -> None:
+        self.inc(*labels, amount=-1)
+
+
+class Histogram(Metric):
+    """Per-bucket counts plus sum; made cumulative only when rendered."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                # Bucket counts, the last one for +Inf, then the sum
+                entry = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            entry[index] += 1
+            entry[-1] += value
+
+    def _samples(self, labels: Labels, entry) -> List[str]:
+        with self._lock:
+            counts, total = entry[:-1], entry[-1]
+        lines, cumulative = [], 0
+        for bound, count in zip(self.buckets + ("+Inf",), counts):
+            cumulative += count
+            le = _format_labels(self.labelnames + ("le",), labels + (str(bound),))
+            lines.append(f"{self.name}_bucket{le} {cumulative}")
+        plain = _format_labels(self.labelnames, labels)
+        lines.append(f"{self.name}_sum{plain} {total}")
+        lines.append(f"{self.name}_count{plain} {cumulative}")
+        return lines
+
+
+registry: List[Metric] = []
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time from request start to the last byte of the response.",
+    ("method", "route", "status"),
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Response body size.",
+    ("method", "route"),
+    SIZE_BUCKETS,
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "Requests being handled by this worker."
+)
+REQUESTS_IN_FLIGHT.set(0)
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time to get a connection from the pool, including opening a new one.",
+    ("pool",),
+    POOL_WAIT_BUCKETS,
+)
+POOL_SIZE = Gauge("db_pool_size", "Connections the pool keeps open.", ("pool",))
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Connections currently in use.", ("pool",)
+)
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Connections open beyond the pool size.", ("pool",)
+)
+POOL_SATURATION = Gauge(
+    "db_pool_saturation",
+    "Checked-out connections as a fraction of pool size plus max overflow.",
+    ("pool",),
+)
+
+# Engines whose pools are sampled on every scrape, by pool label
+_watched_engines: Dict[str, Engine] = {}
+
+
+class TimedQueuePool(QueuePool):
+    """``QueuePool`` that records how long each checkout waited."""
+
+    metrics_label = "sync"
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start, self.metrics_label)
+
+
+class TimedAsyncQueuePool(TimedQueuePool, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+def watch_engine(label: str, engine: Engine) -> None:
+    """Report ``engine``'s pool as ``pool="<label>"`` on every scrape.
+
+    For an async engine pass its ``sync_engine``.
+    """
+    _watched_engines[label] = engine
+
+
+def pool_state(pool: Pool) -> Optional[Dict[str, int]]:
+    """Size, checked-out and overflow counts of a ``QueuePool``; ``None``
+    for pools that keep no connections (``NullPool`` and the like)."""
+    if not isinstance(pool, QueuePool):
+        return None
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": max(pool._max_overflow, 0),
+        "checked_out": pool.checkedout(),
+        # overflow() starts at -size and counts up as connections open
+        "overflow": max(pool.overflow(), 0),
+    }
+
+
+def render_metrics() -> str:
+    for label, engine in _watched_engines.items():
+        # Looked up each time: dispose() replaces the engine's pool
+        state = pool_state(engine.pool)
+        if state is None:
+            continue
+        capacity = state["pool_size"] + state["max_overflow"]
+        POOL_SIZE.set(state["pool_size"], label)
+        POOL_CHECKED_OUT.set(state["checked_out"], label)
+        POOL_OVERFLOW.set(state["overflow"], label)
+        POOL_SATURATION.set(round(state["checked_out"] / capacity, 4), label)
+    lines = [line for metric in registry for line in metric.render()]
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """Records latency, response size and in-flight count per route template.
+
+    The route is the matched path template (``/admin/employees/id/{employee_id}``),
+    so ids never become label values; requests that match no route are
+    grouped as ``unmatched``.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        start = time.perf_counter()
+        status, size = "500", 0
+
+        async def send_and_measure(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            method = scope["method"]
+            # FastAPI records the matched route in the scope it was given
+            route = getattr(scope.get("route"), "path", "unmatched")
+            REQUEST_DURATION.observe(time.perf_counter() - start, method, route, status)
+            RESPONSE_SIZE.observe(size, method, route)
+
+
+def _format_labels(names: Labels, values: Labels) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
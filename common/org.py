@@ -0,0 +1,156 @@
+# common/org.py
+from typing import Annotated, Optional
+from fastapi import HTTPException, Query, status
+from sqlalchemy import insert, literal, select, true
+from sqlalchemy.orm import Session, aliased
+from database.models import Employee, EmployeeHierarchy
+
+ORG_MAX_DEPTH = 64
+
+depth_dependency = Annotated[
+    int,
+    Query(
+        ge=1,
+        le=ORG_MAX_DEPTH,
+        description="Levels below you to include: 1 = direct reports only",
+    ),
+]
+
+
+# === QUERIES ===
+def subordinate_ids(manager_id: int, depth: int = 1):
+    """Subquery of employee ids up to ``depth`` levels below ``manager_id``."""
+    return select(EmployeeHierarchy.descendant_id).where(
+        EmployeeHierarchy.ancestor_id == manager_id,
+        EmployeeHierarchy.depth.between(1, depth),
+    )
+
+
+def is_in_tree(db: Session, manager_id: int, employee_id: int, depth: int = 1) -> bool:
+    distance = _distance(db, manager_id, employee_id)
+    return distance is not None and 1 <= distance <= depth
+
+
+# === MAINTENANCE ===
+def add_to_tree(db: Session, employee_id: int, manager_id: Optional[int]):
+    db.execute(
+        insert(EmployeeHierarchy).values(
+            ancestor_id=employee_id, descendant_id=employee_id, depth=0
+        )
+    )
+    if manager_id is None:
+        return
+    db.execute(
+        insert(EmployeeHierarchy).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(
+                EmployeeHierarchy.ancestor_id,
+                literal(employee_id),
+                EmployeeHierarchy.depth + 1,
+            ).where(EmployeeHierarchy.descendant_id == manager_id),
+        )
+    )
+
+
+def move_subtree(db: Session, employee_id: int, new_manager_id: Optional[int]):
+    """Re-parent ``employee_id`` and everyone under it below ``new_manager_id``."""
+    if (
+        new_manager_id is not None
+        and _distance(db, employee_id, new_manager_id) is not None
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="An employee cannot report to themselves or their own subordinate",
+        )
+
+    # Derived tables, so MySQL accepts reading the table being modified
+    subtree = (
+        select(EmployeeHierarchy.descendant_id)
+        .where(EmployeeHierarchy.ancestor_id == employee_id)
+        .subquery()
+    )
+    subtree_ids = select(subtree.c.descendant_id)
+    db.query(EmployeeHierarchy).filter(
+        EmployeeHierarchy.descendant_id.in_(subtree_ids),
+        EmployeeHierarchy.ancestor_id.not_in(subtree_ids),
+    ).delete(synchronize_session=False)
+
+    if new_manager_id is None:
+        return
+    above = aliased(EmployeeHierarchy)
+    below = aliased(EmployeeHierarchy)
+    db.execute(
+        insert(EmployeeHierarchy).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(
+                above.ancestor_id,
+                below.descendant_id,
+                above.depth + below.depth + 1,
+            )
+            # Every ancestor of the new manager pairs with every node of the
+            # subtree; the cross join is deliberate
+            .select_from(above)
+            .join(below, true())
+            .where(
+                above.descendant_id == new_manager_id,
+                below.ancestor_id == employee_id,
+            ),
+        )
+    )
+
+
+def remove_from_tree(db: Session, employee_id: int):
+    # Direct reports lose their manager, so each of their subtrees becomes a root
+    move_subtree(db, employee_id, None)
+    db.query(EmployeeHierarchy).filter(
+        (EmployeeHierarchy.ancestor_id == employee_id)
+        | (EmployeeHierarchy.descendant_id == employee_id)
+    ).delete(synchronize_session=False)
+
+
+def rebuild_org_hierarchy(db: Session) -> int:
+    """Recompute the closure table from ``Employee.fk_manager_id``.
+
+    Runs one INSERT ... SELECT per level of the tree and returns the number
+    of levels below the roots.
+    """
+    db.query(EmployeeHierarchy).delete(synchronize_session=False)
+    db.execute(
+        insert(EmployeeHierarchy).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(Employee.employee_id, Employee.employee_id, literal(0)),
+        )
+    )
+    level = 0
+    while level < ORG_MAX_DEPTH:
+        added = db.execute(
+            insert(EmployeeHierarchy).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(
+                    EmployeeHierarchy.ancestor_id,
+                    Employee.employee_id,
+                    literal(level + 1),
+                )
+                .join(
+                    Employee, Employee.fk_manager_id == EmployeeHierarchy.descendant_id
+                )
+                .where(EmployeeHierarchy.depth == level),
+            )
+        ).rowcount
+        if not added:
+            break
+        level += 1
+    db.commit()
+    return level
+
+
+# === Helper Functions ===
+def _distance(db: Session, ancestor_id: int, descendant_id: int) -> Optional[int]:
+    return (
+        db.query(EmployeeHierarchy.depth)
+        .filter(
+            EmployeeHierarchy.ancestor_id == ancestor_id,
+            EmployeeHierarchy.descendant_id == descendant_id,
+        )
+        .scalar()
+    )
@@ -0,0 +1,118 @@
+# common/pagination.py
+import base64
+import json
+from datetime import date, datetime
+from typing import Annotated, List, Optional
+from fastapi import Depends, HTTPException, Query, Response, status
+from sqlalchemy import Date, DateTime, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """Query parameters shared by every paginated list endpoint.
+
+    The next-page cursor is returned in the ``X-Next-Cursor`` response header
+    so that list bodies keep their existing shape.
+    """
+
+    def __init__(
+        self,
+        response: Response,
+        cursor: Annotated[
+            Optional[str], Query(description="Opaque cursor from X-Next-Cursor")
+        ] = None,
+        limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    ):
+        self.response = response
+        self.cursor = cursor
+        self.limit = limit
+
+
+page_dependency = Annotated[PageParams, Depends()]
+
+
+def _split_ordering(ordering):
+    if isinstance(ordering, UnaryExpression) and ordering.modifier in (
+        operators.desc_op,
+        operators.asc_op,
+    ):
+        return ordering.element, ordering.modifier is operators.desc_op
+    return ordering, False
+
+
+def _encode_cursor(values: list) -> str:
+    # datetime is a date subclass, so this covers Date and DateTime keys
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, date) else v for v in values]
+    ).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, columns: list) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor does not match this listing")
+        return [_parse_value(col, v) for col, v in zip(columns, values)]
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+def _parse_value(col, value):
+    if isinstance(col.type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(col.type, Date):
+        return date.fromisoformat(value)
+    return value
+
+
+def _keyset(query, page: PageParams, order_by):
+    orderings = [_split_ordering(o) for o in order_by]
+    columns = [col for col, _ in orderings]
+
+    if page.cursor:
+        values = _decode_cursor(page.cursor, columns)
+        clauses = []
+        for i, (col, descending) in enumerate(orderings):
+            ties = [columns[j] == values[j] for j in range(i)]
+            step = col < values[i] if descending else col > values[i]
+            clauses.append(and_(*ties, step))
+        query = query.filter(or_(*clauses))
+
+    return query.order_by(*order_by).limit(page.limit + 1), columns
+
+
+def _trim(rows: List, page: PageParams, columns: list) -> List:
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        last = rows[-1]
+        page.response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(
+            [getattr(last, col.key) for col in columns]
+        )
+    return rows
+
+
+def paginate(query, page: PageParams, *order_by) -> List:
+    """Return one keyset page of ``query`` ordered by ``order_by``.
+
+    ``order_by`` must end with a unique column (normally the primary key) so
+    that the ordering is total. Each column may be wrapped in ``.desc()``.
+    """
+    query, columns = _keyset(query, page, order_by)
+    return _trim(query.all(), page, columns)
+
+
+async def apaginate(db: AsyncSession, stmt, page: PageParams, *order_by) -> List:
+    """``paginate`` for a ``select()`` of one entity run on an ``AsyncSession``."""
+    stmt, columns = _keyset(stmt, page, order_by)
+    rows = (await db.scalars(stmt)).all()
+    return _trim(list(rows), page, columns)
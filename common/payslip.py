@@ -1,11 +1,24 @@
 # common/payslip.py
+import time
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
-from database.models import Payslip
-from schema.payslip_schema import PayslipCreate
+from database.models import Employee, Payslip, Salary
+from schema.payslip_schema import PayslipCreate, PayslipResponse
 from fastapi import HTTPException, status
 from typing import List
 from datetime import datetime
-from sqlalchemy import extract
+from common.common import _in_month, _month_range
+from common.pagination import PageParams, paginate
+from common.export import ExportFormat, stream_export
+from common.conditional import bump_version, bump_versions
+
+PAYSLIP_VERSION = "payslip"
+PAYROLL_BATCH_SIZE = 1000
+
+# Monthly split of Salary.lpa (lakhs per annum)
+BASIC_SHARE = 0.5
+HRA_SHARE_OF_BASIC = 0.4
+INTERNET_ALLOWANCE = 1000.0
 
 
 def _get_payslip_or_404(db: Session, payslip_id: int) -> Payslip:
@@ -33,18 +46,70 @@ def create_payslip(db: Session, payslip_in: PayslipCreate) -> Payslip:
 
     db_payslip = Payslip(**payslip_in.model_dump())
     db.add(db_payslip)
+    bump_version(db, PAYSLIP_VERSION, payslip_in.fk_employee_id)
     db.commit()
     db.refresh(db_payslip)
     return db_payslip
 
 
-def get_payslips_by_employee(db: Session, employee_id: int) -> List[Payslip]:
-    payslips = (
-        db.query(Payslip)
-        .filter(Payslip.fk_employee_id == employee_id)
-        .order_by(Payslip.payslip_month.desc())
-        .all()
+def run_payroll(db: Session, year: int, month: int) -> dict:
+    """Create the month's payslip for everyone with a salary for ``year``.
+
+    Employees who already have a payslip that month are skipped, found with
+    one query; the rest are inserted in batches in a single transaction.
+    """
+    start = time.perf_counter()
+    payslip_month, _ = _month_range(year, month)
+
+    # Latest salary row wins if an employee has more than one for the year.
+    # The join drops rows orphaned by an employee delete (fk_employee_id NULL).
+    lpa_by_employee = {
+        employee_id: lpa
+        for employee_id, lpa in db.query(Salary.fk_employee_id, Salary.lpa)
+        .join(Employee, Employee.employee_id == Salary.fk_employee_id)
+        .filter(Salary.salary_year == year)
+        .order_by(Salary.salary_id)
+    }
+    already_paid = {
+        employee_id
+        for (employee_id,) in db.query(Payslip.fk_employee_id).filter(
+            _in_month(Payslip.payslip_month, year, month)
+        )
+    }
+    rows = [
+        {
+            **_payslip_components(lpa),
+            "payslip_month": payslip_month,
+            "fk_employee_id": employee_id,
+        }
+        for employee_id, lpa in sorted(lpa_by_employee.items())
+        if employee_id not in already_paid
+    ]
+
+    for i in range(0, len(rows), PAYROLL_BATCH_SIZE):
+        db.execute(insert(Payslip), rows[i : i + PAYROLL_BATCH_SIZE])
+    bump_versions(
+        db, PAYSLIP_VERSION, [row["fk_employee_id"] for row in rows], PAYROLL_BATCH_SIZE
     )
+    db.commit()
+
+    employees = db.query(func.count(Employee.employee_id)).scalar()
+    elapsed = time.perf_counter() - start
+    return {
+        "payslip_month": payslip_month,
+        "created": len(rows),
+        "skipped_existing": len(lpa_by_employee) - len(rows),
+        "missing_salary": employees - len(lpa_by_employee),
+        "duration_ms": round(elapsed * 1000, 2),
+        "rows_per_second": round(len(rows) / elapsed, 1),
+    }
+
+
+def get_payslips_by_employee(
+    db: Session, employee_id: int, page: PageParams
+) -> List[Payslip]:
+    query = db.query(Payslip).filter(Payslip.fk_employee_id == employee_id)
+    payslips = paginate(query, page, Payslip.payslip_month.desc(), Payslip.payslip_id)
     if not payslips:
         raise HTTPException(
             status_code=404, detail="No payslips found for this employee"
@@ -52,15 +117,11 @@ def get_payslips_by_employee(db: Session, employee_id: int) -> List[Payslip]:
     return payslips
 
 
-def get_payslips_by_month(db: Session, year: int, month: int) -> List[Payslip]:
-    payslips = (
-        db.query(Payslip)
-        .filter(
-            extract("year", Payslip.payslip_month) == year,
-            extract("month", Payslip.payslip_month) == month,
-        )
-        .all()
-    )
+def get_payslips_by_month(
+    db: Session, year: int, month: int, page: PageParams
+) -> List[Payslip]:
+    query = db.query(Payslip).filter(_in_month(Payslip.payslip_month, year, month))
+    payslips = paginate(query, page, Payslip.payslip_id)
     if not payslips:
         raise HTTPException(
             status_code=404, detail=f"No payslips found for {year}-{month:02d}"
@@ -68,6 +129,15 @@ def get_payslips_by_month(db: Session, year: int, month: int) -> List[Payslip]:
     return payslips
 
 
+def export_payslips_by_month(db: Session, year: int, month: int, fmt: ExportFormat):
+    query = (
+        db.query(Payslip)
+        .filter(_in_month(Payslip.payslip_month, year, month))
+        .order_by(Payslip.payslip_id)
+    )
+    return stream_export(query, PayslipResponse, fmt, f"payslips-{year}-{month:02d}")
+
+
 def get_payslip_by_employee_and_month(
     db: Session, employee_id: int, year: int, month: int
 ) -> Payslip:
@@ -75,8 +145,7 @@ def get_payslip_by_employee_and_month(
         db.query(Payslip)
         .filter(
             Payslip.fk_employee_id == employee_id,
-            extract("year", Payslip.payslip_month) == year,
-            extract("month", Payslip.payslip_month) == month,
+            _in_month(Payslip.payslip_month, year, month),
         )
         .first()
     )
@@ -88,6 +157,7 @@ def get_payslip_by_employee_and_month(
 def delete_payslip_by_id(db: Session, payslip_id: int) -> None:
     payslip = _get_payslip_or_404(db, payslip_id)
     db.delete(payslip)
+    bump_version(db, PAYSLIP_VERSION, payslip.fk_employee_id)
     db.commit()
 
 
@@ -96,4 +166,19 @@ def delete_payslip_by_employee_and_month(
 ) -> None:
     payslip = get_payslip_by_employee_and_month(db, employee_id, year, month)
     db.delete(payslip)
+    bump_version(db, PAYSLIP_VERSION, employee_id)
     db.commit()
+
+
+# === Helper Functions ===
+def _payslip_components(lpa: float) -> dict:
+    gross = lpa * 100000 / 12
+    basic = gross * BASIC_SHARE
+    hra = basic * HRA_SHARE_OF_BASIC
+    internet = min(INTERNET_ALLOWANCE, gross - basic - hra)
+    return {
+        "basic_amount": round(basic, 2),
+        "hra": round(hra, 2),
+        "special_allowance": round(gross - basic - hra - internet, 2),
+        "internet_allowance": round(internet, 2),
+    }
@@ -0,0 +1,107 @@
+# common/query_stats.py
+import logging
+import os
+import time
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Queries one request may run before it is logged as a likely N+1
+QUERY_BUDGET = int(os.getenv("QUERY_BUDGET", 30))
+
+
+class QueryStats:
+    """Statements run and time spent in the database for one request."""
+
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    @property
+    def server_timing(self) -> str:
+        return f'db;dur={self.seconds * 1000:.2f};desc="{self.count} queries"'
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+# Called with (method, path, stats) for every request over its budget
+budget_listeners: List[Callable[[str, str, QueryStats], None]] = []
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+# Every engine, sync or the sync side of an async one. Statements outside a
+# request (startup, scripts) find no QueryStats and cost one ContextVar read.
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += time.perf_counter() - conn.info["query_started"].pop()
+
+
+class QueryStatsMiddleware:
+    """Counts each request's queries and adds a ``Server-Timing`` header.
+
+    Plain ASGI rather than ``BaseHTTPMiddleware`` so sync handlers, which
+    run in a worker thread with a copy of this context, update the same
+    ``QueryStats``. Queries run by a streaming body after the headers are
+    sent still count toward the budget check and the log line.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        stats = QueryStats()
+        token = _current.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            _report(scope, stats)
+
+
+def _report(scope, stats: QueryStats) -> None:
+    method, path = scope["method"], scope["path"]
+    if stats.count <= QUERY_BUDGET:
+        logger.debug(
+            "%s %s: %d queries in %.1fms",
+            method,
+            path,
+            stats.count,
+            stats.seconds * 1000,
+        )
+        return
+    logger.warning(
+        "%s %s ran %d queries (budget %d) in %.1fms; possible N+1",
+        method,
+        path,
+        stats.count,
+        QUERY_BUDGET,
+        stats.seconds * 1000,
+    )
+    for listener in budget_listeners:
+        listener(method, path, stats)
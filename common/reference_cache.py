@@ -0,0 +1,164 @@
+# common/reference_cache.py
+import hashlib
+import os
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+REFERENCE_CACHE_TTL = float(os.getenv("REFERENCE_CACHE_TTL", 300))
+# Optional: a file shared by every worker on the host; writes in one worker
+# then invalidate the others within REFERENCE_CACHE_SYNC_INTERVAL seconds.
+REFERENCE_CACHE_SYNC_FILE = os.getenv("REFERENCE_CACHE_SYNC_FILE")
+REFERENCE_CACHE_SYNC_INTERVAL = float(os.getenv("REFERENCE_CACHE_SYNC_INTERVAL", 1))
+
+
+class FileInvalidationChannel:
+    """Cross-worker invalidation through a shared append-only file.
+
+    ``publish`` appends one byte, so the file size is a version number that
+    only ever grows. Readers compare it with the size they saw when they
+    last loaded, with one ``stat`` at most every ``poll_interval`` seconds.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 1.0):
+        self.path = path
+        self.poll_interval = poll_interval
+
+    def publish(self) -> None:
+        with open(self.path, "ab") as f:
+            f.write(b".")
+
+    def version(self) -> int:
+        try:
+            return os.stat(self.path).st_size
+        except FileNotFoundError:
+            return 0
+
+
+def default_channel() -> Optional[FileInvalidationChannel]:
+    if not REFERENCE_CACHE_SYNC_FILE:
+        return None
+    return FileInvalidationChannel(
+        REFERENCE_CACHE_SYNC_FILE, REFERENCE_CACHE_SYNC_INTERVAL
+    )
+
+
+class _Snapshot(NamedTuple):
+    by_id: Dict
+    by_name: Dict
+    expires_at: float
+    channel_version: int
+    poll_at: float
+    digest: str
+
+
+class ReferenceCache:
+    """Read-through snapshot of a small lookup table, by id and by name.
+
+    The whole table is loaded on first use and served from memory until it
+    is invalidated, ``ttl`` seconds pass, or the channel reports a write in
+    another worker. Names are matched casefolded, as ``ilike`` did.
+
+    Cached rows are detached copies: read them, never attach them to a
+    session. Write paths should ``refresh`` first and ``invalidate`` after
+    committing.
+    """
+
+    def __init__(
+        self,
+        id_column,
+        name_column,
+        ttl: float = REFERENCE_CACHE_TTL,
+        channel: Optional[FileInvalidationChannel] = None,
+    ):
+        self.model = id_column.class_
+        self.id_column = id_column
+        self.name_column = name_column
+        self.ttl = ttl
+        self.channel = channel
+        self.hits = 0
+        self.loads = 0
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    # === READ ===
+    def all(self, db) -> List:
+        return list(self._get(db).by_id.values())
+
+    def by_id(self, db, item_id: int):
+        return self._get(db).by_id.get(item_id)
+
+    def by_name(self, db, name: str):
+        return self._get(db).by_name.get(_name_key(name))
+
+    def version(self, db) -> str:
+        """Digest of the cached rows; changes whenever any id or name does."""
+        return self._get(db).digest
+
+    # === WRITE SUPPORT ===
+    def refresh(self, db) -> None:
+        with self._lock:
+            self._snapshot = self._load(db)
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+        if self.channel:
+            self.channel.publish()
+
+    def clear(self) -> None:
+        self._snapshot = None
+        self.hits = 0
+        self.loads = 0
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "hits": self.hits,
+            "loads": self.loads,
+            "size": len(snapshot.by_id) if snapshot else 0,
+        }
+
+    # === Helper Functions ===
+    def _get(self, db):
+        snapshot = self._snapshot
+        if snapshot is not None and self._fresh(snapshot):
+            self.hits += 1
+            return snapshot
+        with self._lock:
+            # Another thread may have reloaded while this one waited
+            snapshot = self._snapshot
+            if snapshot is None or not self._fresh(snapshot):
+                snapshot = self._snapshot = self._load(db)
+            return snapshot
+
+    def _fresh(self, snapshot) -> bool:
+        now = time.monotonic()
+        if now >= snapshot.expires_at:
+            return False
+        if self.channel and now >= snapshot.poll_at:
+            if self.channel.version() != snapshot.channel_version:
+                return False
+            self._snapshot = snapshot._replace(poll_at=now + self.channel.poll_interval)
+        return True
+
+    def _load(self, db):
+        # Read the version first so a write landing mid-load is not missed
+        version = self.channel.version() if self.channel else 0
+        id_key, name_key = self.id_column.key, self.name_column.key
+        by_id = {
+            row[0]: self.model(**{id_key: row[0], name_key: row[1]})
+            for row in db.query(self.id_column, self.name_column).order_by(
+                self.id_column
+            )
+        }
+        names = {item_id: getattr(item, name_key) for item_id, item in by_id.items()}
+        by_name = {_name_key(name): by_id[item_id] for item_id, name in names.items()}
+        digest = hashlib.sha256(repr(sorted(names.items())).encode()).hexdigest()
+        self.loads += 1
+        now = time.monotonic()
+        poll_at = now + (self.channel.poll_interval if self.channel else 0)
+        return _Snapshot(by_id, by_name, now + self.ttl, version, poll_at, digest)
+
+
+def _name_key(name: str) -> str:
+    return name.strip().casefold()
@@ -3,13 +3,16 @@ from sqlalchemy.orm import Session
 from database.models import Regularization, Employee
 from schema.regularization_schema import (
     RegularizationCreate,
+    RegularizationBulkStatusUpdate,
     RegularizationStatusUpdate,
     Status,
 )
 from fastapi import HTTPException, status
 from datetime import datetime, timezone
 from typing import List
-from sqlalchemy import extract
+from common.common import _bulk_update_status, _in_month
+from common.pagination import PageParams, paginate
+from common.leave_application import _raise_overlap, find_overlapping_leave
 
 
 def _get_regularization_or_404(db: Session, reg_id: int) -> Regularization:
@@ -31,6 +34,17 @@ def create_regularization(
     if not emp or not emp.fk_manager_id:
         raise HTTPException(status_code=400, detail="You have no manager assigned")
 
+    # A day on approved leave has no attendance to regularize
+    clash = find_overlapping_leave(
+        db,
+        user["id"],
+        reg_in.regularization_start_time.date(),
+        reg_in.regularization_end_time.date(),
+        statuses=(Status.Approved,),
+    )
+    if clash:
+        _raise_overlap(clash)
+
     reg = Regularization(
         **reg_in.model_dump(),
         fk_employee_id=user["id"],
@@ -43,12 +57,15 @@ def create_regularization(
     return reg
 
 
-def get_my_regularizations(db: Session, user: dict) -> List[Regularization]:
-    return (
-        db.query(Regularization)
-        .filter(Regularization.fk_employee_id == user["id"])
-        .order_by(Regularization.regularization_start_time.desc())
-        .all()
+def get_my_regularizations(
+    db: Session, user: dict, page: PageParams
+) -> List[Regularization]:
+    query = db.query(Regularization).filter(Regularization.fk_employee_id == user["id"])
+    return paginate(
+        query,
+        page,
+        Regularization.regularization_start_time.desc(),
+        Regularization.regularization_id,
     )
 
 
@@ -60,17 +77,17 @@ def get_my_regularization_by_id(reg_id: int, db: Session, user: dict) -> Regular
 
 
 def get_my_regularizations_by_month(
-    year: int, month: int, db: Session, user: dict
+    year: int, month: int, db: Session, user: dict, page: PageParams
 ) -> List[Regularization]:
-    return (
-        db.query(Regularization)
-        .filter(
-            Regularization.fk_employee_id == user["id"],
-            extract("year", Regularization.regularization_start_time) == year,
-            extract("month", Regularization.regularization_start_time) == month,
-        )
-        .order_by(Regularization.regularization_start_time)
-        .all()
+    query = db.query(Regularization).filter(
+        Regularization.fk_employee_id == user["id"],
+        _in_month(Regularization.regularization_start_time, year, month),
+    )
+    return paginate(
+        query,
+        page,
+        Regularization.regularization_start_time,
+        Regularization.regularization_id,
     )
 
 
@@ -103,30 +120,34 @@ def get_manager_regularization_by_id(
 
 
 def get_manager_regularizations_for_employee(
-    employee_id: int, db: Session, user: dict
+    employee_id: int, db: Session, user: dict, page: PageParams
 ) -> List[Regularization]:
     from common.employee import get_subordinate_by_id
 
     get_subordinate_by_id(employee_id=employee_id, db=db, user=user)
-    return (
-        db.query(Regularization)
-        .filter(Regularization.fk_employee_id == employee_id)
-        .order_by(Regularization.regularization_start_time.desc())
-        .all()
+    query = db.query(Regularization).filter(
+        Regularization.fk_employee_id == employee_id
+    )
+    return paginate(
+        query,
+        page,
+        Regularization.regularization_start_time.desc(),
+        Regularization.regularization_id,
     )
 
 
 def get_manager_pending_regularizations(
-    db: Session, user: dict
+    db: Session, user: dict, page: PageParams
 ) -> List[Regularization]:
-    return (
-        db.query(Regularization)
-        .filter(
-            Regularization.fk_manager_id == user["id"],
-            Regularization.regularization_status == Status.Pending,
-        )
-        .order_by(Regularization.regularization_start_time)
-        .all()
+    query = db.query(Regularization).filter(
+        Regularization.fk_manager_id == user["id"],
+        Regularization.regularization_status == Status.Pending,
+    )
+    return paginate(
+        query,
+        page,
+        Regularization.regularization_start_time,
+        Regularization.regularization_id,
     )
 
 
@@ -139,3 +160,16 @@ def manager_update_regularization_status(
     db.commit()
     db.refresh(reg)
     return reg
+
+
+def manager_bulk_update_regularization_status(
+    status_update: RegularizationBulkStatusUpdate, db: Session, user: dict
+) -> List[dict]:
+    return _bulk_update_status(
+        db,
+        Regularization.regularization_id,
+        Regularization.regularization_status,
+        status_update.ids,
+        status_update.regularization_status,
+        user["id"],
+    )
@@ -4,6 +4,9 @@ from sqlalchemy.orm import Session
 from database.models import Role
 from typing import Dict, Any
 from common.common import _require_admin
+from common.reference_cache import ReferenceCache, default_channel
+
+role_cache = ReferenceCache(Role.role_id, Role.role, channel=default_channel())
 
 
 def _get_role_by_id(db: Session, role_id: int) -> Role:
@@ -14,31 +17,41 @@ def _get_role_by_id(db: Session, role_id: int) -> Role:
 
 
 def _get_role_by_name(db: Session, role_name: str) -> Role:
-    role = db.query(Role).filter(Role.role.ilike(role_name.strip())).first()
-    if not role:
+    cached = role_cache.by_name(db, role_name)
+    if not cached:
         raise HTTPException(status_code=404, detail="Role not found")
-    return role
+    return _get_role_by_id(db, cached.role_id)
+
+
+def _role_name_taken(db: Session, role_name: str, exclude_id: int = None) -> bool:
+    cached = role_cache.by_name(db, role_name)
+    return cached is not None and cached.role_id != exclude_id
 
 
 # === READ ===
 def get_all_roles(db: Session):
-    return db.query(Role).all()
+    return role_cache.all(db)
 
 
 def get_role_by_id(db: Session, role_id: int):
-    return _get_role_by_id(db, role_id)
+    role = role_cache.by_id(db, role_id)
+    if not role:
+        raise HTTPException(status_code=404, detail="Role not found")
+    return role
 
 
 # === ADMIN: CREATE ===
 def create_role(db: Session, role_name: str, user: dict) -> Role:
     _require_admin(user)
+    role_cache.refresh(db)
     role_name = role_name.strip()
-    if db.query(Role).filter(Role.role.ilike(role_name)).first():
+    if _role_name_taken(db, role_name):
         raise HTTPException(status_code=400, detail="Role already exists")
 
     new_role = Role(role=role_name)
     db.add(new_role)
     db.commit()
+    role_cache.invalidate()
     return new_role
 
 
@@ -47,21 +60,19 @@ def update_role_by_id(
     db: Session, role_id: int, new_role_name: str, user: dict
 ) -> Role:
     _require_admin(user)
+    role_cache.refresh(db)
     role = _get_role_by_id(db, role_id)
 
     new_name = new_role_name.strip()
 
-    if (
-        db.query(Role)
-        .filter(Role.role.ilike(new_name), Role.role_id != role_id)
-        .first()
-    ):
+    if _role_name_taken(db, new_name, exclude_id=role_id):
         raise HTTPException(
             status_code=400, detail="Role with this name already exists"
         )
 
     role.role = new_name
     db.commit()
+    role_cache.invalidate()
     return role
 
 
@@ -70,33 +81,39 @@ def update_role_by_name(
     db: Session, current_role_name: str, new_role_name: str, user: dict
 ) -> Role:
     _require_admin(user)
+    role_cache.refresh(db)
     role = _get_role_by_name(db, current_role_name)
 
     new_name = new_role_name.strip()
 
-    if db.query(Role).filter(Role.role.ilike(new_name)).first():
+    if _role_name_taken(db, new_name):
         raise HTTPException(
             status_code=400, detail="Role with this name already exists"
         )
 
     role.role = new_name
     db.commit()
+    role_cache.invalidate()
     return role
 
 
 # === ADMIN: DELETE BY ID ===
 def delete_role_by_id(db: Session, role_id: int, user: dict) -> Dict[str, str]:
     _require_admin(user)
+    role_cache.refresh(db)
     role = _get_role_by_id(db, role_id)
     db.delete(role)
     db.commit()
+    role_cache.invalidate()
     return {"detail": "Role deleted successfully"}
 
 
 # === ADMIN: DELETE BY NAME ===
 def delete_role_by_name(db: Session, role_name: str, user: dict) -> Dict[str, str]:
     _require_admin(user)
+    role_cache.refresh(db)
     role = _get_role_by_name(db, role_name)
     db.delete(role)
     db.commit()
+    role_cache.invalidate()
     return {"detail": "Role deleted successfully"}
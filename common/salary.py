@@ -4,11 +4,16 @@ from database.models import Salary
 from schema.salary_schema import SalaryCreate
 from typing import List
 from fastapi import HTTPException, status
+from common.pagination import PageParams, paginate
+from common.conditional import bump_version
+
+SALARY_VERSION = "salary"
 
 
 # ─── READ OPERATIONS (with proper exceptions) ────────────────────────────────
-def get_salaries_by_year(db: Session, year: int) -> List[Salary]:
-    salaries = db.query(Salary).filter(Salary.salary_year == year).all()
+def get_salaries_by_year(db: Session, year: int, page: PageParams) -> List[Salary]:
+    query = db.query(Salary).filter(Salary.salary_year == year)
+    salaries = paginate(query, page, Salary.salary_id)
     if not salaries:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -31,8 +36,11 @@ def get_salary_by_employee_and_year(db: Session, employee_id: int, year: int) ->
     return salary
 
 
-def get_salaries_by_employee_id(db: Session, employee_id: int) -> List[Salary]:
-    salaries = db.query(Salary).filter(Salary.fk_employee_id == employee_id).all()
+def get_salaries_by_employee_id(
+    db: Session, employee_id: int, page: PageParams
+) -> List[Salary]:
+    query = db.query(Salary).filter(Salary.fk_employee_id == employee_id)
+    salaries = paginate(query, page, Salary.salary_id)
     if not salaries:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -60,6 +68,7 @@ def create_salary(db: Session, salary: SalaryCreate) -> Salary:
 
     db_salary = Salary(**salary.model_dump())
     db.add(db_salary)
+    bump_version(db, SALARY_VERSION, salary.fk_employee_id)
     db.commit()
     db.refresh(db_salary)
     return db_salary
@@ -74,6 +83,7 @@ def delete_salary(db: Session, salary_id: int) -> None:
             detail=f"Salary record with ID {salary_id} not found",
         )
     db.delete(db_salary)
+    bump_version(db, SALARY_VERSION, db_salary.fk_employee_id)
     db.commit()
 
 
@@ -87,4 +97,5 @@ def delete_salary_by_employee_and_year(
     salary = get_salary_by_employee_and_year(db, employee_id, year)
 
     db.delete(salary)
+    bump_version(db, SALARY_VERSION, employee_id)
     db.commit()
@@ -0,0 +1,260 @@
+# common/timesheet.py
+from datetime import date, datetime, time, timedelta
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from database.models import (
+    Attendance,
+    Employee,
+    LeaveApplication,
+    Regularization,
+    Status,
+)
+from schema.timesheet_schema import TimesheetTotals
+from common.common import _month_range, _require_admin
+from common.export import ExportFormat, stream_rows
+from common.work_calendar import WorkCalendar, calendar_cache
+
+TIMESHEET_BATCH_SIZE = 1000
+
+Window = Tuple[datetime, datetime]
+
+
+class EmployeeStream:
+    """Rows sorted by employee id (first column), handed out one employee at a time.
+
+    ``take`` must be called with ascending ids; rows of employees that are
+    never asked for are skipped without being kept.
+    """
+
+    def __init__(self, rows: Iterable[tuple]):
+        self._groups = groupby(rows, key=itemgetter(0))
+        self._current = next(self._groups, None)
+
+    def take(self, employee_id: int) -> List[tuple]:
+        while self._current is not None and self._current[0] < employee_id:
+            self._current = next(self._groups, None)
+        if self._current is None or self._current[0] != employee_id:
+            return []
+        rows = list(self._current[1])
+        self._current = next(self._groups, None)
+        return rows
+
+
+# === USER ===
+def get_my_timesheet(db: Session, user: dict, year: int, month: int) -> dict:
+    return next(_timesheets(db, year, month, employee_id=user["id"]))
+
+
+# === ADMIN ===
+def get_employee_timesheet_admin(
+    db: Session, user: dict, employee_id: int, year: int, month: int
+) -> dict:
+    _require_admin(user)
+    timesheet = next(_timesheets(db, year, month, employee_id=employee_id), None)
+    if timesheet is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    return timesheet
+
+
+def export_company_timesheets(
+    db: Session, user: dict, year: int, month: int, fmt: ExportFormat
+):
+    _require_admin(user)
+    _month_range(year, month)  # reject a bad month before the stream starts
+    return stream_rows(
+        company_timesheets(db, year, month),
+        TimesheetTotals,
+        fmt,
+        f"timesheets-{year}-{month:02d}",
+    )
+
+
+def company_timesheets(db: Session, year: int, month: int) -> Iterator[dict]:
+    """Monthly totals of every employee, in employee order.
+
+    Four queries in all, each sorted by employee: employees, approved
+    regularizations and approved leave are read up front (one month of
+    them is small), and punches stream in batches past them in step.
+    Only one employee's punches are held at a time.
+    """
+    for timesheet in _timesheets(db, year, month):
+        timesheet.pop("days")
+        yield timesheet
+
+
+# === ENGINE ===
+def build_timesheet(
+    calendar: WorkCalendar,
+    first: date,
+    last: date,
+    punches: List[datetime],
+    regularizations: List[Window],
+    leaves: List[Window],
+) -> Tuple[List[dict], dict]:
+    """Per-day rows and month totals for one employee from ``first`` to ``last``.
+
+    Punches are paired in order within each day, in then out; an odd last
+    punch is left unpaired and the day is flagged ``incomplete``. Approved
+    regularization windows are merged with the punched sessions, so time
+    covered by both counts once. Approved leave marks working days only.
+    """
+    days: Dict[date, dict] = {}
+    windows: Dict[date, List[Window]] = {}
+
+    def day(work_date: date) -> dict:
+        if work_date not in days:
+            days[work_date] = {
+                "work_date": work_date,
+                "punch_count": 0,
+                "punched_seconds": 0,
+                "worked_seconds": 0,
+                "regularized": False,
+                "on_leave": False,
+                "incomplete": False,
+            }
+            windows[work_date] = []
+        return days[work_date]
+
+    for work_date, group in groupby(punches, key=datetime.date):
+        times = list(group)
+        entry = day(work_date)
+        sessions = list(zip(times[::2], times[1::2]))
+        entry["punch_count"] = len(times)
+        entry["incomplete"] = len(times) % 2 == 1
+        entry["punched_seconds"] = _seconds(
+            sum((b - a for a, b in sessions), timedelta())
+        )
+        windows[work_date].extend(sessions)
+
+    for start, end in regularizations:
+        for work_date in _dates(max(start.date(), first), min(end.date(), last)):
+            clipped = (
+                max(start, datetime.combine(work_date, time.min)),
+                min(end, datetime.combine(work_date + timedelta(days=1), time.min)),
+            )
+            if clipped[1] > clipped[0]:
+                day(work_date)["regularized"] = True
+                windows[work_date].append(clipped)
+
+    for start, end in leaves:
+        for work_date in _dates(max(start.date(), first), min(end.date(), last)):
+            if calendar.is_working_day(work_date):
+                day(work_date)["on_leave"] = True
+
+    rows = [days[work_date] for work_date in sorted(days)]
+    for row in rows:
+        row["worked_seconds"] = _union_seconds(windows[row["work_date"]])
+    totals = {
+        "working_days": calendar.working_days(first, last),
+        "days_present": sum(1 for r in rows if r["punch_count"] or r["regularized"]),
+        "leave_days": sum(1 for r in rows if r["on_leave"]),
+        "incomplete_days": sum(1 for r in rows if r["incomplete"]),
+        "punched_seconds": sum(r["punched_seconds"] for r in rows),
+        "worked_seconds": sum(r["worked_seconds"] for r in rows),
+    }
+    return rows, totals
+
+
+# === Helper Functions ===
+def _timesheets(
+    db: Session, year: int, month: int, employee_id: Optional[int] = None
+) -> Iterator[dict]:
+    start, next_start = _month_range(year, month)
+    first, last = start.date(), (next_start - timedelta(days=1)).date()
+
+    def sorted_rows(query, employee_column, *order):
+        query = query.filter(employee_column.isnot(None))
+        if employee_id is not None:
+            query = query.filter(employee_column == employee_id)
+        return query.order_by(employee_column, *order)
+
+    employees = sorted_rows(
+        db.query(Employee.employee_id, Employee.fk_location_id), Employee.employee_id
+    ).all()
+    # Resolved before the punch cursor opens: no other query may run while
+    # it streams (MySQL cannot interleave unbuffered result sets)
+    calendars = {
+        location_id: calendar_cache.for_location(db, location_id)
+        for location_id in {location_id for _, location_id in employees}
+    }
+    regularizations = EmployeeStream(
+        sorted_rows(
+            db.query(
+                Regularization.fk_employee_id,
+                Regularization.regularization_start_time,
+                Regularization.regularization_end_time,
+            ).filter(
+                Regularization.regularization_status == Status.Approved,
+                Regularization.regularization_start_time < next_start,
+                Regularization.regularization_end_time >= start,
+            ),
+            Regularization.fk_employee_id,
+            Regularization.regularization_start_time,
+        ).all()
+    )
+    leaves = EmployeeStream(
+        sorted_rows(
+            db.query(
+                LeaveApplication.fk_employee_id,
+                LeaveApplication.from_date,
+                LeaveApplication.end_date,
+            ).filter(
+                LeaveApplication.leave_status == Status.Approved,
+                LeaveApplication.from_date < next_start,
+                LeaveApplication.end_date >= start,
+            ),
+            LeaveApplication.fk_employee_id,
+            LeaveApplication.from_date,
+        ).all()
+    )
+    punches = EmployeeStream(
+        sorted_rows(
+            db.query(Attendance.fk_employee_id, Attendance.punch_time).filter(
+                Attendance.punch_time >= start, Attendance.punch_time < next_start
+            ),
+            Attendance.fk_employee_id,
+            Attendance.punch_time,
+            Attendance.attendance_id,
+        ).yield_per(TIMESHEET_BATCH_SIZE)
+    )
+
+    for emp_id, location_id in employees:
+        rows, totals = build_timesheet(
+            calendars[location_id],
+            first,
+            last,
+            [punch for _, punch in punches.take(emp_id)],
+            [(a, b) for _, a, b in regularizations.take(emp_id)],
+            [(a, b) for _, a, b in leaves.take(emp_id)],
+        )
+        yield {
+            "fk_employee_id": emp_id,
+            "year": year,
+            "month": month,
+            **totals,
+            "days": rows,
+        }
+
+
+def _dates(first: date, last: date) -> Iterator[date]:
+    for n in range((last - first).days + 1):
+        yield first + timedelta(days=n)
+
+
+def _union_seconds(windows: List[Window]) -> int:
+    total, covered_to = timedelta(), None
+    for start, end in sorted(windows):
+        if covered_to is None or start > covered_to:
+            total += end - start
+            covered_to = end
+        elif end > covered_to:
+            total += end - covered_to
+            covered_to = end
+    return _seconds(total)
+
+
+def _seconds(delta: timedelta) -> int:
+    return int(delta.total_seconds())
@@ -0,0 +1,67 @@
+# common/token_cache.py
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class TokenCache:
+    """Bounded LRU of verified JWT claims keyed by the SHA-256 of the token.
+
+    An entry is dropped once the token's ``exp`` has passed or ``ttl``
+    seconds after it was cached, whichever comes first, so an expired token
+    always falls through to a full ``jwt.decode`` and is rejected there.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.time():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[0])
+
+    def put(self, token: str, claims: dict, exp: float) -> None:
+        if self.maxsize <= 0:
+            return
+        key = self._key(token)
+        expires_at = min(exp, time.time() + self.ttl)
+        with self._lock:
+            self._entries[key] = (dict(claims), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
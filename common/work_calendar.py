@@ -0,0 +1,290 @@
+# common/work_calendar.py
+import calendar
+import os
+import threading
+import time
+from array import array
+from collections import Counter
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from database.models import (
+    Employee,
+    Holiday,
+    LeaveApplication,
+    LedgerReason,
+    Status,
+    WorkLocation,
+)
+from schema.calendar_schema import HolidayCreate, WorkLocationCreate, parse_weekly_offs
+from common.common import _check_date_range, _require_admin
+from common.leave_ledger import adjust_balances
+from common.pagination import PageParams, paginate
+from common.reference_cache import REFERENCE_CACHE_TTL
+
+# Weekly offs for employees without a work location
+DEFAULT_WEEKLY_OFFS = os.getenv("DEFAULT_WEEKLY_OFFS", "Sat,Sun")
+RECOMPUTE_BATCH_SIZE = 1000
+WORKING_DAYS_MAX_RANGE = 3660
+
+
+class WorkCalendar:
+    """Working days for one location as per-year prefix sums.
+
+    Index ``k`` of a year's array is the number of working days among its
+    first ``k`` days, so the count for any range inside a year is one
+    subtraction. A year's array is built on first use, 367 ints at most.
+    """
+
+    def __init__(self, weekly_offs: Iterable[int], holidays: Iterable[date]):
+        self.weekly_offs = frozenset(weekly_offs)
+        self.holidays = frozenset(holidays)
+        self._years: Dict[int, Tuple[int, array]] = {}
+
+    def working_days(self, start: date, end: date) -> int:
+        """Working days from ``start`` to ``end``, both inclusive."""
+        if end < start:
+            return 0
+        if start.year == end.year:
+            return self._between(start, end)
+        return (
+            self._between(start, date(start.year, 12, 31))
+            + sum(self._year(year)[1][-1] for year in range(start.year + 1, end.year))
+            + self._between(date(end.year, 1, 1), end)
+        )
+
+    def is_working_day(self, day: date) -> bool:
+        return self._between(day, day) == 1
+
+    # === Helper Functions ===
+    def _between(self, start: date, end: date) -> int:
+        jan_1, prefix = self._year(start.year)
+        return prefix[end.toordinal() - jan_1 + 1] - prefix[start.toordinal() - jan_1]
+
+    def _year(self, year: int) -> Tuple[int, array]:
+        """``(ordinal of 1 January, prefix sums)``, built on first use."""
+        entry = self._years.get(year)
+        if entry is None:
+            first = date(year, 1, 1)
+            days = (
+                first + timedelta(n)
+                for n in range(366 if calendar.isleap(year) else 365)
+            )
+            flags = (
+                day.weekday() not in self.weekly_offs and day not in self.holidays
+                for day in days
+            )
+            # Racing threads build identical arrays; either may win
+            entry = self._years[year] = (
+                first.toordinal(),
+                array("i", accumulate(flags, initial=0)),
+            )
+        return entry
+
+
+class CalendarCache:
+    """Every location's ``WorkCalendar``, loaded together and kept ``ttl`` seconds.
+
+    Locations and holidays are small tables, so a load is two queries.
+    Writes in this worker call ``invalidate``; other workers pick them up
+    when their copy expires.
+    """
+
+    def __init__(self, ttl: float = REFERENCE_CACHE_TTL):
+        self.ttl = ttl
+        self._calendars = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def for_location(self, db: Session, location_id: Optional[int]) -> WorkCalendar:
+        calendars = self._get(db)
+        return calendars.get(location_id, calendars[None])
+
+    def invalidate(self) -> None:
+        self._calendars = None
+
+    # === Helper Functions ===
+    def _get(self, db: Session) -> Dict[Optional[int], WorkCalendar]:
+        calendars = self._calendars
+        if calendars is not None and time.monotonic() < self._expires_at:
+            return calendars
+        with self._lock:
+            if self._calendars is None or time.monotonic() >= self._expires_at:
+                self._calendars = self._load(db)
+                self._expires_at = time.monotonic() + self.ttl
+            return self._calendars
+
+    def _load(self, db: Session) -> Dict[Optional[int], WorkCalendar]:
+        holidays: Dict[Optional[int], List[date]] = {}
+        for day, location_id in db.query(Holiday.holiday_date, Holiday.fk_location_id):
+            holidays.setdefault(location_id, []).append(day)
+        everywhere = holidays.get(None, [])
+        calendars = {
+            None: WorkCalendar(parse_weekly_offs(DEFAULT_WEEKLY_OFFS), everywhere)
+        }
+        for location_id, weekly_offs in db.query(
+            WorkLocation.location_id, WorkLocation.weekly_offs
+        ):
+            calendars[location_id] = WorkCalendar(
+                parse_weekly_offs(weekly_offs),
+                everywhere + holidays.get(location_id, []),
+            )
+        return calendars
+
+
+calendar_cache = CalendarCache()
+
+
+# === WORKING DAYS ===
+def employee_working_days(
+    db: Session, location_id: Optional[int], start: date, end: date
+) -> int:
+    return calendar_cache.for_location(db, location_id).working_days(start, end)
+
+
+def get_my_working_days(db: Session, user: dict, start: date, end: date) -> dict:
+    _check_date_range(start, end, WORKING_DAYS_MAX_RANGE)
+    employee = db.get(Employee, user["id"])
+    return {
+        "start_date": start,
+        "end_date": end,
+        "working_days": employee_working_days(db, employee.fk_location_id, start, end),
+    }
+
+
+# === ADMIN: LOCATIONS & HOLIDAYS ===
+def get_locations(db: Session, user: dict) -> List[WorkLocation]:
+    _require_admin(user)
+    return db.query(WorkLocation).order_by(WorkLocation.location_id).all()
+
+
+def create_location(
+    db: Session, location_in: WorkLocationCreate, user: dict
+) -> WorkLocation:
+    _require_admin(user)
+    exists = (
+        db.query(WorkLocation)
+        .filter(WorkLocation.location_name.ilike(location_in.location_name))
+        .first()
+    )
+    if exists:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Location '{location_in.location_name}' already exists",
+        )
+    location = WorkLocation(**location_in.model_dump())
+    db.add(location)
+    db.commit()
+    db.refresh(location)
+    calendar_cache.invalidate()
+    return location
+
+
+def get_holidays(db: Session, user: dict, year: int, page: PageParams) -> List[Holiday]:
+    _require_admin(user)
+    query = db.query(Holiday).filter(
+        Holiday.holiday_date >= date(year, 1, 1),
+        Holiday.holiday_date <= date(year, 12, 31),
+    )
+    return paginate(query, page, Holiday.holiday_date, Holiday.holiday_id)
+
+
+def create_holiday(db: Session, holiday_in: HolidayCreate, user: dict) -> Holiday:
+    _require_admin(user)
+    if holiday_in.fk_location_id is not None and not db.get(
+        WorkLocation, holiday_in.fk_location_id
+    ):
+        raise HTTPException(status_code=404, detail="Location not found")
+    exists = (
+        db.query(Holiday)
+        .filter(
+            Holiday.holiday_date == holiday_in.holiday_date,
+            # None compiles to IS NULL: one company-wide holiday per date
+            Holiday.fk_location_id == holiday_in.fk_location_id,
+        )
+        .first()
+    )
+    if exists:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Holiday already exists on {holiday_in.holiday_date}",
+        )
+    holiday = Holiday(**holiday_in.model_dump())
+    db.add(holiday)
+    db.commit()
+    db.refresh(holiday)
+    calendar_cache.invalidate()
+    return holiday
+
+
+def delete_holiday(db: Session, holiday_id: int, user: dict) -> None:
+    _require_admin(user)
+    holiday = db.get(Holiday, holiday_id)
+    if not holiday:
+        raise HTTPException(status_code=404, detail="Holiday not found")
+    db.delete(holiday)
+    db.commit()
+    calendar_cache.invalidate()
+
+
+# === ADMIN: BULK RECOMPUTE ===
+def recompute_leave_days(db: Session, user: dict) -> dict:
+    """Recount ``total_days`` of every leave application in one ordered pass.
+
+    Each row costs two prefix-sum lookups against its location's calendar,
+    changed rows are written back in batches, and approved applications
+    whose count changed have the difference returned to (or taken from)
+    their balance through the leave ledger. One commit covers it all.
+    """
+    _require_admin(user)
+    start = time.perf_counter()
+    rows = (
+        db.query(
+            LeaveApplication.leave_application_id,
+            LeaveApplication.from_date,
+            LeaveApplication.end_date,
+            LeaveApplication.total_days,
+            LeaveApplication.leave_status,
+            LeaveApplication.fk_employee_id,
+            Employee.fk_location_id,
+        )
+        .outerjoin(Employee, Employee.employee_id == LeaveApplication.fk_employee_id)
+        .order_by(LeaveApplication.leave_application_id)
+    )
+
+    # Loaded before the cursor opens: no other query may run while it streams
+    # (MySQL cannot interleave unbuffered result sets)
+    calendars = calendar_cache._get(db)
+    checked, changes, balance_deltas = 0, [], Counter()
+    for (
+        app_id,
+        from_date,
+        end_date,
+        old_days,
+        leave_status,
+        employee_id,
+        location,
+    ) in rows.yield_per(RECOMPUTE_BATCH_SIZE):
+        checked += 1
+        location_calendar = calendars.get(location, calendars[None])
+        days = location_calendar.working_days(from_date.date(), end_date.date())
+        if days == old_days:
+            continue
+        changes.append({"leave_application_id": app_id, "total_days": days})
+        if leave_status == Status.Approved:
+            balance_deltas[(employee_id, from_date.year)] += (old_days or 0) - days
+
+    for i in range(0, len(changes), RECOMPUTE_BATCH_SIZE):
+        db.execute(update(LeaveApplication), changes[i : i + RECOMPUTE_BATCH_SIZE])
+    adjust_balances(db, balance_deltas, LedgerReason.Recalculation)
+    db.commit()
+    elapsed = time.perf_counter() - start
+    return {
+        "checked": checked,
+        "updated": len(changes),
+        "balances_adjusted": sum(1 for delta in balance_deltas.values() if delta),
+        "duration_ms": round(elapsed * 1000, 2),
+    }
@@ -1,11 +1,61 @@
-from passlib.context import CryptContext
+import hmac
+import os
+from typing import Optional, Tuple
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
 
+# bcrypt work factor for new hashes. Hashes stored with a different cost are
+# upgraded on the next successful login (see ``verify_and_update``).
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+# Cost used by bulk employee imports. Lowering it makes large imports
+# feasible; those hashes are upgraded to BCRYPT_ROUNDS on first login.
+IMPORT_BCRYPT_ROUNDS = int(os.getenv("IMPORT_BCRYPT_ROUNDS", BCRYPT_ROUNDS))
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+# bcrypt only looks at the first 72 bytes; newer releases refuse longer input.
+_BCRYPT_MAX_BYTES = 72
+
+
+def _secret(password: str) -> bytes:
+    return password.encode("utf-8")[:_BCRYPT_MAX_BYTES]
+
+
+def is_password_hash(value: str) -> bool:
+    return value.startswith(_BCRYPT_PREFIXES)
+
+
+def hash_password(password: str, rounds: Optional[int] = None) -> str:
+    salt = bcrypt.gensalt(rounds or BCRYPT_ROUNDS)
+    return bcrypt.hashpw(_secret(password), salt).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    if not is_password_hash(hashed_password):
+        return False
+    try:
+        return bcrypt.checkpw(_secret(plain_password), hashed_password.encode())
+    except ValueError:
+        return False
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    if not is_password_hash(hashed_password):
+        return True
+    return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+
+
+def verify_and_update(
+    plain_password: str, stored_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Check a password and return a replacement hash when one is due.
+
+    Rows still holding a legacy plaintext password are accepted once and
+    upgraded, as are hashes made with a different ``BCRYPT_ROUNDS``.
+    """
+    if is_password_hash(stored_password):
+        ok = verify_password(plain_password, stored_password)
+    else:
+        ok = hmac.compare_digest(_secret(plain_password), _secret(stored_password))
+    if ok and needs_rehash(stored_password):
+        return True, hash_password(plain_password)
+    return ok, None
@@ -1,8 +1,11 @@
 import os
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from database.sqlite import enable_sqlite_pragmas
+from common.metrics import TimedAsyncQueuePool, TimedQueuePool
 
 # Load environment variables
 load_dotenv()
@@ -16,7 +19,24 @@ if DB_CONNECT == "local":
     engine = create_engine(
         SQLALCHEMY_DATABASE_URL,
         connect_args={"check_same_thread": False},  # Required for SQLite
+        poolclass=TimedQueuePool,  # QueuePool that reports checkout waits
+        # SQLAlchemy's defaults; serve.py lowers them to share a budget
+        pool_size=int(os.getenv("DB_POOL_SIZE", 5)),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 10)),
     )
+    # Async engine on the same file for handlers that use AsyncSession
+    ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./greythr.db"
+    # Pooled like the sync engine (aiosqlite would default to NullPool and
+    # open connections without limit), so the connection budget covers both
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        poolclass=TimedAsyncQueuePool,
+        pool_size=int(os.getenv("DB_ASYNC_POOL_SIZE", 5)),
+        max_overflow=int(os.getenv("DB_ASYNC_MAX_OVERFLOW", 10)),
+    )
+    # WAL, relaxed fsync, bigger cache, busy wait and foreign keys
+    enable_sqlite_pragmas(engine)
+    enable_sqlite_pragmas(async_engine.sync_engine)
 else:
     # RDS MySQL connection details
     DB_USER = os.getenv("DB_USER")
@@ -32,12 +52,28 @@ else:
     # Production-ready MySQL engine
     engine = create_engine(
         SQLALCHEMY_DATABASE_URL,
+        poolclass=TimedQueuePool,  # QueuePool that reports checkout waits
         pool_pre_ping=True,  # Validates connections before use
         pool_recycle=3600,  # Recycle connections every hour
         pool_size=int(os.getenv("DB_POOL_SIZE", 10)),
         max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 20)),
     )
 
+    # Async engine for handlers that use AsyncSession. It has its own pool,
+    # so it can be sized separately from the sync one.
+    ASYNC_DATABASE_URL = (
+        f"mysql+aiomysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    )
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        poolclass=TimedAsyncQueuePool,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        pool_size=int(os.getenv("DB_ASYNC_POOL_SIZE", 20)),
+        max_overflow=int(os.getenv("DB_ASYNC_MAX_OVERFLOW", 20)),
+    )
+
 # sessionlocal = sessionmaker(autocommit=True, autoflush=True, bind=engine)
 sessionlocal = sessionmaker(autoflush=True, bind=engine)
+async_sessionlocal = async_sessionmaker(async_engine, expire_on_commit=False)
 Base = declarative_base()
@@ -3,11 +3,14 @@ from sqlalchemy import (
     Column,
     Integer,
     String,
+    Date,
     DateTime,
     Float,
     ForeignKey,
     Boolean,
     Enum,
+    Index,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship, declarative_base
 
@@ -44,6 +47,36 @@ class Role(Base):
     employees = relationship("Employee", back_populates="role")
 
 
+# -------------------------
+# Work Calendar Tables
+# -------------------------
+class WorkLocation(Base):
+    """A site with its own weekly offs, stored as day names ("Sat,Sun")."""
+
+    __tablename__ = "work_location"
+
+    location_id = Column(Integer, primary_key=True, autoincrement=True)
+    location_name = Column(String(100), nullable=False, unique=True)
+    weekly_offs = Column(String(32), nullable=False, default="Sat,Sun")
+
+    employees = relationship("Employee", back_populates="location")
+
+
+class Holiday(Base):
+    """A public holiday at one location, or everywhere when it has none."""
+
+    __tablename__ = "holiday"
+
+    holiday_id = Column(Integer, primary_key=True, autoincrement=True)
+    holiday_date = Column(Date, nullable=False)
+    holiday_name = Column(String(100), nullable=False)
+    fk_location_id = Column(
+        Integer, ForeignKey("work_location.location_id"), nullable=True
+    )
+
+    __table_args__ = (Index("ix_holiday_date", "holiday_date"),)
+
+
 # -------------------------
 # Employee Table
 # -------------------------
@@ -62,9 +95,15 @@ class Employee(Base):
     fk_department_id = Column(Integer, ForeignKey("department.department_id"))
     fk_role_id = Column(Integer, ForeignKey("role.role_id"))
     fk_manager_id = Column(Integer, ForeignKey("employee.employee_id"), nullable=True)
+    fk_location_id = Column(
+        Integer, ForeignKey("work_location.location_id"), nullable=True
+    )
+
+    __table_args__ = (Index("ix_employee_manager", "fk_manager_id"),)
 
     department = relationship("Department", back_populates="employees")
     role = relationship("Role", back_populates="employees")
+    location = relationship("WorkLocation", back_populates="employees")
     manager = relationship(
         "Employee", remote_side=[employee_id], backref="subordinates"
     )
@@ -73,6 +112,7 @@ class Employee(Base):
     payslips = relationship("Payslip", back_populates="employee")
     salaries = relationship("Salary", back_populates="employee")
     attendances = relationship("Attendance", back_populates="employee")
+    attendance_days = relationship("AttendanceDaily", back_populates="employee")
     regularizations = relationship(
         "Regularization",
         foreign_keys="[Regularization.fk_employee_id]",
@@ -91,6 +131,30 @@ class Employee(Base):
     )
 
 
+# -------------------------
+# Employee Hierarchy (closure) Table
+# -------------------------
+class EmployeeHierarchy(Base):
+    """One row per (ancestor, descendant) pair in the reporting tree.
+
+    Every employee is also paired with itself at depth 0, so "X's tree" and
+    "is Y under X" are single indexed lookups instead of recursive walks.
+    """
+
+    __tablename__ = "employee_hierarchy"
+
+    ancestor_id = Column(Integer, ForeignKey("employee.employee_id"), primary_key=True)
+    descendant_id = Column(
+        Integer, ForeignKey("employee.employee_id"), primary_key=True
+    )
+    depth = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_employee_hierarchy_ancestor_depth", "ancestor_id", "depth"),
+        Index("ix_employee_hierarchy_descendant", "descendant_id"),
+    )
+
+
 # -------------------------
 # Expense Claim Table
 # -------------------------
@@ -106,6 +170,18 @@ class ExpenseClaim(Base):
     fk_employee_id = Column(Integer, ForeignKey("employee.employee_id"))
     fk_manager_id = Column(Integer, ForeignKey("employee.employee_id"))
 
+    __table_args__ = (
+        Index("ix_expense_claim_employee_date", "fk_employee_id", "claim_date"),
+        Index(
+            "ix_expense_claim_manager_status_date",
+            "fk_manager_id",
+            "claim_status",
+            "claim_date",
+        ),
+        Index("ix_expense_claim_status", "claim_status"),
+        Index("ix_expense_claim_date", "claim_date"),
+    )
+
     employee = relationship(
         "Employee", foreign_keys=[fk_employee_id], back_populates="expense_claims"
     )
@@ -128,6 +204,11 @@ class Payslip(Base):
     fk_employee_id = Column(Integer, ForeignKey("employee.employee_id"))
     employee = relationship("Employee", back_populates="payslips")
 
+    __table_args__ = (
+        Index("ix_payslip_employee_month", "fk_employee_id", "payslip_month"),
+        Index("ix_payslip_month", "payslip_month"),
+    )
+
 
 # -------------------------
 # Salary Table
@@ -142,6 +223,11 @@ class Salary(Base):
     fk_employee_id = Column(Integer, ForeignKey("employee.employee_id"))
     employee = relationship("Employee", back_populates="salaries")
 
+    __table_args__ = (
+        Index("ix_salary_employee_year", "fk_employee_id", "salary_year"),
+        Index("ix_salary_year", "salary_year"),
+    )
+
 
 # -------------------------
 # Attendance Table
@@ -155,6 +241,37 @@ class Attendance(Base):
     fk_employee_id = Column(Integer, ForeignKey("employee.employee_id"))
     employee = relationship("Employee", back_populates="attendances")
 
+    __table_args__ = (
+        Index("ix_attendance_employee_punch", "fk_employee_id", "punch_time"),
+        Index("ix_attendance_punch", "punch_time"),
+    )
+
+
+# -------------------------
+# Attendance Daily Rollup Table
+# -------------------------
+class AttendanceDaily(Base):
+    """One row per employee per day, kept in step with Attendance punches."""
+
+    __tablename__ = "attendance_daily"
+
+    attendance_daily_id = Column(Integer, primary_key=True, autoincrement=True)
+    work_date = Column(Date, nullable=False)
+    first_punch = Column(DateTime, nullable=False)
+    last_punch = Column(DateTime, nullable=False)
+    punch_count = Column(Integer, nullable=False, default=0)
+    worked_seconds = Column(Integer, nullable=False, default=0)
+
+    fk_employee_id = Column(Integer, ForeignKey("employee.employee_id"))
+    employee = relationship("Employee", back_populates="attendance_days")
+
+    __table_args__ = (
+        UniqueConstraint(
+            "fk_employee_id", "work_date", name="uq_attendance_daily_employee_date"
+        ),
+        Index("ix_attendance_daily_date", "work_date"),
+    )
+
 
 # -------------------------
 # Regularization Table
@@ -171,6 +288,20 @@ class Regularization(Base):
     fk_employee_id = Column(Integer, ForeignKey("employee.employee_id"))
     fk_manager_id = Column(Integer, ForeignKey("employee.employee_id"))
 
+    __table_args__ = (
+        Index(
+            "ix_regularization_employee_start",
+            "fk_employee_id",
+            "regularization_start_time",
+        ),
+        Index(
+            "ix_regularization_manager_status_start",
+            "fk_manager_id",
+            "regularization_status",
+            "regularization_start_time",
+        ),
+    )
+
     employee = relationship(
         "Employee", foreign_keys=[fk_employee_id], back_populates="regularizations"
     )
@@ -195,6 +326,8 @@ class Leave(Base):
     fk_employee_id = Column(Integer, ForeignKey("employee.employee_id"))
     employee = relationship("Employee", back_populates="leaves")
 
+    __table_args__ = (Index("ix_leave_employee_year", "fk_employee_id", "assign_year"),)
+
 
 # -------------------------
 # Leave Application Table
@@ -211,6 +344,74 @@ class LeaveApplication(Base):
     fk_employee_id = Column(Integer, ForeignKey("employee.employee_id"))
     fk_manager_id = Column(Integer, ForeignKey("employee.employee_id"))
 
+    __table_args__ = (
+        # Serves per-employee listings and the create-time overlap check
+        Index(
+            "ix_leave_application_employee_range",
+            "fk_employee_id",
+            "from_date",
+            "end_date",
+        ),
+        Index(
+            "ix_leave_application_manager_status_from",
+            "fk_manager_id",
+            "leave_status",
+            "from_date",
+        ),
+        Index("ix_leave_application_from", "from_date"),
+    )
+
     employee = relationship(
         "Employee", foreign_keys=[fk_employee_id], back_populates="leave_applications"
     )
+
+
+# -------------------------
+# Leave Ledger Table
+# -------------------------
+class LedgerReason(str, enum.Enum):
+    Approval = "Approval"
+    Reversal = "Reversal"
+    Reconciliation = "Reconciliation"
+    Recalculation = "Recalculation"
+
+
+class LeaveLedgerEntry(Base):
+    """One balance change on a ``Leave`` row, written in the same transaction.
+
+    ``Leave.balance_leave`` is ``total_leave`` plus the sum of its entries'
+    ``delta``. Like ``DataVersion``, the ids are not foreign keys, so the
+    audit trail outlives deleted employees and applications.
+    """
+
+    __tablename__ = "leave_ledger"
+
+    ledger_entry_id = Column(Integer, primary_key=True, autoincrement=True)
+    employee_id = Column(Integer, nullable=False)
+    assign_year = Column(Integer, nullable=False)
+    leave_application_id = Column(Integer, nullable=True)
+    delta = Column(Integer, nullable=False)
+    reason = Column(Enum(LedgerReason), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_leave_ledger_employee_year", "employee_id", "assign_year"),
+    )
+
+
+# -------------------------
+# Data Version Table
+# -------------------------
+class DataVersion(Base):
+    """Change counter per employee per resource, bumped by every write.
+
+    Conditional GETs compare against it with one primary-key read instead of
+    re-running the list query. ``employee_id`` is deliberately not a foreign
+    key: a counter left behind by a deleted employee is harmless.
+    """
+
+    __tablename__ = "data_version"
+
+    resource = Column(String(32), primary_key=True)
+    employee_id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,36 @@
+# database/sqlite.py
+import os
+from typing import Dict
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Applied to every new connection of the local (DB_CONNECT=local) engines
+SQLITE_PRAGMAS: Dict[str, str] = {
+    # Readers keep reading while a write is in progress, and vice versa
+    "journal_mode": "WAL",
+    # In WAL mode this syncs at checkpoints instead of on every commit;
+    # a power cut can lose the last commits but never corrupts the file
+    "synchronous": "NORMAL",
+    # Wait for a competing writer instead of failing with "database is locked"
+    "busy_timeout": str(int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))),
+    # Negative sizes are in KiB
+    "cache_size": f"-{int(os.getenv('SQLITE_CACHE_SIZE_KB', 65536))}",
+    "mmap_size": str(int(os.getenv("SQLITE_MMAP_SIZE_MB", 256)) * 1024 * 1024),
+    "foreign_keys": "ON",
+}
+
+
+def enable_sqlite_pragmas(
+    engine: Engine, pragmas: Dict[str, str] = SQLITE_PRAGMAS
+) -> None:
+    """Run ``PRAGMA name=value`` for each of ``pragmas`` on every new connection.
+
+    For an async engine pass its ``sync_engine``.
+    """
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
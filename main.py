@@ -1,7 +1,19 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from database.database import engine
+from database.database import async_engine, engine
 from database import models
+from common.pagination import NEXT_CURSOR_HEADER
+from common.conditional import ETAG_HEADER
+from common.query_stats import QueryStatsMiddleware
+from common.health import ReadinessProbe
+from common.metrics import (
+    METRICS_CONTENT_TYPE,
+    MetricsMiddleware,
+    render_metrics,
+    watch_engine,
+)
+from schema.health_schema import LivenessResponse, ReadinessResponse
 from routers.auth import auth_router
 from routers.admin.admin_api import admin_router
 from routers.manager.manager_api import manager_router
@@ -21,13 +33,47 @@ def health_check():
     return {"status": "Welcome to My Grehthrapp By Kishan"}
 
 
+readiness = ReadinessProbe({"sync": engine, "async": async_engine})
+
+
+# Liveness: the process is up and its event loop is turning. No I/O, so a
+# database outage does not get healthy containers restarted.
+@app.get("/health/live", response_model=LivenessResponse, tags=["Health"])
+async def liveness():
+    return {"status": "alive"}
+
+
+# Readiness: the database answers and the loop is not backed up. 503 takes
+# the container out of the load balancer until it recovers.
+@app.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse}},
+    tags=["Health"],
+)
+async def readiness_check():
+    ready, report = await readiness.check()
+    return JSONResponse(report, status_code=200 if ready else 503)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER, "Server-Timing"],
 )
+app.add_middleware(QueryStatsMiddleware)
+# Added last so it is outermost and times the whole stack
+app.add_middleware(MetricsMiddleware)
+watch_engine("sync", engine)
+watch_engine("async", async_engine.sync_engine)
 
 
 app.include_router(auth_router)
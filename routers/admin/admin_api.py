@@ -11,6 +11,8 @@ from . import (
     admin_payslip_api,
     admin_leave_application_api,
     admin_expense_claim_api,
+    admin_calendar_api,
+    admin_timesheet_api,
 )
 
 admin_router = APIRouter(prefix="/admin")
@@ -25,3 +27,5 @@ admin_router.include_router(admin_regularization_api.router)
 admin_router.include_router(admin_payslip_api.router)
 admin_router.include_router(admin_leave_application_api.router)
 admin_router.include_router(admin_expense_claim_api.router)
+admin_router.include_router(admin_calendar_api.router)
+admin_router.include_router(admin_timesheet_api.router)
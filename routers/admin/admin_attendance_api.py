@@ -1,44 +1,85 @@
 # routers/admin_attendance_api.py
 from fastapi import APIRouter, Query
 from typing import List
-from schema.attendance_schema import AttendanceResponse
+from schema.attendance_schema import AttendanceDailyResponse, AttendanceResponse
 from common.attendance import (
     get_all_attendance,
     get_attendance_by_date_all_employees,
     get_attendance_by_date_one_employee,
     get_all_attendance_of_employee,
+    export_all_attendance,
+    get_attendance_summary_by_month,
 )
-from routers.auth import db_dependency, user_dependency
+from routers.auth import async_db_dependency, db_dependency, user_dependency
+from common.pagination import page_dependency
+from common.export import ExportFormat
 from datetime import datetime
 
 router = APIRouter(prefix="/attendance", tags=["Admin - Attendance"])
 
 
 @router.get("/", response_model=List[AttendanceResponse])
-def list_all_attendance(db: db_dependency, user: user_dependency):
-    return get_all_attendance(db=db, user=user)
+async def list_all_attendance(
+    db: async_db_dependency, user: user_dependency, page: page_dependency
+):
+    return await get_all_attendance(db=db, user=user, page=page)
+
+
+@router.get("/export", summary="Stream all attendance as NDJSON or CSV")
+def export_attendance(
+    db: db_dependency,
+    user: user_dependency,
+    format: ExportFormat = ExportFormat.ndjson,
+):
+    return export_all_attendance(db=db, user=user, fmt=format)
+
+
+@router.get(
+    "/summary/month/{year}/{month}", response_model=List[AttendanceDailyResponse]
+)
+def get_attendance_summary_for_month(
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
+):
+    return get_attendance_summary_by_month(
+        db=db, user=user, year=year, month=month, page=page
+    )
 
 
 @router.get("/date/{punch_date}", response_model=List[AttendanceResponse])
 def get_all_employees_attendance_on_date(
-    punch_date: datetime, db: db_dependency, user: user_dependency
+    punch_date: datetime,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
 ):
-    return get_attendance_by_date_all_employees(db=db, punch_date=punch_date, user=user)
+    return get_attendance_by_date_all_employees(
+        db=db, punch_date=punch_date, user=user, page=page
+    )
 
 
 @router.get(
     "/employee/{employee_id}/date/{punch_date}", response_model=List[AttendanceResponse]
 )
 def get_one_employee_attendance_on_date(
-    employee_id: int, punch_date: datetime, db: db_dependency, user: user_dependency
+    employee_id: int,
+    punch_date: datetime,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
 ):
     return get_attendance_by_date_one_employee(
-        db=db, employee_id=employee_id, punch_date=punch_date, user=user
+        db=db, employee_id=employee_id, punch_date=punch_date, user=user, page=page
     )
 
 
 @router.get("/employee/{employee_id}", response_model=List[AttendanceResponse])
 def get_all_attendance_of_one_employee(
-    employee_id: int, db: db_dependency, user: user_dependency
+    employee_id: int, db: db_dependency, user: user_dependency, page: page_dependency
 ):
-    return get_all_attendance_of_employee(db=db, employee_id=employee_id, user=user)
+    return get_all_attendance_of_employee(
+        db=db, employee_id=employee_id, user=user, page=page
+    )
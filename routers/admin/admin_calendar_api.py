@@ -0,0 +1,61 @@
+# api/admin_calendar_api.py
+from fastapi import APIRouter, Query
+from typing import List
+from schema.calendar_schema import (
+    HolidayCreate,
+    HolidayResponse,
+    LeaveDaysRecomputeResponse,
+    WorkLocationCreate,
+    WorkLocationResponse,
+)
+from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
+from common.work_calendar import (
+    create_holiday,
+    create_location,
+    delete_holiday,
+    get_holidays,
+    get_locations,
+    recompute_leave_days,
+)
+
+router = APIRouter(prefix="/calendar", tags=["Admin - Calendar"])
+
+
+@router.get("/locations", response_model=List[WorkLocationResponse])
+def list_locations_endpoint(db: db_dependency, user: user_dependency):
+    return get_locations(db=db, user=user)
+
+
+@router.post("/locations", response_model=WorkLocationResponse, status_code=201)
+def create_location_endpoint(
+    location_in: WorkLocationCreate, db: db_dependency, user: user_dependency
+):
+    return create_location(db=db, location_in=location_in, user=user)
+
+
+@router.get("/holidays", response_model=List[HolidayResponse])
+def list_holidays_endpoint(
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
+    year: int = Query(..., ge=2000, le=2100),
+):
+    return get_holidays(db=db, user=user, year=year, page=page)
+
+
+@router.post("/holidays", response_model=HolidayResponse, status_code=201)
+def create_holiday_endpoint(
+    holiday_in: HolidayCreate, db: db_dependency, user: user_dependency
+):
+    return create_holiday(db=db, holiday_in=holiday_in, user=user)
+
+
+@router.delete("/holidays/{holiday_id}", status_code=204)
+def delete_holiday_endpoint(holiday_id: int, db: db_dependency, user: user_dependency):
+    delete_holiday(db=db, holiday_id=holiday_id, user=user)
+
+
+@router.post("/recompute-leave-days", response_model=LeaveDaysRecomputeResponse)
+def recompute_leave_days_endpoint(db: db_dependency, user: user_dependency):
+    return recompute_leave_days(db=db, user=user)
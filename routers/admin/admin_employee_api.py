@@ -1,8 +1,16 @@
 # routers/admin_employee_api.py
-from fastapi import APIRouter, status
+from fastapi import APIRouter, UploadFile, status
 from typing import List
-from schema.employee_schema import EmployeeResponse, EmployeeCreate, EmployeeUpdate
-from routers.auth import db_dependency, user_dependency
+from schema.employee_schema import (
+    EmployeeCreate,
+    EmployeeImportResponse,
+    EmployeeResponse,
+    EmployeeUpdate,
+)
+from routers.auth import async_db_dependency, db_dependency, user_dependency
+from common.pagination import page_dependency
+from common.export import ExportFormat
+from common.employee_import import import_employees
 from common.employee import (
     get_all_employees,
     get_employee_by_id,
@@ -18,15 +26,17 @@ router = APIRouter(prefix="/employees", tags=["Admin - Employees"])
 
 
 @router.get("/", response_model=List[EmployeeResponse])
-def list_all_employees_endpoint(db: db_dependency, user: user_dependency):
-    return get_all_employees(db=db, user=user)
+async def list_all_employees_endpoint(
+    db: async_db_dependency, user: user_dependency, page: page_dependency
+):
+    return await get_all_employees(db=db, user=user, page=page)
 
 
 @router.get("/id/{employee_id}", response_model=EmployeeResponse)
-def retrieve_employee_by_id_endpoint(
-    employee_id: int, db: db_dependency, user: user_dependency
+async def retrieve_employee_by_id_endpoint(
+    employee_id: int, db: async_db_dependency, user: user_dependency
 ):
-    return get_employee_by_id(employee_id=employee_id, db=db, user=user)
+    return await get_employee_by_id(employee_id=employee_id, db=db, user=user)
 
 
 @router.get("/email/{email}", response_model=EmployeeResponse)
@@ -43,6 +53,23 @@ def register_employee_endpoint(
     return create_employee(employee_data=employee, db=db, user=user)
 
 
+@router.post(
+    "/import",
+    response_model=EmployeeImportResponse,
+    summary="Create employees from a CSV or NDJSON file, with a per-row error report",
+)
+def import_employees_endpoint(
+    file: UploadFile,
+    db: db_dependency,
+    user: user_dependency,
+    format: ExportFormat = ExportFormat.csv,
+    dry_run: bool = False,
+):
+    return import_employees(
+        db=db, file=file.file, fmt=format, user=user, dry_run=dry_run
+    )
+
+
 @router.put("/id/{employee_id}", response_model=EmployeeResponse)
 def update_employee_by_id_endpoint(
     employee_id: int,
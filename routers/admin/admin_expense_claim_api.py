@@ -7,12 +7,15 @@ from schema.expense_claim_schema import (
     Status,
 )
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
+from common.export import ExportFormat
 from common.common import _require_admin
 from common.expense_claim import (
     get_claim_by_id_admin,
     get_all_claims_by_employee_admin,
     get_claims_by_status_admin,
     get_claims_by_month_admin,
+    export_claims_by_month_admin,
     admin_update_status,
     get_claims_by_employee_and_month_any,
 )
@@ -27,32 +30,62 @@ def get_exp_by_id(claim_id: int, db: db_dependency, user: user_dependency):
 
 
 @router.get("/employee/{emp_id}", response_model=List[ExpenseClaimResponse])
-def get_all_exp_by_emp(emp_id: int, db: db_dependency, user: user_dependency):
+def get_all_exp_by_emp(
+    emp_id: int, db: db_dependency, user: user_dependency, page: page_dependency
+):
     _require_admin(user)
-    return get_all_claims_by_employee_admin(db=db, emp_id=emp_id)
+    return get_all_claims_by_employee_admin(db=db, emp_id=emp_id, page=page)
 
 
 @router.get("/status/{status}", response_model=List[ExpenseClaimResponse])
-def get_exp_by_status(status: Status, db: db_dependency, user: user_dependency):
+def get_exp_by_status(
+    status: Status, db: db_dependency, user: user_dependency, page: page_dependency
+):
     _require_admin(user)
-    return get_claims_by_status_admin(db=db, status=status)
+    return get_claims_by_status_admin(db=db, status=status, page=page)
 
 
 @router.get("/month/{year}/{month}", response_model=List[ExpenseClaimResponse])
-def get_exp_by_month(year: int, month: int, db: db_dependency, user: user_dependency):
+def get_exp_by_month(
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
+):
     _require_admin(user)
-    return get_claims_by_month_admin(db=db, year=year, month=month)
+    return get_claims_by_month_admin(db=db, year=year, month=month, page=page)
+
+
+@router.get(
+    "/month/{year}/{month}/export",
+    summary="Stream a month of expense claims as NDJSON or CSV",
+)
+def export_exp_by_month(
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    format: ExportFormat = ExportFormat.ndjson,
+):
+    _require_admin(user)
+    return export_claims_by_month_admin(db=db, year=year, month=month, fmt=format)
 
 
 @router.get(
     "/employee/{emp_id}/month/{year}/{month}", response_model=List[ExpenseClaimResponse]
 )
 def get_exp_by_employeeid_and_month(
-    emp_id: int, year: int, month: int, db: db_dependency, user: user_dependency
+    emp_id: int,
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
 ):
     _require_admin(user)
     return get_claims_by_employee_and_month_any(
-        db=db, emp_id=emp_id, year=year, month=month
+        db=db, emp_id=emp_id, year=year, month=month, page=page
     )
 
 
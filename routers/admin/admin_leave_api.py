@@ -1,6 +1,6 @@
 # api/admin_leave_api.py
-from fastapi import APIRouter, HTTPException, status
-from typing import Annotated, List
+from fastapi import APIRouter, HTTPException, Query, status
+from typing import Annotated, List, Optional
 from common.leave import (
     get_leave_by_employee_and_year,
     get_all_leaves_by_employee_id,
@@ -9,7 +9,9 @@ from common.leave import (
     delete_leave_by_employee_and_year,
 )
 import schema.leave_schema as leave_schema
+from common.leave_ledger import reconcile_leave_balances
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
 from common.common import _require_admin
 
 router = APIRouter(prefix="/leaves", tags=["Admin - Leave"])
@@ -27,10 +29,10 @@ def get_employee_leave_by_year_endpoint(
 
 @router.get("/employee/{employee_id}", response_model=List[leave_schema.LeaveResponse])
 def get_all_leave_by_empid_endpoint(
-    employee_id: int, db: db_dependency, user: user_dependency
+    employee_id: int, db: db_dependency, user: user_dependency, page: page_dependency
 ):
     _require_admin(user)
-    return get_all_leaves_by_employee_id(db, employee_id)
+    return get_all_leaves_by_employee_id(db, employee_id, page=page)
 
 
 @router.post("/", response_model=leave_schema.LeaveResponse, status_code=201)
@@ -41,6 +43,17 @@ def post_leave_endpoint(
     return create_leave(db, leave_in)
 
 
+@router.post("/reconcile", response_model=leave_schema.LeaveReconcileResponse)
+def reconcile_leave_balances_endpoint(
+    db: db_dependency,
+    user: user_dependency,
+    year: Optional[int] = Query(None, ge=2000, le=2100),
+    fix: bool = False,
+):
+    _require_admin(user)
+    return reconcile_leave_balances(db, year=year, fix=fix)
+
+
 @router.delete("/{leave_id}", status_code=204)
 def delete_leave_endpoint(leave_id: int, db: db_dependency, user: user_dependency):
     _require_admin(user)
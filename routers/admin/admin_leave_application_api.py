@@ -3,20 +3,30 @@ from fastapi import APIRouter
 from typing import List
 from schema.leave_application_schema import (
     LeaveApplicationResponse,
+    LeaveOverlapReport,
     LeaveApplicationStatusUpdate,
 )
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
 from common.common import _require_admin
 from common.leave_application import (
     get_application_by_id_admin,
     get_all_by_employee_admin,
     get_all_by_month_admin,
     admin_update_status,
+    get_overlap_report,
 )
 
 router = APIRouter(prefix="/leave-applications", tags=["Admin - Leave Applications"])
 
 
+# Declared before /{app_id} so "overlaps" is not read as an id
+@router.get("/overlaps", response_model=LeaveOverlapReport)
+def get_overlaps(db: db_dependency, user: user_dependency):
+    _require_admin(user)
+    return get_overlap_report(db=db)
+
+
 @router.get("/{app_id}", response_model=LeaveApplicationResponse)
 def get_application_by_id(app_id: int, db: db_dependency, user: user_dependency):
     _require_admin(user)
@@ -24,17 +34,23 @@ def get_application_by_id(app_id: int, db: db_dependency, user: user_dependency)
 
 
 @router.get("/employee/{emp_id}", response_model=List[LeaveApplicationResponse])
-def get_all_leave_by_employeeid(emp_id: int, db: db_dependency, user: user_dependency):
+def get_all_leave_by_employeeid(
+    emp_id: int, db: db_dependency, user: user_dependency, page: page_dependency
+):
     _require_admin(user)
-    return get_all_by_employee_admin(db=db, emp_id=emp_id)
+    return get_all_by_employee_admin(db=db, emp_id=emp_id, page=page)
 
 
 @router.get("/month/{year}/{month}", response_model=List[LeaveApplicationResponse])
 def get_all_leave_by_month(
-    year: int, month: int, db: db_dependency, user: user_dependency
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
 ):
     _require_admin(user)
-    return get_all_by_month_admin(db=db, year=year, month=month)
+    return get_all_by_month_admin(db=db, year=year, month=month, page=page)
 
 
 @router.put("/{app_id}/status", response_model=LeaveApplicationResponse)
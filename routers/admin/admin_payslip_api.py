@@ -1,13 +1,17 @@
 # api/admin_payslip_api.py
 from fastapi import APIRouter, status
 from typing import List
-from schema.payslip_schema import PayslipCreate, PayslipResponse
+from schema.payslip_schema import PayrollRunResponse, PayslipCreate, PayslipResponse
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
+from common.export import ExportFormat
 from common.common import _require_admin
 from common.payslip import (
     create_payslip,
+    run_payroll,
     get_payslips_by_employee,
     get_payslips_by_month,
+    export_payslips_by_month,
     get_payslip_by_employee_and_month,
     delete_payslip_by_id,
     delete_payslip_by_employee_and_month,
@@ -24,20 +28,52 @@ def create_payslips(
     return create_payslip(db=db, payslip_in=payslip_in)
 
 
+@router.post(
+    "/run/{year}/{month}",
+    response_model=PayrollRunResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Generate the month's payslips for every employee with a salary",
+)
+def run_payroll_endpoint(
+    year: int, month: int, db: db_dependency, user: user_dependency
+):
+    _require_admin(user)
+    return run_payroll(db=db, year=year, month=month)
+
+
 @router.get("/employee/{employee_id}", response_model=List[PayslipResponse])
 def get_payslips_by_employeeid(
-    employee_id: int, db: db_dependency, user: user_dependency
+    employee_id: int, db: db_dependency, user: user_dependency, page: page_dependency
 ):
     _require_admin(user)
-    return get_payslips_by_employee(db=db, employee_id=employee_id)
+    return get_payslips_by_employee(db=db, employee_id=employee_id, page=page)
 
 
 @router.get("/month/{year}/{month}", response_model=List[PayslipResponse])
 def get_payslips_by_month_endpoint(
-    year: int, month: int, db: db_dependency, user: user_dependency
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
+):
+    _require_admin(user)
+    return get_payslips_by_month(db=db, year=year, month=month, page=page)
+
+
+@router.get(
+    "/month/{year}/{month}/export",
+    summary="Stream a month of payslips as NDJSON or CSV",
+)
+def export_payslips_by_month_endpoint(
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    format: ExportFormat = ExportFormat.ndjson,
 ):
     _require_admin(user)
-    return get_payslips_by_month(db=db, year=year, month=month)
+    return export_payslips_by_month(db=db, year=year, month=month, fmt=format)
 
 
 @router.get(
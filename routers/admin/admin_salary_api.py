@@ -13,6 +13,7 @@ from common.salary import (
 import schema.salary_schema as salary_schema
 from common.common import _require_admin
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
 
 router = APIRouter(prefix="/salaries", tags=["Admin - Salary"])
 
@@ -22,10 +23,10 @@ router = APIRouter(prefix="/salaries", tags=["Admin - Salary"])
 
 @router.get("/year/{year}", response_model=List[salary_schema.SalaryResponse])
 def get_all_employee_salary_by_year(
-    year: int, db: db_dependency, user: user_dependency
+    year: int, db: db_dependency, user: user_dependency, page: page_dependency
 ):
     _require_admin(user)
-    return get_salaries_by_year(db, year=year)  # raises 404 if empty
+    return get_salaries_by_year(db, year=year, page=page)  # raises 404 if empty
 
 
 @router.get(
@@ -43,10 +44,10 @@ def get_specific_employee_salary_by_year(
     response_model=List[salary_schema.SalaryResponse],
 )
 def get_employee_all_salaries(
-    employee_id: int, db: db_dependency, user: user_dependency
+    employee_id: int, db: db_dependency, user: user_dependency, page: page_dependency
 ):
     _require_admin(user)
-    return get_salaries_by_employee_id(db, employee_id=employee_id)
+    return get_salaries_by_employee_id(db, employee_id=employee_id, page=page)
 
 
 @router.post("/", response_model=salary_schema.SalaryResponse, status_code=201)
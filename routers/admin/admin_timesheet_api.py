@@ -0,0 +1,30 @@
+# api/admin_timesheet_api.py
+from fastapi import APIRouter
+from schema.timesheet_schema import TimesheetResponse
+from routers.auth import db_dependency, user_dependency
+from common.export import ExportFormat
+from common.timesheet import export_company_timesheets, get_employee_timesheet_admin
+
+router = APIRouter(prefix="/timesheets", tags=["Admin - Timesheets"])
+
+
+@router.get("/{year}/{month}", summary="Stream every employee's monthly totals")
+def export_timesheets_for_month(
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    format: ExportFormat = ExportFormat.ndjson,
+):
+    return export_company_timesheets(
+        db=db, user=user, year=year, month=month, fmt=format
+    )
+
+
+@router.get("/{year}/{month}/employee/{employee_id}", response_model=TimesheetResponse)
+def get_employee_timesheet_for_month(
+    year: int, month: int, employee_id: int, db: db_dependency, user: user_dependency
+):
+    return get_employee_timesheet_admin(
+        db=db, user=user, employee_id=employee_id, year=year, month=month
+    )
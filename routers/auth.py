@@ -1,14 +1,21 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Request, Form
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
-from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from jose import jwt, JWTError
 from pydantic import BaseModel, EmailStr
-from typing import Annotated
+from typing import Annotated, Optional, Tuple
 from datetime import timedelta, datetime, timezone
 from database.models import Employee
-from database.database import engine, sessionlocal as SessionLocal
+from database.database import (
+    engine,
+    sessionlocal as SessionLocal,
+    async_sessionlocal as AsyncSessionLocal,
+)
+from database.common import hash_password, verify_and_update, verify_password
+from common.token_cache import TokenCache
 import os
+import anyio
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -21,9 +28,32 @@ SECRET_KEY = os.getenv(
     "SECRET_KEY", "d2e2b8fe4827c93ad7ac831a45b2f28c6f33e04f975c0b4b2b1b8d8b38d694a4"
 )
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
-bcrypt_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_bearer = OAuth2PasswordBearer(tokenUrl="auth/token")
 
+# Logins run their blocking DB work on a dedicated, bounded set of worker
+# threads so a login burst can neither stall the event loop nor exhaust the
+# threadpool shared by every other sync endpoint.
+AUTH_THREAD_LIMIT = int(os.getenv("AUTH_THREAD_LIMIT", 8))
+auth_limiter = anyio.CapacityLimiter(AUTH_THREAD_LIMIT)
+
+# Password hashing is CPU bound. bcrypt releases the GIL, so a small pool of
+# threads sized to the cores hashes in parallel. Logins beyond the queue limit
+# are shed with a 503 instead of piling up behind the pool.
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", os.cpu_count() or 1))
+HASH_QUEUE_LIMIT = int(os.getenv("HASH_QUEUE_LIMIT", 64))
+hash_limiter = anyio.CapacityLimiter(HASH_WORKERS)
+_hash_pending = 0
+
+# Verified token claims are cached so repeat requests with the same bearer
+# token skip signature verification until the token expires.
+JWT_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", 1024))
+JWT_CACHE_TTL = float(os.getenv("JWT_CACHE_TTL", 300))
+token_cache = TokenCache(JWT_CACHE_SIZE, JWT_CACHE_TTL)
+
+# Unknown emails are checked against this hash so they cost as much as a
+# wrong password and cannot be told apart by response time.
+_DUMMY_PASSWORD_HASH = hash_password("greythr-dummy-password")
+
 
 class Token(BaseModel):
     access_token: str
@@ -44,12 +74,66 @@ def get_db():  # pragma: no cover
         db.close()
 
 
-# Authenticate user
-def authenticate_user(email: str, password: str, db: Session):
+# Async database dependency, for handlers that run on the event loop
+async def get_async_db():  # pragma: no cover
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def run_hash(func, *args):
+    """Run ``func`` on the password-hashing pool, shedding load when full."""
+    global _hash_pending
+    if _hash_pending >= HASH_QUEUE_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent logins, please retry",
+            headers={"Retry-After": "1"},
+        )
+    _hash_pending += 1
+    try:
+        return await anyio.to_thread.run_sync(func, *args, limiter=hash_limiter)
+    finally:
+        _hash_pending -= 1
+
+
+def _get_credentials(email: str, db: Session) -> Optional[Tuple[int, str]]:
     user = db.query(Employee).filter(Employee.email == email).first()
-    if not user or not (password == user.password):
-        return None  # pragma: no cover
-    return user
+    credentials = (user.employee_id, user.password) if user else None
+    # Hand the connection back to the pool while the password is checked.
+    db.rollback()
+    return credentials
+
+
+def _issue_token(employee_id: int, new_hash: Optional[str], db: Session) -> str:
+    user = db.get(Employee, employee_id)
+    if new_hash:
+        user.password = new_hash
+    token = create_access_token(
+        user.email,
+        user.employee_id,
+        user.isadmin,
+        expires_delta=timedelta(minutes=60),
+    )
+    db.commit()
+    return token
+
+
+async def login(email: str, password: str, db: Session) -> Optional[str]:
+    credentials = await anyio.to_thread.run_sync(
+        _get_credentials, email, db, limiter=auth_limiter
+    )
+    if not credentials:
+        await run_hash(verify_password, password, _DUMMY_PASSWORD_HASH)
+        return None
+
+    employee_id, stored_password = credentials
+    ok, new_hash = await run_hash(verify_and_update, password, stored_password)
+    if not ok:
+        return None
+
+    return await anyio.to_thread.run_sync(
+        _issue_token, employee_id, new_hash, db, limiter=auth_limiter
+    )
 
 
 # Create JWT token
@@ -64,6 +148,9 @@ def create_access_token(
 
 # Get current user from token
 def get_current_user(token: Annotated[str, Depends(oauth2_bearer)]):
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         email: str = payload.get("email")
@@ -74,7 +161,9 @@ def get_current_user(token: Annotated[str, Depends(oauth2_bearer)]):
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate user.",
             )  # pragma: no cover
-        return {"email": email, "id": employee_id, "is_admin": is_admin}
+        user = {"email": email, "id": employee_id, "is_admin": is_admin}
+        token_cache.put(token, user, payload.get("exp", 0))
+        return user
     except JWTError:  # pragma: no cover
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate user."
@@ -82,6 +171,7 @@ def get_current_user(token: Annotated[str, Depends(oauth2_bearer)]):
 
 
 db_dependency = Annotated[Session, Depends(get_db)]
+async_db_dependency = Annotated[AsyncSession, Depends(get_async_db)]
 user_dependency = Annotated[dict, Depends(get_current_user)]
 
 
@@ -92,24 +182,15 @@ user_dependency = Annotated[dict, Depends(get_current_user)]
 async def login_for_access_token_form(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()], db: db_dependency
 ):
-    user = authenticate_user(form_data.username, form_data.password, db)
+    token = await login(form_data.username, form_data.password, db)
 
-    if not user:
+    if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )  # pragma: no cover
 
-    # Create JWT token
-    token = create_access_token(
-        user.email,
-        user.employee_id,
-        user.isadmin,
-        expires_delta=timedelta(minutes=60),
-    )
-
-    db.commit()
     return {"access_token": token, "token_type": "bearer"}
 
 
@@ -120,21 +201,22 @@ async def login_for_access_token_form(
 async def login_for_access_token_json(
     payload: LoginRequest, db: db_dependency
 ):  # pragma: no cover
-    user = authenticate_user(payload.username, payload.password, db)
+    token = await login(payload.username, payload.password, db)
 
-    if not user:
+    if not token:
         # Note: We don't include WWW-Authenticate header here as it's not the OAuth2 standard token URL
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
 
-    token = create_access_token(
-        user.email,
-        user.employee_id,
-        user.isadmin,
-        expires_delta=timedelta(minutes=60),
-    )
-
-    db.commit()
     return {"access_token": token, "token_type": "bearer"}
+
+
+@auth_router.get("/token-cache", summary="Verified token cache statistics")
+def get_token_cache_stats(user: user_dependency):
+    if not user.get("is_admin"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required"
+        )
+    return token_cache.stats()
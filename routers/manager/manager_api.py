@@ -7,6 +7,7 @@ from . import (
     manager_regularization_api,
     manager_leave_application_api,
     manager_expense_claim_api,
+    manager_dashboard_api,
 )
 
 manager_router = APIRouter(prefix="/manager")
@@ -17,3 +18,4 @@ manager_router.include_router(manager_leave_api.router)
 manager_router.include_router(manager_regularization_api.router)
 manager_router.include_router(manager_leave_application_api.router)
 manager_router.include_router(manager_expense_claim_api.router)
+manager_router.include_router(manager_dashboard_api.router)
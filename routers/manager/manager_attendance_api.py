@@ -3,10 +3,18 @@ from fastapi import APIRouter
 from datetime import date
 from typing import List
 
-from schema.attendance_schema import AttendanceResponse
+from schema.attendance_schema import (
+    AttendanceDailyResponse,
+    AttendanceResponse,
+    TeamAttendanceResponse,
+)
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
+from common.org import depth_dependency
 from common.attendance import (
     get_manager_team_attendance_by_date,
+    get_manager_team_attendance_by_range,
+    get_manager_team_attendance_summary,
     get_manager_subordinate_attendance_by_date,
 )
 
@@ -21,8 +29,52 @@ def get_team_attendance_by_date(
     punch_date: date,
     db: db_dependency,
     user: user_dependency,
+    page: page_dependency,
+    depth: depth_dependency = 1,
+):
+    return get_manager_team_attendance_by_date(
+        punch_date=punch_date, db=db, user=user, page=page, depth=depth
+    )
+
+
+@router.get(
+    "/range",
+    response_model=List[TeamAttendanceResponse],
+    summary="Team attendance for a date range, grouped per employee",
+)
+def get_team_attendance_by_range(
+    start_date: date,
+    end_date: date,
+    db: db_dependency,
+    user: user_dependency,
+    depth: depth_dependency = 1,
+):
+    return get_manager_team_attendance_by_range(
+        start_date=start_date, end_date=end_date, db=db, user=user, depth=depth
+    )
+
+
+@router.get(
+    "/summary",
+    response_model=List[AttendanceDailyResponse],
+    summary="Team daily attendance summaries for a date range",
+)
+def get_team_attendance_summary(
+    start_date: date,
+    end_date: date,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
+    depth: depth_dependency = 1,
 ):
-    return get_manager_team_attendance_by_date(punch_date=punch_date, db=db, user=user)
+    return get_manager_team_attendance_summary(
+        db=db,
+        user=user,
+        start_date=start_date,
+        end_date=end_date,
+        page=page,
+        depth=depth,
+    )
 
 
 @router.get(
@@ -33,10 +85,14 @@ def get_subordinate_attendance_by_date(
     punch_date: date,
     db: db_dependency,
     user: user_dependency,
+    page: page_dependency,
+    depth: depth_dependency = 1,
 ):
     return get_manager_subordinate_attendance_by_date(
         employee_id=employee_id,
         punch_date=punch_date,
         db=db,
         user=user,
+        page=page,
+        depth=depth,
     )
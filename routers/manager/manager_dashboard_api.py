@@ -0,0 +1,32 @@
+# routers/manager_dashboard_api.py
+from fastapi import APIRouter, Query
+from datetime import date
+from typing import Optional
+
+from schema.dashboard_schema import ManagerDashboardResponse
+from routers.auth import db_dependency, user_dependency
+from common.org import depth_dependency
+from common.dashboard import (
+    DASHBOARD_RECENT_DEFAULT,
+    DASHBOARD_RECENT_MAX,
+    get_manager_dashboard,
+)
+
+router = APIRouter(prefix="/dashboard", tags=["Manager - Dashboard"])
+
+
+@router.get(
+    "/",
+    response_model=ManagerDashboardResponse,
+    summary="Inbox counts, newest pending items and today's team check-ins",
+)
+def get_dashboard(
+    db: db_dependency,
+    user: user_dependency,
+    recent: int = Query(DASHBOARD_RECENT_DEFAULT, ge=1, le=DASHBOARD_RECENT_MAX),
+    on_date: Optional[date] = Query(None, description="Defaults to today"),
+    depth: depth_dependency = 1,
+):
+    return get_manager_dashboard(
+        db=db, user=user, recent=recent, on_date=on_date, depth=depth
+    )
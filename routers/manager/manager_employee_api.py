@@ -1,21 +1,48 @@
 # routers/manager_employee_api.py
 from fastapi import APIRouter
+from typing import List
 from schema.employee_schema import EmployeeResponse
 from routers.auth import db_dependency, user_dependency
-from common.employee import get_subordinate_by_id, get_subordinate_by_email
+from common.pagination import page_dependency
+from common.org import depth_dependency
+from common.employee import (
+    get_subordinates,
+    get_subordinate_by_id,
+    get_subordinate_by_email,
+)
 
 router = APIRouter(prefix="/subordinates", tags=["Manager - Subordinates"])
 
 
+@router.get(
+    "/",
+    response_model=List[EmployeeResponse],
+    summary="Everyone in your reporting tree, down to `depth` levels",
+)
+def list_subordinates_endpoint(
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
+    depth: depth_dependency = 1,
+):
+    return get_subordinates(db=db, user=user, depth=depth, page=page)
+
+
 @router.get("/id/{employee_id}", response_model=EmployeeResponse)
 def get_subordinate_by_id_endpoint(
-    employee_id: int, db: db_dependency, user: user_dependency
+    employee_id: int,
+    db: db_dependency,
+    user: user_dependency,
+    depth: depth_dependency = 1,
 ):
-    return get_subordinate_by_id(employee_id=employee_id, db=db, user=user)
+    return get_subordinate_by_id(employee_id=employee_id, db=db, user=user, depth=depth)
 
 
 @router.get("/email/{email}", response_model=EmployeeResponse)
 def get_subordinate_by_email_endpoint(
-    email: str, db: db_dependency, user: user_dependency
+    email: str,
+    db: db_dependency,
+    user: user_dependency,
+    depth: depth_dependency = 1,
 ):
-    return get_subordinate_by_email(email=email, db=db, user=user)
+    return get_subordinate_by_email(email=email, db=db, user=user, depth=depth)
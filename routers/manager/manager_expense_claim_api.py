@@ -3,16 +3,20 @@ from fastapi import APIRouter
 from typing import List
 from schema.expense_claim_schema import (
     ExpenseClaimResponse,
+    ExpenseClaimBulkStatusUpdate,
     ExpenseClaimStatusUpdate,
     Status,
 )
+from schema.bulk_schema import BulkStatusResult
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
 from common.expense_claim import (
     get_manager_claim_by_id,
     get_manager_claims_by_status,
     get_manager_claims_by_month,
     get_manager_claims_by_employee_and_month,
     manager_update_status,
+    manager_bulk_update_status,
 )
 
 router = APIRouter(prefix="/expense-claims", tags=["Manager - Expense Claims"])
@@ -27,26 +31,37 @@ def get_by_id_where_manager_current_user(
 
 @router.get("/month/{year}/{month}", response_model=List[ExpenseClaimResponse])
 def get_all_expense_by_month_where_manager_current_user(
-    year: int, month: int, db: db_dependency, user: user_dependency
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
 ):
-    return get_manager_claims_by_month(db=db, year=year, month=month, user=user)
+    return get_manager_claims_by_month(
+        db=db, year=year, month=month, user=user, page=page
+    )
 
 
 @router.get("/status/{status}", response_model=List[ExpenseClaimResponse])
 def get_all_expense_by_status_where_manager_current_user(
-    status: Status, db: db_dependency, user: user_dependency
+    status: Status, db: db_dependency, user: user_dependency, page: page_dependency
 ):
-    return get_manager_claims_by_status(db=db, status=status, user=user)
+    return get_manager_claims_by_status(db=db, status=status, user=user, page=page)
 
 
 @router.get(
     "/employee/{emp_id}/month/{year}/{month}", response_model=List[ExpenseClaimResponse]
 )
 def get_expense_by_employeeid_and_month_where_manager_currentuser(
-    emp_id: int, year: int, month: int, db: db_dependency, user: user_dependency
+    emp_id: int,
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
 ):
     return get_manager_claims_by_employee_and_month(
-        db=db, emp_id=emp_id, year=year, month=month, user=user
+        db=db, emp_id=emp_id, year=year, month=month, user=user, page=page
     )
 
 
@@ -58,3 +73,12 @@ def update_exp_status_where_manager_currentuser(
     user: user_dependency,
 ):
     return manager_update_status(db=db, claim_id=claim_id, update=update, user=user)
+
+
+@router.put("/status", response_model=List[BulkStatusResult])
+def update_exp_status_bulk_where_manager_currentuser(
+    update: ExpenseClaimBulkStatusUpdate,
+    db: db_dependency,
+    user: user_dependency,
+):
+    return manager_bulk_update_status(db=db, update=update, user=user)
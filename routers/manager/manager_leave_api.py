@@ -8,7 +8,9 @@ from common.leave import (
 )
 import schema.leave_schema as leave_schema
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
 from common.employee import get_subordinate_by_id
+from common.org import depth_dependency
 
 
 router = APIRouter(prefix="/leaves", tags=["Manager - Leave"])
@@ -24,10 +26,11 @@ def get_subordinate_leave_by_year_endpoint_endpoint(
     year: int,
     db: db_dependency,
     user: user_dependency,
+    depth: depth_dependency = 1,
 ):
     # This function already checks: is employee_id under current manager?
     # If not → raises 404 or 403 depending on your get_subordinate_by_id logic
-    get_subordinate_by_id(employee_id=employee_id, db=db, user=user)
+    get_subordinate_by_id(employee_id=employee_id, db=db, user=user, depth=depth)
 
     return get_leave_by_employee_and_year(db=db, employee_id=employee_id, year=year)
 
@@ -41,8 +44,10 @@ def get_subordinate_all_leaves_endpoint(
     employee_id: int,
     db: db_dependency,
     user: user_dependency,
+    page: page_dependency,
+    depth: depth_dependency = 1,
 ):
     # Authorization: confirm this employee reports to current user
-    get_subordinate_by_id(employee_id=employee_id, db=db, user=user)
+    get_subordinate_by_id(employee_id=employee_id, db=db, user=user, depth=depth)
 
-    return get_all_leaves_by_employee_id(db=db, employee_id=employee_id)
+    return get_all_leaves_by_employee_id(db=db, employee_id=employee_id, page=page)
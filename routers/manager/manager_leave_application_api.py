@@ -3,16 +3,20 @@ from fastapi import APIRouter
 from typing import List
 from schema.leave_application_schema import (
     LeaveApplicationResponse,
+    LeaveApplicationBulkStatusUpdate,
     LeaveApplicationStatusUpdate,
     Status,
 )
+from schema.bulk_schema import BulkStatusResult
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
 from common.leave_application import (
     get_manager_application_by_id,
     get_manager_applications_by_status,
     get_manager_applications_by_month,
     get_manager_applications_by_employee,
     manager_update_status,
+    manager_bulk_update_status,
 )
 
 router = APIRouter(prefix="/leave-applications", tags=["Manager - Leave Applications"])
@@ -30,20 +34,39 @@ def put_leave_status_where_manager_currentuser(
 
 @router.get("/status/{status}", response_model=List[LeaveApplicationResponse])
 def get_by_status_where_manager_currentuser(
-    status: Status, db: db_dependency, user: user_dependency
+    status: Status, db: db_dependency, user: user_dependency, page: page_dependency
 ):
-    return get_manager_applications_by_status(db=db, status=status, user=user)
+    return get_manager_applications_by_status(
+        db=db, status=status, user=user, page=page
+    )
 
 
 @router.get("/month/{year}/{month}", response_model=List[LeaveApplicationResponse])
 def get_by_month_where_manager_currentuser(
-    year: int, month: int, db: db_dependency, user: user_dependency
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
 ):
-    return get_manager_applications_by_month(db=db, year=year, month=month, user=user)
+    return get_manager_applications_by_month(
+        db=db, year=year, month=month, user=user, page=page
+    )
 
 
 @router.get("/employee/{emp_id}", response_model=List[LeaveApplicationResponse])
 def get_by_employeeid_where_manager_currentuser(
-    emp_id: int, db: db_dependency, user: user_dependency
+    emp_id: int, db: db_dependency, user: user_dependency, page: page_dependency
+):
+    return get_manager_applications_by_employee(
+        db=db, emp_id=emp_id, user=user, page=page
+    )
+
+
+@router.put("/status", response_model=List[BulkStatusResult])
+def put_leave_status_bulk_where_manager_currentuser(
+    update: LeaveApplicationBulkStatusUpdate,
+    db: db_dependency,
+    user: user_dependency,
 ):
-    return get_manager_applications_by_employee(db=db, emp_id=emp_id, user=user)
+    return manager_bulk_update_status(db=db, update=update, user=user)
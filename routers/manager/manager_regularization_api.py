@@ -3,22 +3,26 @@ from fastapi import APIRouter
 from typing import List
 from schema.regularization_schema import (
     RegularizationResponse,
+    RegularizationBulkStatusUpdate,
     RegularizationStatusUpdate,
 )
+from schema.bulk_schema import BulkStatusResult
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
 from common.regularization import (
     get_manager_regularization_by_id,
     get_manager_regularizations_for_employee,
     get_manager_pending_regularizations,
     manager_update_regularization_status,
+    manager_bulk_update_regularization_status,
 )
 
 router = APIRouter(prefix="/regularizations", tags=["Manager - Regularization"])
 
 
 @router.get("/pending", response_model=List[RegularizationResponse])
-def get_pending(db: db_dependency, user: user_dependency):
-    return get_manager_pending_regularizations(db=db, user=user)
+def get_pending(db: db_dependency, user: user_dependency, page: page_dependency):
+    return get_manager_pending_regularizations(db=db, user=user, page=page)
 
 
 @router.get("/{reg_id}", response_model=RegularizationResponse)
@@ -27,9 +31,11 @@ def get_by_id(reg_id: int, db: db_dependency, user: user_dependency):
 
 
 @router.get("/employee/{employee_id}", response_model=List[RegularizationResponse])
-def get_by_employee(employee_id: int, db: db_dependency, user: user_dependency):
+def get_by_employee(
+    employee_id: int, db: db_dependency, user: user_dependency, page: page_dependency
+):
     return get_manager_regularizations_for_employee(
-        employee_id=employee_id, db=db, user=user
+        employee_id=employee_id, db=db, user=user, page=page
     )
 
 
@@ -43,3 +49,14 @@ def update_status(
     return manager_update_regularization_status(
         reg_id=reg_id, status_update=status_update, db=db, user=user
     )
+
+
+@router.put("/status", response_model=List[BulkStatusResult])
+def update_status_bulk(
+    status_update: RegularizationBulkStatusUpdate,
+    db: db_dependency,
+    user: user_dependency,
+):
+    return manager_bulk_update_regularization_status(
+        status_update=status_update, db=db, user=user
+    )
@@ -11,6 +11,8 @@ from . import (
     user_payslip_api,
     user_leave_application_api,
     user_expense_claim_api,
+    user_calendar_api,
+    user_timesheet_api,
 )
 
 user_router = APIRouter(prefix="/user")
@@ -25,3 +27,5 @@ user_router.include_router(user_regularization_api.router)
 user_router.include_router(user_payslip_api.router)
 user_router.include_router(user_leave_application_api.router)
 user_router.include_router(user_expense_claim_api.router)
+user_router.include_router(user_calendar_api.router)
+user_router.include_router(user_timesheet_api.router)
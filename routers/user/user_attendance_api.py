@@ -1,14 +1,20 @@
 # routers/user_attendance_api.py
 from fastapi import APIRouter, Query
 from typing import List
-from schema.attendance_schema import AttendanceCreate, AttendanceResponse
+from schema.attendance_schema import (
+    AttendanceCreate,
+    AttendanceDailyResponse,
+    AttendanceResponse,
+)
 from common.attendance import (
     create_attendance,
     get_my_attendance_all,
     get_my_attendance_by_date,
+    get_my_attendance_summary,
 )
-from routers.auth import db_dependency, user_dependency
-from datetime import datetime
+from routers.auth import async_db_dependency, db_dependency, user_dependency
+from common.pagination import page_dependency
+from datetime import date, datetime
 
 router = APIRouter(prefix="/my/attendance", tags=["My - Attendance"])
 
@@ -19,12 +25,36 @@ def punch_in(att_data: AttendanceCreate, db: db_dependency, user: user_dependenc
 
 
 @router.get("/my", response_model=List[AttendanceResponse])
-def get_my_all_attendance(db: db_dependency, user: user_dependency):
-    return get_my_attendance_all(db=db, current_user=user)
+async def get_my_all_attendance(
+    db: async_db_dependency, user: user_dependency, page: page_dependency
+):
+    return await get_my_attendance_all(db=db, current_user=user, page=page)
 
 
 @router.get("/my/date/{date_str}", response_model=List[AttendanceResponse])
-def get_my_attendance_by_date_endpoint(
-    db: db_dependency, date_str: datetime, user: user_dependency
+async def get_my_attendance_by_date_endpoint(
+    db: async_db_dependency,
+    date_str: datetime,
+    user: user_dependency,
+    page: page_dependency,
+):
+    return await get_my_attendance_by_date(
+        db=db, punch_date=date_str, user=user, page=page
+    )
+
+
+@router.get(
+    "/summary",
+    response_model=List[AttendanceDailyResponse],
+    summary="Daily first-in/last-out summary for a date range",
+)
+def get_my_attendance_summary_endpoint(
+    start_date: date,
+    end_date: date,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
 ):
-    return get_my_attendance_by_date(db=db, punch_date=date_str, user=user)
+    return get_my_attendance_summary(
+        db=db, user=user, start_date=start_date, end_date=end_date, page=page
+    )
@@ -0,0 +1,15 @@
+# api/user_calendar_api.py
+from fastapi import APIRouter
+from datetime import date
+from schema.calendar_schema import WorkingDaysResponse
+from routers.auth import db_dependency, user_dependency
+from common.work_calendar import get_my_working_days
+
+router = APIRouter(prefix="/my/calendar", tags=["My - Calendar"])
+
+
+@router.get("/working-days", response_model=WorkingDaysResponse)
+def get_my_working_days_endpoint(
+    start_date: date, end_date: date, db: db_dependency, user: user_dependency
+):
+    return get_my_working_days(db=db, user=user, start=start_date, end=end_date)
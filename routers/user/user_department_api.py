@@ -2,10 +2,19 @@
 from fastapi import APIRouter
 from typing import List
 from schema.department_schema import DepartmentResponse
-from common.department import get_all_departments, get_department_by_id
+from common.conditional import conditional_get
+from common.department import (
+    department_cache,
+    get_all_departments,
+    get_department_by_id,
+)
 from routers.auth import db_dependency, user_dependency
 
-router = APIRouter(prefix="/my/departments", tags=["My - Departments"])
+router = APIRouter(
+    prefix="/my/departments",
+    tags=["My - Departments"],
+    dependencies=[conditional_get(lambda db, user: department_cache.version(db))],
+)
 
 
 @router.get("/", response_model=List[DepartmentResponse])
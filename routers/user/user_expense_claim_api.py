@@ -8,6 +8,7 @@ from schema.expense_claim_schema import (
     Status,
 )
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
 from common.expense_claim import (
     create_expense_claim,
     delete_expense_claim,
@@ -34,8 +35,10 @@ def delete_expense(claim_id: int, db: db_dependency, user: user_dependency):
 
 
 @router.get("/status/{status}", response_model=List[ExpenseClaimResponse])
-def get_exp_by_status(status: Status, db: db_dependency, user: user_dependency):
-    return get_my_claims_by_status(db=db, status=status, user=user)
+def get_exp_by_status(
+    status: Status, db: db_dependency, user: user_dependency, page: page_dependency
+):
+    return get_my_claims_by_status(db=db, status=status, user=user, page=page)
 
 
 @router.get("/{claim_id}", response_model=ExpenseClaimResponse)
@@ -45,6 +48,10 @@ def get_expense_by_id(claim_id: int, db: db_dependency, user: user_dependency):
 
 @router.get("/month/{year}/{month}", response_model=List[ExpenseClaimResponse])
 def get_all_expense_by_month(
-    year: int, month: int, db: db_dependency, user: user_dependency
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
 ):
-    return get_my_claims_by_month(db=db, year=year, month=month, user=user)
+    return get_my_claims_by_month(db=db, year=year, month=month, user=user, page=page)
@@ -1,11 +1,21 @@
 # api/user_leave_api.py
 from fastapi import APIRouter
 from typing import List
-from common.leave import get_leave_by_employee_and_year, get_all_leaves_by_employee_id
+from common.conditional import conditional_get, employee_version
+from common.leave import (
+    LEAVE_VERSION,
+    get_leave_by_employee_and_year,
+    get_all_leaves_by_employee_id,
+)
 import schema.leave_schema as leave_schema
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
 
-router = APIRouter(prefix="/my/leave", tags=["My - Leave"])
+router = APIRouter(
+    prefix="/my/leave",
+    tags=["My - Leave"],
+    dependencies=[conditional_get(employee_version(LEAVE_VERSION))],
+)
 
 
 @router.get("/year/{year}", response_model=leave_schema.LeaveResponse)
@@ -14,7 +24,15 @@ def get_my_leave_by_year_endpoint(year: int, db: db_dependency, user: user_depen
     return get_leave_by_employee_and_year(db, emp_id, year)
 
 
+@router.get("/balance/{year}", response_model=leave_schema.LeaveBalanceResponse)
+def get_my_leave_balance_endpoint(year: int, db: db_dependency, user: user_dependency):
+    # Kept current by the leave ledger on every approval, so one indexed read
+    return get_leave_by_employee_and_year(db, user["id"], year)
+
+
 @router.get("/", response_model=List[leave_schema.LeaveResponse])
-def get_my_all_leaves_endpoint(db: db_dependency, user: user_dependency):
+def get_my_all_leaves_endpoint(
+    db: db_dependency, user: user_dependency, page: page_dependency
+):
     emp_id = user["id"]
-    return get_all_leaves_by_employee_id(db, emp_id)
+    return get_all_leaves_by_employee_id(db, emp_id, page=page)
@@ -8,6 +8,7 @@ from schema.leave_application_schema import (
     Status,
 )
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
 from common.leave_application import (
     create_leave_application,
     delete_leave_application,
@@ -34,8 +35,10 @@ def delete_leave_using_id(app_id: int, db: db_dependency, user: user_dependency)
 
 
 @router.get("/status/{status}", response_model=List[LeaveApplicationResponse])
-def get_application_by_status(status: Status, db: db_dependency, user: user_dependency):
-    return get_my_applications_by_status(db=db, user=user, status=status)
+def get_application_by_status(
+    status: Status, db: db_dependency, user: user_dependency, page: page_dependency
+):
+    return get_my_applications_by_status(db=db, user=user, status=status, page=page)
 
 
 @router.get("/{app_id}", response_model=LeaveApplicationResponse)
@@ -45,6 +48,12 @@ def get_by_id(app_id: int, db: db_dependency, user: user_dependency):
 
 @router.get("/month/{year}/{month}", response_model=List[LeaveApplicationResponse])
 def get_all_leave_by_month(
-    year: int, month: int, db: db_dependency, user: user_dependency
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
 ):
-    return get_my_applications_by_month(db=db, year=year, month=month, user=user)
+    return get_my_applications_by_month(
+        db=db, year=year, month=month, user=user, page=page
+    )
@@ -3,14 +3,26 @@ from fastapi import APIRouter
 from typing import List
 from schema.payslip_schema import PayslipResponse
 from routers.auth import db_dependency, user_dependency
-from common.payslip import get_payslips_by_employee, get_payslip_by_employee_and_month
+from common.pagination import page_dependency
+from common.conditional import conditional_get, employee_version
+from common.payslip import (
+    PAYSLIP_VERSION,
+    get_payslips_by_employee,
+    get_payslip_by_employee_and_month,
+)
 
-router = APIRouter(prefix="/my/payslips", tags=["My - Payslips"])
+router = APIRouter(
+    prefix="/my/payslips",
+    tags=["My - Payslips"],
+    dependencies=[conditional_get(employee_version(PAYSLIP_VERSION))],
+)
 
 
 @router.get("/", response_model=List[PayslipResponse])
-def get_my_all_payslips(db: db_dependency, user: user_dependency):
-    return get_payslips_by_employee(db=db, employee_id=user["id"])
+def get_my_all_payslips(
+    db: db_dependency, user: user_dependency, page: page_dependency
+):
+    return get_payslips_by_employee(db=db, employee_id=user["id"], page=page)
 
 
 @router.get("/month/{year}/{month}", response_model=PayslipResponse)
@@ -3,6 +3,7 @@ from fastapi import APIRouter, status
 from typing import List
 from schema.regularization_schema import RegularizationCreate, RegularizationResponse
 from routers.auth import db_dependency, user_dependency
+from common.pagination import page_dependency
 from common.regularization import (
     create_regularization,
     get_my_regularizations,
@@ -23,8 +24,10 @@ def create_regularization_endpoint(
 
 
 @router.get("/", response_model=List[RegularizationResponse])
-def get_all_my_regularizations(db: db_dependency, user: user_dependency):
-    return get_my_regularizations(db=db, user=user)
+def get_all_my_regularizations(
+    db: db_dependency, user: user_dependency, page: page_dependency
+):
+    return get_my_regularizations(db=db, user=user, page=page)
 
 
 @router.get("/{reg_id}", response_model=RegularizationResponse)
@@ -35,5 +38,13 @@ def get_my_regularization_by_id_endpoint(
 
 
 @router.get("/month/{year}/{month}", response_model=List[RegularizationResponse])
-def get_by_month(year: int, month: int, db: db_dependency, user: user_dependency):
-    return get_my_regularizations_by_month(year=year, month=month, db=db, user=user)
+def get_by_month(
+    year: int,
+    month: int,
+    db: db_dependency,
+    user: user_dependency,
+    page: page_dependency,
+):
+    return get_my_regularizations_by_month(
+        year=year, month=month, db=db, user=user, page=page
+    )
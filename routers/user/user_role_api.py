@@ -2,10 +2,15 @@
 from fastapi import APIRouter
 from typing import List
 from schema.role_schema import RoleResponse
-from common.role import get_all_roles, get_role_by_id
+from common.conditional import conditional_get
+from common.role import get_all_roles, get_role_by_id, role_cache
 from routers.auth import db_dependency, user_dependency
 
-router = APIRouter(prefix="/my/roles", tags=["My - Roles"])
+router = APIRouter(
+    prefix="/my/roles",
+    tags=["My - Roles"],
+    dependencies=[conditional_get(lambda db, user: role_cache.version(db))],
+)
 
 
 @router.get("/", response_model=List[RoleResponse])
@@ -2,14 +2,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import Annotated, List
 
+from common.conditional import conditional_get, employee_version
 from common.salary import (
+    SALARY_VERSION,
     get_salary_by_employee_and_year,
     get_salaries_by_employee_id,
 )
 import schema.salary_schema as salary_schema
 from routers.auth import user_dependency, db_dependency
+from common.pagination import page_dependency
 
-router = APIRouter(prefix="/my/salary", tags=["My - Salary"])
+router = APIRouter(
+    prefix="/my/salary",
+    tags=["My - Salary"],
+    dependencies=[conditional_get(employee_version(SALARY_VERSION))],
+)
 
 
 @router.get("/year/{year}", response_model=salary_schema.SalaryResponse)
@@ -19,6 +26,8 @@ def get_my_salary_by_year_endpoint(year: int, db: db_dependency, user: user_depe
 
 
 @router.get("/", response_model=List[salary_schema.SalaryResponse])
-def get_my_all_salaries_endpoint(db: db_dependency, user: user_dependency):
+def get_my_all_salaries_endpoint(
+    db: db_dependency, user: user_dependency, page: page_dependency
+):
     emp_id = user["id"]
-    return get_salaries_by_employee_id(db=db, employee_id=emp_id)
+    return get_salaries_by_employee_id(db=db, employee_id=emp_id, page=page)
@@ -0,0 +1,14 @@
+# api/user_timesheet_api.py
+from fastapi import APIRouter
+from schema.timesheet_schema import TimesheetResponse
+from routers.auth import db_dependency, user_dependency
+from common.timesheet import get_my_timesheet
+
+router = APIRouter(prefix="/my/timesheet", tags=["My - Timesheet"])
+
+
+@router.get("/{year}/{month}", response_model=TimesheetResponse)
+def get_my_timesheet_for_month(
+    year: int, month: int, db: db_dependency, user: user_dependency
+):
+    return get_my_timesheet(db=db, user=user, year=year, month=month)
@@ -1,7 +1,7 @@
 # schema/attendance_schema.py
 from pydantic import BaseModel
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import List, Optional
 
 
 class AttendanceBase(BaseModel):
@@ -18,3 +18,21 @@ class AttendanceResponse(AttendanceBase):
 
     class Config:
         from_attributes = True
+
+
+class TeamAttendanceResponse(BaseModel):
+    employee_id: int
+    attendance: List[AttendanceResponse]
+
+
+class AttendanceDailyResponse(BaseModel):
+    attendance_daily_id: int
+    fk_employee_id: int
+    work_date: date
+    first_punch: datetime
+    last_punch: datetime
+    punch_count: int
+    worked_seconds: int
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,17 @@
+# schema/bulk_schema.py
+from pydantic import BaseModel
+from enum import Enum
+
+BULK_MAX_IDS = 500
+
+
+class BulkOutcome(str, Enum):
+    updated = "updated"
+    not_found = "not_found"
+    forbidden = "forbidden"
+    insufficient_balance = "insufficient_balance"
+
+
+class BulkStatusResult(BaseModel):
+    id: int
+    outcome: BulkOutcome
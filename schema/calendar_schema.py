@@ -0,0 +1,60 @@
+# schema/calendar_schema.py
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import FrozenSet, Optional
+from datetime import date
+
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def parse_weekly_offs(value: str) -> FrozenSet[int]:
+    """``"Sat,Sun"`` -> ``{5, 6}``; raises ``ValueError`` on unknown names."""
+    names = [name.strip().title() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in WEEKDAYS]
+    if unknown:
+        raise ValueError(f"unknown weekday(s): {', '.join(unknown)}")
+    return frozenset(WEEKDAYS.index(name) for name in names)
+
+
+class WorkLocationCreate(BaseModel):
+    location_name: str = Field(..., min_length=2, max_length=100)
+    weekly_offs: str = Field("Sat,Sun", description='Day names, e.g. "Fri,Sat"')
+
+    @field_validator("weekly_offs")
+    @classmethod
+    def known_weekdays(cls, v):
+        offs = parse_weekly_offs(v)
+        # Stored normalised so every reader parses the same string
+        return ",".join(WEEKDAYS[day] for day in sorted(offs))
+
+
+class WorkLocationResponse(WorkLocationCreate):
+    location_id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class HolidayCreate(BaseModel):
+    holiday_date: date
+    holiday_name: str = Field(..., min_length=2, max_length=100)
+    fk_location_id: Optional[int] = Field(
+        None, description="Omit for a company-wide holiday"
+    )
+
+
+class HolidayResponse(HolidayCreate):
+    holiday_id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class WorkingDaysResponse(BaseModel):
+    start_date: date
+    end_date: date
+    working_days: int
+
+
+class LeaveDaysRecomputeResponse(BaseModel):
+    checked: int
+    updated: int
+    balances_adjusted: int
+    duration_ms: float
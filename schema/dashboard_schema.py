@@ -0,0 +1,53 @@
+# schema/dashboard_schema.py
+from pydantic import BaseModel
+from datetime import date, datetime
+from enum import Enum
+from typing import List, Optional
+from schema.expense_claim_schema import ExpenseClaimResponse
+from schema.leave_application_schema import LeaveApplicationResponse
+from schema.regularization_schema import RegularizationResponse
+
+
+class StatusCounts(BaseModel):
+    pending: int = 0
+    approved: int = 0
+    rejected: int = 0
+
+
+class LeaveApplicationInbox(BaseModel):
+    counts: StatusCounts
+    recent_pending: List[LeaveApplicationResponse]
+
+
+class ExpenseClaimInbox(BaseModel):
+    counts: StatusCounts
+    recent_pending: List[ExpenseClaimResponse]
+
+
+class RegularizationInbox(BaseModel):
+    counts: StatusCounts
+    recent_pending: List[RegularizationResponse]
+
+
+class CheckInStatus(str, Enum):
+    present = "present"
+    on_leave = "on_leave"
+    absent = "absent"
+
+
+class TeamMemberToday(BaseModel):
+    employee_id: int
+    first_name: str
+    last_name: str
+    status: CheckInStatus
+    first_punch: Optional[datetime] = None
+    last_punch: Optional[datetime] = None
+    punch_count: int = 0
+
+
+class ManagerDashboardResponse(BaseModel):
+    on_date: date
+    leave_applications: LeaveApplicationInbox
+    expense_claims: ExpenseClaimInbox
+    regularizations: RegularizationInbox
+    team: List[TeamMemberToday]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import date
 
 
@@ -13,6 +13,7 @@ class EmployeeBase(BaseModel):
     fk_department_id: int
     fk_role_id: int
     fk_manager_id: Optional[int] = None
+    fk_location_id: Optional[int] = None
 
 
 class EmployeeCreate(EmployeeBase):
@@ -35,4 +36,22 @@ class EmployeeUpdate(BaseModel):
     fk_department_id: Optional[int] = None
     fk_role_id: Optional[int] = None
     fk_manager_id: Optional[int] = None
+    fk_location_id: Optional[int] = None
     password: Optional[str] = None
+
+
+class EmployeeImportError(BaseModel):
+    row: int
+    email: Optional[str] = None
+    errors: List[str]
+
+
+class EmployeeImportResponse(BaseModel):
+    total_rows: int
+    created: int
+    failed: int
+    errors: List[EmployeeImportError]
+    errors_truncated: bool
+    dry_run: bool
+    duration_ms: float
+    rows_per_second: float
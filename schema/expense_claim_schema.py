@@ -1,8 +1,9 @@
 # schema/expense_claim_schema.py
 from pydantic import BaseModel, Field, ConfigDict, validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from enum import Enum
+from schema.bulk_schema import BULK_MAX_IDS
 
 
 class Status(str, Enum):
@@ -25,6 +26,10 @@ class ExpenseClaimStatusUpdate(BaseModel):
     claim_status: Status
 
 
+class ExpenseClaimBulkStatusUpdate(ExpenseClaimStatusUpdate):
+    ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_IDS)
+
+
 class ExpenseClaimResponse(ExpenseClaimBase):
     claim_id: int
     claim_status: Status
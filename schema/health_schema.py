@@ -0,0 +1,30 @@
+# schema/health_schema.py
+from pydantic import BaseModel
+from typing import Dict, Optional
+
+
+class LivenessResponse(BaseModel):
+    status: str
+
+
+class DatabaseCheck(BaseModel):
+    ok: bool
+    latency_ms: float
+    error: Optional[str] = None
+    # None for engines without a connection pool (NullPool)
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+
+
+class EventLoopCheck(BaseModel):
+    ok: bool
+    lag_ms: float
+
+
+class ReadinessResponse(BaseModel):
+    status: str
+    cached: bool
+    event_loop: EventLoopCheck
+    databases: Dict[str, DatabaseCheck]
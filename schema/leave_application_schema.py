@@ -1,8 +1,9 @@
 # schema/leave_application_schema.py
 from pydantic import BaseModel, Field, ConfigDict, validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from enum import Enum
+from schema.bulk_schema import BULK_MAX_IDS
 
 
 class Status(str, Enum):
@@ -31,6 +32,10 @@ class LeaveApplicationStatusUpdate(BaseModel):
     leave_status: Status
 
 
+class LeaveApplicationBulkStatusUpdate(LeaveApplicationStatusUpdate):
+    ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_IDS)
+
+
 class LeaveApplicationResponse(LeaveApplicationBase):
     leave_application_id: int
     total_days: Optional[int] = None
@@ -39,3 +44,22 @@ class LeaveApplicationResponse(LeaveApplicationBase):
     fk_manager_id: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class OverlapKind(str, Enum):
+    leave_application = "leave_application"
+    regularization = "regularization"
+
+
+class LeaveOverlap(BaseModel):
+    kind: OverlapKind
+    fk_employee_id: int
+    leave_application_id: int
+    other_id: int = Field(
+        ..., description="The other leave application, or the regularization"
+    )
+
+
+class LeaveOverlapReport(BaseModel):
+    overlaps: List[LeaveOverlap]
+    truncated: bool
@@ -1,6 +1,6 @@
 # schema/leave_schema.py
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -23,3 +23,31 @@ class LeaveResponse(LeaveBase):
     fk_employee_id: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class LeaveBalanceResponse(BaseModel):
+    fk_employee_id: int
+    assign_year: int
+    total_leave: int
+    balance_leave: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LeaveDrift(BaseModel):
+    leave_id: int
+    fk_employee_id: int
+    assign_year: int
+    balance_leave: Optional[int] = None
+    expected_balance: int
+    drift: int
+
+
+class LeaveReconcileResponse(BaseModel):
+    year: Optional[int] = None
+    checked: int
+    drifted: int
+    fixed: bool
+    drift: List[LeaveDrift]
+    drift_truncated: bool
+    duration_ms: float
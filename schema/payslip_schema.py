@@ -31,3 +31,12 @@ class PayslipResponse(PayslipBase):
     fk_employee_id: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class PayrollRunResponse(BaseModel):
+    payslip_month: datetime
+    created: int
+    skipped_existing: int
+    missing_salary: int
+    duration_ms: float
+    rows_per_second: float
@@ -1,8 +1,9 @@
 # schema/regularization_schema.py
 from pydantic import BaseModel, Field, ConfigDict, validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from enum import Enum
+from schema.bulk_schema import BULK_MAX_IDS
 
 
 class Status(str, Enum):
@@ -38,6 +39,10 @@ class RegularizationStatusUpdate(BaseModel):
     regularization_status: Status
 
 
+class RegularizationBulkStatusUpdate(RegularizationStatusUpdate):
+    ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_IDS)
+
+
 class RegularizationResponse(RegularizationBase):
     regularization_id: int
     regularization_status: Status
@@ -0,0 +1,32 @@
+# schema/timesheet_schema.py
+from pydantic import BaseModel, Field
+from typing import List
+from datetime import date
+
+
+class TimesheetDay(BaseModel):
+    work_date: date
+    punch_count: int
+    punched_seconds: int = Field(..., description="Paired punches only")
+    worked_seconds: int = Field(
+        ..., description="Punched time merged with approved regularizations"
+    )
+    regularized: bool
+    on_leave: bool
+    incomplete: bool = Field(..., description="Odd punch count: last punch unpaired")
+
+
+class TimesheetTotals(BaseModel):
+    fk_employee_id: int
+    year: int
+    month: int
+    working_days: int
+    days_present: int
+    leave_days: int
+    incomplete_days: int
+    punched_seconds: int
+    worked_seconds: int
+
+
+class TimesheetResponse(TimesheetTotals):
+    days: List[TimesheetDay]
@@ -0,0 +1,116 @@
+# serve.py
+"""Production launcher: ``python serve.py``.
+
+Runs ``main:app`` under uvicorn's process supervisor with uvloop and
+httptools when they are installed. Settings come from the environment:
+
+    HOST, PORT               bind address (0.0.0.0:8000)
+    WEB_CONCURRENCY          workers; default: CPUs available to the container
+    WEB_MAX_REQUESTS         recycle a worker after this many requests (10000, 0 = never)
+    WEB_MAX_REQUESTS_JITTER  up to this many more per worker, so they recycle apart (1000)
+    WEB_GRACEFUL_TIMEOUT     seconds in-flight requests get on shutdown (30)
+    DB_CONNECTION_BUDGET     database connections for all workers together
+
+With ``DB_CONNECTION_BUDGET`` set, each worker's sync and async pools are
+sized to an equal share of it with no overflow, overriding DB_POOL_SIZE,
+DB_MAX_OVERFLOW, DB_ASYNC_POOL_SIZE and DB_ASYNC_MAX_OVERFLOW.
+"""
+import functools
+import importlib.util
+import math
+import os
+import random
+from typing import Dict, Mapping, Optional
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+CGROUP_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+
+
+def available_cpus(cpu_max_path: str = CGROUP_CPU_MAX) -> int:
+    """CPUs this process may use: the cgroup v2 quota if one is set, else its affinity."""
+    try:
+        with open(cpu_max_path) as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return len(os.sched_getaffinity(0))
+
+
+def worker_count(env: Mapping[str, str], cpus: Optional[int] = None) -> int:
+    if env.get("WEB_CONCURRENCY"):
+        return max(1, int(env["WEB_CONCURRENCY"]))
+    return cpus or available_cpus()
+
+
+def pool_env(budget: int, workers: int) -> Dict[str, str]:
+    """Pool settings that keep ``workers`` processes within ``budget`` connections.
+
+    Each worker gets ``budget // workers``; the sync pool, which serves
+    most handlers, takes the larger half and the async pool the rest.
+    """
+    share = budget // workers
+    if share < 2:
+        raise ValueError(
+            f"DB_CONNECTION_BUDGET={budget} leaves fewer than 2 connections "
+            f"for each of {workers} workers"
+        )
+    return {
+        "DB_POOL_SIZE": str(share - share // 2),
+        "DB_MAX_OVERFLOW": "0",
+        "DB_ASYNC_POOL_SIZE": str(share // 2),
+        "DB_ASYNC_MAX_OVERFLOW": "0",
+    }
+
+
+def build_config(env: Dict[str, str]) -> uvicorn.Config:
+    """The uvicorn config for ``env``, which is updated with the pool settings.
+
+    Workers are spawned processes that import database/database.py afresh,
+    so the pool sizes reach them through the environment.
+    """
+    workers = worker_count(env)
+    env["WEB_CONCURRENCY"] = str(workers)
+    if env.get("DB_CONNECTION_BUDGET"):
+        env.update(pool_env(int(env["DB_CONNECTION_BUDGET"]), workers))
+    return uvicorn.Config(
+        "main:app",
+        host=env.get("HOST", "0.0.0.0"),
+        port=int(env.get("PORT", 8000)),
+        workers=workers,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        proxy_headers=True,
+        forwarded_allow_ips=env.get("FORWARDED_ALLOW_IPS", "*"),
+        timeout_graceful_shutdown=int(env.get("WEB_GRACEFUL_TIMEOUT", 30)),
+        access_log=False,
+    )
+
+
+def serve_worker(
+    config: uvicorn.Config, max_requests: int, jitter: int, sockets=None
+) -> None:
+    """Run one worker; it exits after its request limit and the supervisor
+    starts a fresh one, capping memory growth from long-lived processes."""
+    if max_requests:
+        config.limit_max_requests = max_requests + random.randint(0, jitter)
+    uvicorn.Server(config).run(sockets=sockets)
+
+
+def main(env: Dict[str, str] = os.environ) -> None:
+    config = build_config(env)
+    target = functools.partial(
+        serve_worker,
+        config,
+        int(env.get("WEB_MAX_REQUESTS", 10000)),
+        int(env.get("WEB_MAX_REQUESTS_JITTER", 1000)),
+    )
+    # The supervisor, even for one worker, so recycled workers are replaced
+    Multiprocess(config, target=target, sockets=[config.bind_socket()]).run()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
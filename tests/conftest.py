@@ -1,13 +1,25 @@
+import os
+
+# Keep bcrypt cheap in tests; must be set before the app modules are imported.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from .seed_db import seed_all_tables
 import json
 from pathlib import Path
 from main import app
 from database.models import Base
-from routers.auth import get_db
+from database.sqlite import enable_sqlite_pragmas
+from routers.auth import get_async_db, get_db
+from common.department import department_cache
+from common.role import role_cache
+from common.work_calendar import calendar_cache
+from common.query_stats import QUERY_BUDGET, budget_listeners
 import os
 import inspect
 
@@ -21,6 +33,16 @@ TEST_DB_URL = "sqlite:///./test_db.sqlite3"
 engine = create_engine(TEST_DB_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Same file through aiosqlite. NullPool because each TestClient runs its own
+# event loop and pooled async connections must not outlive it.
+async_engine = create_async_engine(
+    "sqlite+aiosqlite:///./test_db.sqlite3", poolclass=NullPool
+)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+# Same pragmas as the local engine, foreign-key enforcement included
+enable_sqlite_pragmas(engine)
+enable_sqlite_pragmas(async_engine.sync_engine)
+
 # Determine the base directory for test data once
 TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), "test_data")
 
@@ -41,6 +63,10 @@ def db_session():
     # 2. Seed Data using the new external function
     # Pass the session and the path to the test data directory
     seed_all_tables(session, TEST_DATA_DIR)
+    # The tables were just recreated; drop snapshots of the previous test's
+    role_cache.clear()
+    department_cache.clear()
+    calendar_cache.invalidate()
 
     # 3. Yield the session for tests and clean up
     try:
@@ -63,11 +89,35 @@ def client(db_session):
         finally:
             pass
 
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
     return TestClient(app)
 
 
+# ------------------------------
+# QUERY BUDGET
+# ------------------------------
+@pytest.fixture(autouse=True)
+def query_budget():
+    """Fail any test whose requests run more than QUERY_BUDGET queries,
+    which usually means a serializer is lazy-loading a relationship per row."""
+    over = []
+    listener = lambda method, path, stats: over.append(
+        f"{method} {path}: {stats.count} queries"
+    )
+    budget_listeners.append(listener)
+    try:
+        yield over
+    finally:
+        budget_listeners.remove(listener)
+    assert not over, f"Over the {QUERY_BUDGET}-query budget: {over}"
+
+
 # ------------------------------
 # AUTH HELPER FUNCTION
 # ------------------------------
@@ -6,6 +6,8 @@ import datetime
 from datetime import date
 import pytest
 from sqlalchemy.orm import Session
+from common.attendance import rebuild_attendance_daily
+from common.org import rebuild_org_hierarchy
 from database.models import (
     Department,
     Role,
@@ -72,6 +74,7 @@ def seed_all_tables(session: Session, test_data_dir: str):
     ]
     session.add_all(employees_to_add)
     session.commit()
+    rebuild_org_hierarchy(session)
 
     # --- Seed Attendance ---
     attendance_data = load_json_data(test_data_dir, "attendance.json")
@@ -84,6 +87,7 @@ def seed_all_tables(session: Session, test_data_dir: str):
     ]
     session.add_all(attendance_to_add)
     session.commit()
+    rebuild_attendance_daily(session)
 
     # ... Continue with all other seeding blocks, replacing `load_json_data("filename")`
     #     with `load_json_data(test_data_dir, "filename")`
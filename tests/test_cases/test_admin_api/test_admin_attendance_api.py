@@ -1,3 +1,12 @@
+import csv
+import io
+import json
+from datetime import date
+
+from common.attendance import rebuild_attendance_daily
+from database.models import AttendanceDaily
+
+
 # -------------------------------------------------Test User API ---------------------------------------------------
 def test_admin_create_attendance_success(client, admin_user, read_json):
     response = client.post(
@@ -203,3 +212,146 @@ def test_admin_access_admin_attendance_by_empid_employee_not_exist(
     )
     assert response.status_code == 404
     assert response.json() == {"detail": "Employee Not Founds"}
+
+
+def test_admin_access_admin_get_all_attendance_paginated(client, admin_user):
+    headers = {"Authorization": f"Bearer {admin_user}"}
+    response = client.get("/admin/attendance/?limit=10", headers=headers)
+    assert response.status_code == 200
+    assert [a["attendance_id"] for a in response.json()] == list(range(1, 11))
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(
+        f"/admin/attendance/?limit=10&cursor={cursor}", headers=headers
+    )
+    assert response.status_code == 200
+    assert [a["attendance_id"] for a in response.json()] == list(range(11, 21))
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(
+        f"/admin/attendance/?limit=10&cursor={cursor}", headers=headers
+    )
+    assert response.status_code == 200
+    assert [a["attendance_id"] for a in response.json()] == list(range(21, 29))
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_admin_access_admin_get_all_attendance_invalid_cursor(client, admin_user):
+    response = client.get(
+        "/admin/attendance/?cursor=not-a-cursor",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
+
+
+def test_admin_access_admin_get_all_attendance_limit_too_large(client, admin_user):
+    response = client.get(
+        "/admin/attendance/?limit=100000",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 422
+
+
+def test_admin_access_admin_export_attendance_ndjson(client, admin_user, read_json):
+    response = client.get(
+        "/admin/attendance/export",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    expected = read_json(
+        "expected_responses/admin/attendance/get_all_attendance_admin.json"
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows == expected
+
+
+def test_admin_access_admin_export_attendance_csv_in_batches(
+    client, admin_user, monkeypatch
+):
+    monkeypatch.setattr("common.export.EXPORT_BATCH_SIZE", 5)
+    response = client.get(
+        "/admin/attendance/export?format=csv",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="attendance.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 28
+    assert rows[0] == {
+        "punch_time": "2023-01-01T10:00:00",
+        "attendance_id": "1",
+        "fk_employee_id": "1",
+    }
+
+
+def test_admin_access_admin_export_attendance_ndjson_in_batches(
+    client, admin_user, monkeypatch
+):
+    monkeypatch.setattr("common.export.EXPORT_BATCH_SIZE", 5)
+    response = client.get(
+        "/admin/attendance/export?format=ndjson",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 28
+
+
+def test_admin_get_attendance_summary_by_month(client, admin_user):
+    response = client.get(
+        "admin/attendance/summary/month/2023/4",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 8
+    assert sum(d["punch_count"] for d in response.json()) == 16
+
+
+def test_admin_get_attendance_summary_by_month_pages(client, admin_user):
+    headers = {"Authorization": f"Bearer {admin_user}"}
+    url = "admin/attendance/summary/month/2023/4?limit=3"
+    pages, cursor = [], None
+    while True:
+        response = client.get(
+            url + (f"&cursor={cursor}" if cursor else ""), headers=headers
+        )
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert [len(page) for page in pages] == [3, 3, 2]
+    keys = [(d["fk_employee_id"], d["work_date"]) for page in pages for d in page]
+    assert keys == sorted(set(keys))
+
+
+def test_admin_get_attendance_summary_by_month_invalid(client, admin_user):
+    response = client.get(
+        "admin/attendance/summary/month/2023/13",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 400
+
+
+def test_admin_get_attendance_summary_by_month_forbidden(client, user_A1):
+    response = client.get(
+        "admin/attendance/summary/month/2023/4",
+        headers={"Authorization": f"Bearer {user_A1}"},
+    )
+    assert response.status_code == 403
+
+
+def test_rebuild_attendance_daily_replaces_range(db_session):
+    db_session.query(AttendanceDaily).update({AttendanceDaily.punch_count: 99})
+    db_session.commit()
+
+    written = rebuild_attendance_daily(db_session, date(2023, 4, 1), date(2023, 4, 1))
+
+    assert written == 2
+    counts = {
+        d.work_date: d.punch_count for d in db_session.query(AttendanceDaily).all()
+    }
+    assert counts[date(2023, 4, 1)] == 2
+    assert counts[date(2023, 4, 2)] == 99
@@ -0,0 +1,191 @@
+# -------------------------------------------------Test Admin API ---------------------------------------------------
+def _create_location(client, token, name="Dubai", weekly_offs="sat, fri"):
+    return client.post(
+        "/admin/calendar/locations",
+        json={"location_name": name, "weekly_offs": weekly_offs},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+
+def test_admin_create_and_list_locations(client, admin_user):
+    response = _create_location(client, admin_user)
+    assert response.status_code == 201
+    assert response.json() == {
+        "location_id": 1,
+        "location_name": "Dubai",
+        "weekly_offs": "Fri,Sat",
+    }
+    response = client.get(
+        "/admin/calendar/locations", headers={"Authorization": f"Bearer {admin_user}"}
+    )
+    assert response.json() == [
+        {"location_id": 1, "location_name": "Dubai", "weekly_offs": "Fri,Sat"}
+    ]
+
+
+def test_admin_create_location_duplicate(client, admin_user):
+    _create_location(client, admin_user)
+    response = _create_location(client, admin_user, name="dubai")
+    assert response.status_code == 409
+    assert response.json() == {"detail": "Location 'dubai' already exists"}
+
+
+def test_admin_create_location_unknown_weekday(client, admin_user):
+    response = _create_location(client, admin_user, weekly_offs="Sun,Funday")
+    assert response.status_code == 422
+
+
+def test_admin_holidays_create_list_delete(client, admin_user):
+    headers = {"Authorization": f"Bearer {admin_user}"}
+    _create_location(client, admin_user)
+    payloads = [
+        {"holiday_date": "2025-12-25", "holiday_name": "Christmas"},
+        {
+            "holiday_date": "2025-12-02",
+            "holiday_name": "National Day",
+            "fk_location_id": 1,
+        },
+        {"holiday_date": "2026-01-01", "holiday_name": "New Year"},
+    ]
+    for payload in payloads:
+        assert (
+            client.post(
+                "/admin/calendar/holidays", json=payload, headers=headers
+            ).status_code
+            == 201
+        )
+
+    response = client.get("/admin/calendar/holidays?year=2025", headers=headers)
+    assert [(h["holiday_date"], h["fk_location_id"]) for h in response.json()] == [
+        ("2025-12-02", 1),
+        ("2025-12-25", None),
+    ]
+    holiday_id = response.json()[1]["holiday_id"]
+    response = client.delete(f"/admin/calendar/holidays/{holiday_id}", headers=headers)
+    assert response.status_code == 204
+    response = client.get("/admin/calendar/holidays?year=2025", headers=headers)
+    assert len(response.json()) == 1
+
+
+def test_admin_holidays_pages(client, admin_user):
+    headers = {"Authorization": f"Bearer {admin_user}"}
+    for day in ("2025-01-26", "2025-08-15", "2025-10-02"):
+        payload = {"holiday_date": day, "holiday_name": f"Holiday {day}"}
+        client.post("/admin/calendar/holidays", json=payload, headers=headers)
+
+    first = client.get("/admin/calendar/holidays?year=2025&limit=2", headers=headers)
+    assert [h["holiday_date"] for h in first.json()] == ["2025-01-26", "2025-08-15"]
+    cursor = first.headers["X-Next-Cursor"]
+    second = client.get(
+        f"/admin/calendar/holidays?year=2025&limit=2&cursor={cursor}", headers=headers
+    )
+    assert second.status_code == 200
+    assert [h["holiday_date"] for h in second.json()] == ["2025-10-02"]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_admin_create_holiday_duplicate(client, admin_user):
+    headers = {"Authorization": f"Bearer {admin_user}"}
+    payload = {"holiday_date": "2025-12-25", "holiday_name": "Christmas"}
+    client.post("/admin/calendar/holidays", json=payload, headers=headers)
+    response = client.post("/admin/calendar/holidays", json=payload, headers=headers)
+    assert response.status_code == 409
+    assert response.json() == {"detail": "Holiday already exists on 2025-12-25"}
+
+
+def test_admin_create_holiday_unknown_location(client, admin_user):
+    response = client.post(
+        "/admin/calendar/holidays",
+        json={
+            "holiday_date": "2025-12-25",
+            "holiday_name": "Christmas",
+            "fk_location_id": 9,
+        },
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Location not found"}
+
+
+def test_admin_delete_holiday_not_found(client, admin_user):
+    response = client.delete(
+        "/admin/calendar/holidays/99", headers={"Authorization": f"Bearer {admin_user}"}
+    )
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Holiday not found"}
+
+
+def test_admin_recompute_leave_days(client, admin_user, user_A1):
+    # Seeded applications were counted in calendar days, weekends included
+    response = client.post(
+        "/admin/calendar/recompute-leave-days",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["checked"], body["updated"], body["balances_adjusted"]) == (8, 7, 3)
+
+    response = client.get(
+        "/user/my/leave-applications/status/Approved",
+        headers={"Authorization": f"Bearer {user_A1}"},
+    )
+    assert [a["total_days"] for a in response.json()] == [4]
+    # Application 2 (Approved, 5 -> 4 days) gave one day back
+    response = client.get(
+        "/user/my/leave/balance/2025", headers={"Authorization": f"Bearer {user_A1}"}
+    )
+    assert response.json()["balance_leave"] == 32
+
+    response = client.post(
+        "/admin/calendar/recompute-leave-days",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.json()["updated"] == 0
+
+
+def test_admin_leave_days_follow_employee_location(client, admin_user, user_A1):
+    admin_headers = {"Authorization": f"Bearer {admin_user}"}
+    _create_location(client, admin_user)
+    response = client.put(
+        "/admin/employees/id/4", json={"fk_location_id": 1}, headers=admin_headers
+    )
+    assert response.json()["fk_location_id"] == 1
+
+    def apply(start, end):
+        return client.post(
+            "/user/my/leave-applications/",
+            json={
+                "from_date": start,
+                "end_date": end,
+                "leave_reason": "Visiting family",
+            },
+            headers={"Authorization": f"Bearer {user_A1}"},
+        )
+
+    # Friday is a weekly off in Dubai; Sunday is not
+    response = apply("2025-12-05T09:00:00Z", "2025-12-06T18:00:00Z")
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Leave range has no working days"}
+    response = apply("2025-12-05T09:00:00Z", "2025-12-07T18:00:00Z")
+    assert response.status_code == 201
+    assert response.json()["total_days"] == 1
+
+    client.post(
+        "/admin/calendar/holidays",
+        json={
+            "holiday_date": "2025-12-15",
+            "holiday_name": "Founders Day",
+            "fk_location_id": 1,
+        },
+        headers=admin_headers,
+    )
+    response = apply("2025-12-14T09:00:00Z", "2025-12-16T18:00:00Z")
+    assert response.json()["total_days"] == 2
+
+
+def test_admin_calendar_forbidden(client, manager_A):
+    headers = {"Authorization": f"Bearer {manager_A}"}
+    assert client.get("/admin/calendar/locations", headers=headers).status_code == 403
+    response = client.post("/admin/calendar/recompute-leave-days", headers=headers)
+    assert response.status_code == 403
+    assert response.json() == {"detail": "Admin privileges required"}
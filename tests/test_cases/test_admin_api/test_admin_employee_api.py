@@ -1,3 +1,10 @@
+import json
+
+import common.employee_import
+from common.org import rebuild_org_hierarchy
+from database.models import Employee, EmployeeHierarchy
+
+
 # -------------------------------------------------Test User API ---------------------------------------------------
 def test_admin_get_my_profile_success(client, admin_user, read_json):
     response = client.get(
@@ -333,3 +340,278 @@ def test_admin_access_admin_delete_employee_by_email_not_found(
 
     assert response.status_code == 404
     assert response.json() == {"detail": "Employee not found"}
+
+
+def _closure(db_session):
+    db_session.expire_all()
+    return sorted(
+        (h.ancestor_id, h.descendant_id, h.depth)
+        for h in db_session.query(EmployeeHierarchy).all()
+    )
+
+
+def _assert_closure_matches_rebuild(db_session):
+    maintained = _closure(db_session)
+    rebuild_org_hierarchy(db_session)
+    assert maintained == _closure(db_session)
+
+
+def test_admin_employee_changes_maintain_org_tree(client, db_session, admin_user):
+    headers = {"Authorization": f"Bearer {admin_user}"}
+    payload = {
+        "first_name": "New",
+        "last_name": "Report",
+        "email": "new.report@test.com",
+        "joining_date": "2025-11-27",
+        "isadmin": False,
+        "fk_department_id": 1,
+        "fk_role_id": 1,
+        "fk_manager_id": 4,
+        "password": "secret",
+    }
+    response = client.post("/admin/employees/", json=payload, headers=headers)
+    assert response.status_code == 201
+    new_id = response.json()["employee_id"]
+    assert (1, new_id, 3) in _closure(db_session)
+    _assert_closure_matches_rebuild(db_session)
+
+    # Move userA1 (and the new report) from manager A to manager B
+    response = client.put(
+        "/admin/employees/id/4", json={"fk_manager_id": 3}, headers=headers
+    )
+    assert response.status_code == 200
+    closure = _closure(db_session)
+    assert (3, new_id, 2) in closure
+    assert (2, new_id, 2) not in closure
+    _assert_closure_matches_rebuild(db_session)
+
+    response = client.delete("/admin/employees/id/3", headers=headers)
+    assert response.status_code == 200
+    closure = _closure(db_session)
+    assert not [row for row in closure if 3 in row[:2]]
+    assert (1, 4, 2) not in closure
+    _assert_closure_matches_rebuild(db_session)
+
+
+def test_admin_update_employee_manager_cycle_rejected(client, admin_user):
+    response = client.put(
+        "/admin/employees/email/managerA@test.com",
+        json={"fk_manager_id": 4},
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 400
+    assert response.json() == {
+        "detail": "An employee cannot report to themselves or their own subordinate"
+    }
+
+
+def test_admin_create_employee_unknown_location(client, admin_user):
+    payload = {
+        "first_name": "Far",
+        "last_name": "Away",
+        "email": "far.away@test.com",
+        "joining_date": "2025-11-27",
+        "isadmin": False,
+        "fk_department_id": 1,
+        "fk_role_id": 1,
+        "fk_location_id": 999,
+        "password": "secret",
+    }
+    response = client.post(
+        "/admin/employees/",
+        json=payload,
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Location not found"}
+
+
+def test_admin_update_employee_unknown_location(client, admin_user):
+    response = client.put(
+        "/admin/employees/id/4",
+        json={"fk_location_id": 999},
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Location not found"}
+
+
+def test_admin_create_employee_without_manager_is_a_root(
+    client, db_session, admin_user
+):
+    payload = {
+        "first_name": "Top",
+        "last_name": "Level",
+        "email": "top.level@test.com",
+        "joining_date": "2025-11-27",
+        "isadmin": False,
+        "fk_department_id": 1,
+        "fk_role_id": 1,
+        "fk_manager_id": None,
+        "password": "secret",
+    }
+    response = client.post(
+        "/admin/employees/",
+        json=payload,
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 201
+    new_id = response.json()["employee_id"]
+    assert [row for row in _closure(db_session) if new_id in row[:2]] == [
+        (new_id, new_id, 0)
+    ]
+
+
+IMPORT_CSV = """first_name,last_name,email,joining_date,isadmin,department,role,fk_department_id,fk_role_id,fk_manager_id,manager_email,password
+Ada,Lead,ada@acq.com,2025-01-06,false,engineering,MANAGER,,,,managerA@test.com,pw-ada
+Bob,Dev,bob@acq.com,2025-01-06,false,,,4,3,,ada@acq.com,pw-bob
+Cy,Dev,cy@acq.com,2025-01-06,false,Engineering,Developer,,,2,,pw-cy
+Dup,Existing,userA1@test.com,2025-01-06,false,Engineering,Developer,,,,,pw
+Dup,InFile,bob@acq.com,2025-01-06,false,Engineering,Developer,,,,,pw
+No,Dept,nodept@acq.com,2025-01-06,false,Marketing,Developer,,,,,pw
+No,Role,norole@acq.com,2025-01-06,false,,,4,99,,,pw
+No,Password,nopw@acq.com,2025-01-06,false,Engineering,Developer,,,,,
+Lost,Manager,lost@acq.com,2025-01-06,false,Engineering,Developer,,,,ghost@acq.com,pw
+Bad,ManagerId,badmgr@acq.com,2025-01-06,false,Engineering,Developer,,,999,,pw
+"""
+
+
+def _import(client, token, content, fmt="csv", **params):
+    return client.post(
+        "/admin/employees/import",
+        params={"format": fmt, **params},
+        files={"file": (f"employees.{fmt}", content.encode(), "text/plain")},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+
+def test_admin_import_employees_csv_with_row_errors(client, db_session, admin_user):
+    response = _import(client, admin_user, IMPORT_CSV)
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["total_rows"], body["created"], body["failed"]) == (10, 3, 7)
+    assert body["errors_truncated"] is False
+    assert {e["row"]: e["errors"] for e in body["errors"]} == {
+        5: ["email: already exists"],
+        6: ["email: already exists"],
+        7: ["department: unknown 'Marketing'"],
+        8: ["fk_role_id: unknown id 99"],
+        9: ["password: Field required"],
+        10: ["manager_email: no employee 'ghost@acq.com'"],
+        11: ["fk_manager_id: unknown employee"],
+    }
+
+    db_session.expire_all()
+    ada, bob, cy = (
+        db_session.query(Employee).filter(Employee.email == email).one()
+        for email in ("ada@acq.com", "bob@acq.com", "cy@acq.com")
+    )
+    assert (ada.fk_department_id, ada.fk_role_id, ada.fk_manager_id) == (4, 2, 2)
+    assert bob.fk_manager_id == ada.employee_id
+    assert cy.fk_manager_id == 2
+    assert (1, bob.employee_id, 3) in _closure(db_session)
+    _assert_closure_matches_rebuild(db_session)
+
+    response = client.post(
+        "/auth/token", data={"username": "bob@acq.com", "password": "pw-bob"}
+    )
+    assert response.status_code == 200
+
+
+def test_admin_import_employees_ndjson_across_chunks(
+    client, db_session, admin_user, monkeypatch
+):
+    monkeypatch.setattr(common.employee_import, "IMPORT_CHUNK_SIZE", 2)
+    monkeypatch.setattr(common.employee_import, "IMPORT_MAX_ERRORS", 1)
+    base = {
+        "joining_date": "2025-01-06",
+        "isadmin": False,
+        "fk_department_id": 4,
+        "fk_role_id": 3,
+        "password": "pw",
+    }
+    lines = [
+        json.dumps({**base, "first_name": "A", "last_name": "1", "email": "a@nd.com"}),
+        "",
+        "not json",
+        json.dumps(["not", "an", "object"]),
+        json.dumps(
+            {
+                **base,
+                "first_name": "B",
+                "last_name": "2",
+                "email": "b@nd.com",
+                "manager_email": "a@nd.com",
+            }
+        ),
+        json.dumps({**base, "first_name": "A", "last_name": "3", "email": "a@nd.com"}),
+    ]
+    response = _import(client, admin_user, "\n".join(lines) + "\n", fmt="ndjson")
+    body = response.json()
+    assert (body["total_rows"], body["created"], body["failed"]) == (5, 2, 3)
+    assert body["errors"] == [
+        {"row": 3, "email": None, "errors": ["Row is not a JSON object"]}
+    ]
+    assert body["errors_truncated"] is True
+    _assert_closure_matches_rebuild(db_session)
+
+
+def test_admin_import_employees_unknown_location(client, db_session, admin_user):
+    client.post(
+        "/admin/calendar/locations",
+        json={"location_name": "Dubai", "weekly_offs": "Fri,Sat"},
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    content = (
+        "first_name,last_name,email,joining_date,isadmin,fk_department_id,"
+        "fk_role_id,fk_location_id,password\n"
+        "In,Dubai,dubai@acq.com,2025-01-06,false,4,3,1,pw\n"
+        "No,Where,nowhere@acq.com,2025-01-06,false,4,3,999,pw\n"
+    )
+    response = _import(client, admin_user, content)
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["failed"]) == (1, 1)
+    assert body["errors"] == [
+        {
+            "row": 3,
+            "email": "nowhere@acq.com",
+            "errors": ["fk_location_id: unknown id 999"],
+        }
+    ]
+    db_session.expire_all()
+    employee = db_session.query(Employee).filter_by(email="dubai@acq.com").one()
+    assert employee.fk_location_id == 1
+
+
+def test_admin_import_employees_dry_run_writes_nothing(client, db_session, admin_user):
+    response = _import(client, admin_user, IMPORT_CSV, dry_run="true")
+    assert response.json()["created"] == 3
+    assert response.json()["dry_run"] is True
+    db_session.expire_all()
+    assert (
+        db_session.query(Employee).filter(Employee.email == "ada@acq.com").count() == 0
+    )
+
+
+def test_user_import_employees_forbidden(client, user_A1):
+    response = _import(client, user_A1, IMPORT_CSV)
+    assert response.status_code == 403
+
+
+def test_admin_delete_manager_detaches_reports_and_inbox(
+    client, admin_user, db_session
+):
+    from database.models import Regularization
+
+    response = client.delete(
+        "/admin/employees/id/3", headers={"Authorization": f"Bearer {admin_user}"}
+    )
+    assert response.status_code == 200
+    db_session.expire_all()
+    assert [
+        e.fk_manager_id
+        for e in db_session.query(Employee).filter(Employee.employee_id.in_([6, 7]))
+    ] == [None, None]
+    assert db_session.get(Regularization, 5).fk_manager_id is None
+    _assert_closure_matches_rebuild(db_session)
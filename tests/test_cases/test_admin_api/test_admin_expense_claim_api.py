@@ -1,3 +1,7 @@
+import csv
+import io
+
+
 # -------------------------------------------------Test User API ---------------------------------------------------
 def test_admin_create_expense_claim_fail(client, admin_user, read_json):
     response = client.post(
@@ -306,3 +310,50 @@ def test_admin_admin_access_update_expense_claim_status_not_found(
     )
     assert response.status_code == 404
     assert response.json() == {"detail": "Expense claim not found"}
+
+
+def test_admin_get_employee_expense_by_empid_paginated(client, admin_user):
+    headers = {"Authorization": f"Bearer {admin_user}"}
+    response = client.get("/admin/expense-claims/employee/2?limit=1", headers=headers)
+    assert response.status_code == 200
+    assert [c["claim_id"] for c in response.json()] == [2]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(
+        f"/admin/expense-claims/employee/2?limit=1&cursor={cursor}", headers=headers
+    )
+    assert response.status_code == 200
+    assert [c["claim_id"] for c in response.json()] == [1]
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_admin_get_employee_expense_by_empid_cursor_from_other_listing(
+    client, admin_user
+):
+    headers = {"Authorization": f"Bearer {admin_user}"}
+    response = client.get("/admin/attendance/?limit=1", headers=headers)
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(
+        f"/admin/expense-claims/employee/2?cursor={cursor}", headers=headers
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
+
+
+def test_admin_export_expense_claims_by_month_csv(client, admin_user):
+    response = client.get(
+        "/admin/expense-claims/month/2025/4/export?format=csv",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [r["claim_id"] for r in rows] == ["5", "6", "8", "9"]
+
+
+def test_admin_export_expense_claims_by_month_invalid_format(client, admin_user):
+    response = client.get(
+        "/admin/expense-claims/month/2025/4/export?format=xlsx",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 422
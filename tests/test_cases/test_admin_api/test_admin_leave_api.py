@@ -212,3 +212,95 @@ def test_admin_admin_access_delete_leave_by_id_not_found(client, admin_user, rea
     )
     assert response.status_code == 404
     assert response.json() == {"detail": "Leave record with ID 100 not found"}
+
+
+def test_admin_reconcile_leave_balances_reports_drift(client, admin_user):
+    # Seeded 2025 balances ignore the applications seeded as Approved
+    response = client.post(
+        "admin/leaves/reconcile?year=2025",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["year"], body["checked"], body["drifted"]) == (2025, 7, 4)
+    assert body["fixed"] is False
+    assert body["drift_truncated"] is False
+    assert {
+        (d["fk_employee_id"], d["expected_balance"], d["drift"]) for d in body["drift"]
+    } == {
+        (1, 28, 3),
+        (4, 26, 5),
+        (5, 24, 7),
+        (6, 30, 1),
+    }
+    again = client.post(
+        "admin/leaves/reconcile?year=2025",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert again.json()["drifted"] == 4
+
+
+def test_admin_reconcile_leave_balances_fix(client, admin_user, user_A1, db_session):
+    from database.models import LeaveLedgerEntry, LedgerReason
+
+    response = client.post(
+        "admin/leaves/reconcile?fix=true",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 200
+    assert (response.json()["checked"], response.json()["drifted"]) == (21, 4)
+    balance = client.get(
+        "/user/my/leave/balance/2025", headers={"Authorization": f"Bearer {user_A1}"}
+    )
+    assert balance.json()["balance_leave"] == 26
+
+    entry = (
+        db_session.query(LeaveLedgerEntry)
+        .filter(LeaveLedgerEntry.employee_id == 4)
+        .one()
+    )
+    assert (entry.delta, entry.reason) == (-5, LedgerReason.Reconciliation)
+    response = client.post(
+        "admin/leaves/reconcile", headers={"Authorization": f"Bearer {admin_user}"}
+    )
+    assert response.json()["drifted"] == 0
+
+
+def test_admin_reconcile_leave_balances_truncates_report(
+    client, admin_user, monkeypatch
+):
+    monkeypatch.setattr("common.leave_ledger.RECONCILE_MAX_REPORTED", 1)
+    response = client.post(
+        "admin/leaves/reconcile", headers={"Authorization": f"Bearer {admin_user}"}
+    )
+    assert len(response.json()["drift"]) == 1
+    assert response.json()["drift_truncated"] is True
+
+
+def test_admin_reconcile_leave_balances_forbidden(client, manager_A):
+    response = client.post(
+        "admin/leaves/reconcile", headers={"Authorization": f"Bearer {manager_A}"}
+    )
+    assert response.status_code == 403
+    assert response.json() == {"detail": "Admin privileges required"}
+
+
+def test_adjust_balances_touches_only_the_given_years(db_session):
+    from common.leave_ledger import adjust_balances
+    from database.models import Leave, LeaveLedgerEntry, LedgerReason
+
+    adjust_balances(
+        db_session,
+        {(4, 2024): 2, (5, 2025): -1, (6, 2025): 0},
+        LedgerReason.Recalculation,
+    )
+    db_session.commit()
+    balances = {
+        (leave.fk_employee_id, leave.assign_year): leave.balance_leave
+        for leave in db_session.query(Leave).filter(Leave.fk_employee_id.in_([4, 5, 6]))
+    }
+    assert balances[(4, 2024)] == 30
+    assert balances[(5, 2025)] == 30
+    # Rows fetched alongside but not named keep their balance
+    assert (balances[(4, 2025)], balances[(5, 2024)]) == (31, 28)
+    assert db_session.query(LeaveLedgerEntry).count() == 2
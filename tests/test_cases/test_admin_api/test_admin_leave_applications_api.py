@@ -294,3 +294,103 @@ def test_admin_admin_access_update_employee_leave_application_status_by_id_not_f
     )
     assert response.status_code == 404
     assert response.json() == {"detail": "Leave application not found"}
+
+
+def _add_overlaps(db_session):
+    from datetime import datetime
+    from database.models import LeaveApplication, Regularization
+
+    db_session.add_all(
+        [
+            LeaveApplication(
+                leave_application_id=9,
+                from_date=datetime(2025, 5, 12, 14),
+                end_date=datetime(2025, 5, 14, 18),
+                total_days=3,
+                leave_status="Pending",
+                leave_reason="Imported",
+                fk_employee_id=4,
+                fk_manager_id=2,
+            ),
+            LeaveApplication(
+                leave_application_id=10,
+                from_date=datetime(2025, 6, 5, 9),
+                end_date=datetime(2025, 6, 5, 18),
+                total_days=1,
+                leave_status="Rejected",
+                leave_reason="Imported",
+                fk_employee_id=4,
+                fk_manager_id=2,
+            ),
+        ]
+        + [
+            Regularization(
+                regularization_id=reg_id,
+                regularization_start_time=datetime(2025, 7, day, 9),
+                regularization_end_time=datetime(2025, 7, day, 18),
+                regularization_reason="Imported",
+                regularization_status=reg_status,
+                fk_employee_id=5,
+                fk_manager_id=2,
+            )
+            for reg_id, day, reg_status in [(8, 3, "Pending"), (9, 4, "Rejected")]
+        ]
+    )
+    db_session.commit()
+
+
+def test_admin_get_leave_overlaps_none(client, admin_user):
+    response = client.get(
+        "/admin/leave-applications/overlaps",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"overlaps": [], "truncated": False}
+
+
+def test_admin_get_leave_overlaps_success(client, admin_user, db_session):
+    _add_overlaps(db_session)
+    response = client.get(
+        "/admin/leave-applications/overlaps",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "overlaps": [
+            {
+                "kind": "leave_application",
+                "fk_employee_id": 4,
+                "leave_application_id": 1,
+                "other_id": 9,
+            },
+            {
+                "kind": "regularization",
+                "fk_employee_id": 5,
+                "leave_application_id": 5,
+                "other_id": 8,
+            },
+        ],
+        "truncated": False,
+    }
+
+
+def test_admin_get_leave_overlaps_truncated(
+    client, admin_user, db_session, monkeypatch
+):
+    monkeypatch.setattr("common.leave_application.OVERLAP_REPORT_MAX", 1)
+    _add_overlaps(db_session)
+    response = client.get(
+        "/admin/leave-applications/overlaps",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert len(response.json()["overlaps"]) == 1
+    assert response.json()["truncated"] is True
+
+
+def test_admin_get_leave_overlaps_forbidden(client, manager_A):
+    response = client.get(
+        "/admin/leave-applications/overlaps",
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 403
+    assert response.json() == {"detail": "Admin privileges required"}
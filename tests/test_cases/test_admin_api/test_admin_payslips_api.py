@@ -1,3 +1,6 @@
+import json
+
+
 # -------------------------------------------------Test User API ---------------------------------------------------
 def test_admin_get_all_my_payslips_success(client, admin_user, read_json):
     response = client.get(
@@ -41,7 +44,7 @@ def test_admin_admin_access_create_payslips_success(client, admin_user, read_jso
         "special_allowance": 0,
         "internet_allowance": 0,
         "payslip_month": "2025-11-01T00:00:00.000Z",
-        "fk_employee_id": 0,
+        "fk_employee_id": 7,
     }
     response = client.post(
         "/admin/payslips/",
@@ -181,3 +184,121 @@ def test_admin_admin_access_delete_payslips_by_id_not_found(
     )
     assert response.status_code == 404
     assert response.json() == {"detail": "Payslip not found"}
+
+
+def test_admin_export_payslips_by_month_ndjson(client, admin_user):
+    response = client.get(
+        "/admin/payslips/month/2025/2/export",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["fk_employee_id"] for r in rows] == [1, 2, 3, 4, 5, 6, 7]
+    assert all(r["payslip_month"] == "2025-02-01T00:00:00" for r in rows)
+
+
+def test_admin_export_payslips_by_month_csv_empty(client, admin_user):
+    response = client.get(
+        "/admin/payslips/month/2025/4/export?format=csv",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 200
+    assert 'filename="payslips-2025-04.csv"' in response.headers["content-disposition"]
+    assert response.text.splitlines() == [
+        "basic_amount,hra,special_allowance,internet_allowance,payslip_month,payslip_id,fk_employee_id"
+    ]
+
+
+def test_admin_get_payslips_by_invalid_month(client, admin_user):
+    response = client.get(
+        "/admin/payslips/month/2025/13",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid year or month"}
+
+
+def test_admin_payroll_run_creates_missing_payslips(client, admin_user, user_A1):
+    admin = {"Authorization": f"Bearer {admin_user}"}
+    user = {"Authorization": f"Bearer {user_A1}"}
+    tag = client.get("/user/my/payslips/", headers=user).headers["ETag"]
+
+    response = client.post("/admin/payslips/run/2023/6", headers=admin)
+    assert response.status_code == 201
+    body = response.json()
+    assert body["payslip_month"] == "2023-06-01T00:00:00"
+    assert (body["created"], body["skipped_existing"], body["missing_salary"]) == (
+        7,
+        0,
+        0,
+    )
+    assert body["rows_per_second"] > 0
+
+    # Employee 1 has two 2023 salaries; the later one (20 LPA) is used
+    response = client.get("/admin/payslips/employee/1/month/2023/6", headers=admin)
+    assert response.json()["basic_amount"] == 83333.33
+    response = client.get("/user/my/payslips/month/2023/6", headers=user)
+    assert response.json() == {
+        "basic_amount": 12500.0,
+        "hra": 5000.0,
+        "special_allowance": 6500.0,
+        "internet_allowance": 1000.0,
+        "payslip_month": "2023-06-01T00:00:00",
+        "payslip_id": response.json()["payslip_id"],
+        "fk_employee_id": 4,
+    }
+
+    response = client.get("/user/my/payslips/", headers={**user, "If-None-Match": tag})
+    assert response.status_code == 200
+    tag = response.headers["ETag"]
+
+    response = client.post("/admin/payslips/run/2023/6", headers=admin)
+    assert (response.json()["created"], response.json()["skipped_existing"]) == (0, 7)
+    response = client.get("/user/my/payslips/", headers={**user, "If-None-Match": tag})
+    assert response.status_code == 304
+
+    # Second run for a new month bumps the counter rows created by the first
+    response = client.post("/admin/payslips/run/2024/6", headers=admin)
+    assert (response.json()["created"], response.json()["missing_salary"]) == (6, 1)
+    response = client.get("/user/my/payslips/", headers={**user, "If-None-Match": tag})
+    assert response.status_code == 200
+
+
+def test_admin_payroll_run_ignores_deleted_employees(client, admin_user):
+    admin = {"Authorization": f"Bearer {admin_user}"}
+    for employee_id in (6, 7):
+        response = client.delete(f"/admin/employees/id/{employee_id}", headers=admin)
+        assert response.status_code == 200
+
+    # Their salary rows remain with fk_employee_id NULL
+    response = client.post("/admin/payslips/run/2023/7", headers=admin)
+    assert response.status_code == 201
+    body = response.json()
+    assert (body["created"], body["skipped_existing"], body["missing_salary"]) == (
+        5,
+        0,
+        0,
+    )
+
+
+def test_admin_payroll_run_skips_month_already_paid(client, admin_user):
+    response = client.post(
+        "/admin/payslips/run/2025/3", headers={"Authorization": f"Bearer {admin_user}"}
+    )
+    assert response.status_code == 201
+    assert (response.json()["created"], response.json()["skipped_existing"]) == (0, 7)
+
+
+def test_admin_payroll_run_invalid_month(client, admin_user):
+    response = client.post(
+        "/admin/payslips/run/2025/13", headers={"Authorization": f"Bearer {admin_user}"}
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid year or month"}
+
+
+def test_user_payroll_run_forbidden(client, user_A1):
+    response = client.post(
+        "/admin/payslips/run/2025/4", headers={"Authorization": f"Bearer {user_A1}"}
+    )
+    assert response.status_code == 403
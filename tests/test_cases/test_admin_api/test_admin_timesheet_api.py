@@ -0,0 +1,85 @@
+import json
+
+
+def test_admin_get_employee_timesheet_with_regularization(client, admin_user):
+    response = client.get(
+        "/admin/timesheets/2025/4/employee/7",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    # Only the approved regularization counts; the pending one on the 19th does not
+    assert body["days"] == [
+        {
+            "work_date": "2025-04-12",
+            "punch_count": 0,
+            "punched_seconds": 0,
+            "worked_seconds": 7200,
+            "regularized": True,
+            "on_leave": False,
+            "incomplete": False,
+        }
+    ]
+    assert (body["days_present"], body["worked_seconds"]) == (1, 7200)
+
+
+def test_admin_get_employee_timesheet_not_found(client, admin_user):
+    response = client.get(
+        "/admin/timesheets/2025/4/employee/99",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Employee not found"}
+
+
+def test_admin_export_timesheets_ndjson(client, admin_user):
+    response = client.get(
+        "/admin/timesheets/2023/1", headers={"Authorization": f"Bearer {admin_user}"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["fk_employee_id"] for row in rows] == [1, 2, 3, 4, 5, 6, 7]
+    assert [row["worked_seconds"] for row in rows] == [2400, 1800, 1800, 0, 0, 0, 0]
+    assert rows[0] == {
+        "fk_employee_id": 1,
+        "year": 2023,
+        "month": 1,
+        "working_days": 22,
+        "days_present": 1,
+        "leave_days": 0,
+        "incomplete_days": 0,
+        "punched_seconds": 2400,
+        "worked_seconds": 2400,
+    }
+
+
+def test_admin_export_timesheets_csv(client, admin_user):
+    response = client.get(
+        "/admin/timesheets/2025/7?format=csv",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    lines = response.text.splitlines()
+    assert lines[0] == (
+        "fk_employee_id,year,month,working_days,days_present,leave_days,"
+        "incomplete_days,punched_seconds,worked_seconds"
+    )
+    # userA2's leave runs 2025-07-01..07-07: five working days
+    assert lines[5] == "5,2025,7,23,0,5,0,0,0"
+
+
+def test_admin_export_timesheets_invalid_month(client, admin_user):
+    response = client.get(
+        "/admin/timesheets/2025/0", headers={"Authorization": f"Bearer {admin_user}"}
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid year or month"}
+
+
+def test_admin_timesheets_forbidden(client, manager_A):
+    headers = {"Authorization": f"Bearer {manager_A}"}
+    response = client.get("/admin/timesheets/2025/4", headers=headers)
+    assert response.status_code == 403
+    assert response.json() == {"detail": "Admin privileges required"}
+    response = client.get("/admin/timesheets/2025/4/employee/4", headers=headers)
+    assert response.status_code == 403
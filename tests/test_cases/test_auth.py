@@ -0,0 +1,140 @@
+import time
+
+import database.common
+import routers.auth
+from common.token_cache import TokenCache
+from database.models import Employee
+
+
+def _password_of(db_session, email):
+    db_session.expire_all()
+    return db_session.query(Employee).filter(Employee.email == email).one().password
+
+
+def _login(client, email, password):
+    return client.post("/auth/token", data={"username": email, "password": password})
+
+
+def test_login_upgrades_plaintext_password_to_hash(client, db_session):
+    response = _login(client, "userA1@test.com", "pass123")
+    assert response.status_code == 200
+
+    stored = _password_of(db_session, "userA1@test.com")
+    assert stored.startswith("$2b$04$")
+    assert _login(client, "userA1@test.com", "pass123").status_code == 200
+    assert _password_of(db_session, "userA1@test.com") == stored
+
+
+def test_login_wrong_password_unauthorized(client, db_session):
+    assert _login(client, "userA1@test.com", "pass123").status_code == 200
+
+    response = _login(client, "userA1@test.com", "wrong")
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid email or password"}
+
+
+def test_login_unknown_email_checks_dummy_hash(client, monkeypatch):
+    checked = []
+
+    def spy(password, hashed_password):
+        checked.append(hashed_password)
+        return database.common.verify_password(password, hashed_password)
+
+    monkeypatch.setattr(routers.auth, "verify_password", spy)
+    response = _login(client, "nobody@test.com", "pass123")
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid email or password"}
+    assert checked == [routers.auth._DUMMY_PASSWORD_HASH]
+
+
+def test_login_unknown_email_counts_against_hash_queue(client, monkeypatch):
+    monkeypatch.setattr(routers.auth, "HASH_QUEUE_LIMIT", 0)
+
+    response = _login(client, "nobody@test.com", "pass123")
+    assert response.status_code == 503
+
+
+def test_login_rehashes_when_cost_changes(client, db_session, monkeypatch):
+    assert _login(client, "userA1@test.com", "pass123").status_code == 200
+    monkeypatch.setattr(database.common, "BCRYPT_ROUNDS", 5)
+
+    assert _login(client, "userA1@test.com", "pass123").status_code == 200
+    assert _password_of(db_session, "userA1@test.com").startswith("$2b$05$")
+
+
+def test_login_sheds_load_when_hash_queue_full(client, monkeypatch):
+    monkeypatch.setattr(routers.auth, "HASH_QUEUE_LIMIT", 0)
+
+    response = _login(client, "userA1@test.com", "pass123")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_created_and_updated_employee_password_is_hashed(
+    client, db_session, admin_user
+):
+    headers = {"Authorization": f"Bearer {admin_user}"}
+    payload = {
+        "first_name": "New",
+        "last_name": "Hire",
+        "email": "new.hire@test.com",
+        "joining_date": "2025-11-27",
+        "isadmin": False,
+        "fk_department_id": 1,
+        "fk_role_id": 1,
+        "fk_manager_id": 2,
+        "password": "first-secret",
+    }
+    response = client.post("/admin/employees/", json=payload, headers=headers)
+    assert response.status_code == 201
+    assert _password_of(db_session, "new.hire@test.com").startswith("$2b$")
+    assert _login(client, "new.hire@test.com", "first-secret").status_code == 200
+
+    response = client.put(
+        "/admin/employees/email/new.hire@test.com",
+        json={"password": "second-secret"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert _login(client, "new.hire@test.com", "first-secret").status_code == 401
+    assert _login(client, "new.hire@test.com", "second-secret").status_code == 200
+
+
+def test_repeat_requests_hit_token_cache(client, admin_user, user_A1):
+    routers.auth.token_cache.clear()
+    headers = {"Authorization": f"Bearer {user_A1}"}
+    for _ in range(3):
+        assert client.get("/user/my/roles/", headers=headers).status_code == 200
+
+    response = client.get(
+        "/auth/token-cache", headers={"Authorization": f"Bearer {admin_user}"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"hits": 2, "misses": 2, "size": 2, "maxsize": 1024}
+
+
+def test_token_cache_stats_admin_only(client, user_A1):
+    response = client.get(
+        "/auth/token-cache", headers={"Authorization": f"Bearer {user_A1}"}
+    )
+    assert response.status_code == 403
+
+
+def test_token_cache_drops_expired_and_least_recent_entries():
+    cache = TokenCache(maxsize=2, ttl=60)
+    cache.put("expired", {"id": 1}, exp=time.time() - 1)
+    assert cache.get("expired") is None
+
+    cache.put("a", {"id": 1}, exp=time.time() + 60)
+    cache.put("b", {"id": 2}, exp=time.time() + 60)
+    assert cache.get("a") == {"id": 1}
+    cache.put("c", {"id": 3}, exp=time.time() + 60)
+    assert cache.get("b") is None
+    assert cache.get("c") == {"id": 3}
+    assert cache.stats() == {"hits": 2, "misses": 2, "size": 2, "maxsize": 2}
+
+
+def test_token_cache_disabled_with_zero_size():
+    cache = TokenCache(maxsize=0, ttl=60)
+    cache.put("a", {"id": 1}, exp=time.time() + 60)
+    assert cache.get("a") is None
@@ -1,6 +1,73 @@
 import json
 
+from sqlalchemy import create_engine
+
+import main
+from common.health import ReadinessProbe
+from common.metrics import TimedQueuePool
+from tests.conftest import async_engine, engine
+
 
 def test_health(client):
     response = client.get("/")
     assert response.json() == {"status": "Welcome to My Grehthrapp By Kishan"}
+
+
+def test_liveness(client):
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "alive"}
+
+
+def test_readiness_ready_and_cached(client, monkeypatch):
+    probe = ReadinessProbe({"sync": engine, "async": async_engine})
+    monkeypatch.setattr(main, "readiness", probe)
+
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ready"
+    assert body["cached"] is False
+    assert body["event_loop"]["ok"] is True
+    sync, unpooled = body["databases"]["sync"], body["databases"]["async"]
+    assert sync["ok"] is True and sync["error"] is None
+    assert sync["pool_size"] == 5 and sync["checked_out"] == 0
+    assert set(sync) >= {"latency_ms", "max_overflow", "overflow"}
+    assert unpooled == {"ok": True, "latency_ms": unpooled["latency_ms"], "error": None}
+
+    again = client.get("/health/ready").json()
+    assert again["cached"] is True
+    assert again["databases"] == body["databases"]
+
+
+def test_readiness_unavailable(client, monkeypatch, tmp_path):
+    missing = create_engine(f"sqlite:///{tmp_path / 'no' / 'such' / 'dir.db'}")
+    probe = ReadinessProbe({"sync": missing, "async": async_engine}, max_loop_lag_ms=-1)
+    monkeypatch.setattr(main, "readiness", probe)
+
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    body = response.json()
+    assert body["status"] == "unavailable"
+    assert body["event_loop"]["ok"] is False
+    assert body["databases"]["sync"]["error"] == "OperationalError"
+    assert body["databases"]["async"]["ok"] is True
+
+
+def test_readiness_times_out_on_exhausted_pool(client, monkeypatch, tmp_path):
+    exhausted = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.5,
+    )
+    probe = ReadinessProbe({"sync": exhausted}, db_timeout=0.05)
+    monkeypatch.setattr(main, "readiness", probe)
+    with exhausted.connect():
+        response = client.get("/health/ready")
+    exhausted.dispose()
+    assert response.status_code == 503
+    check = response.json()["databases"]["sync"]
+    assert check["error"] == "SELECT 1 took longer than 0.05s"
+    assert check["checked_out"] == 1 and check["pool_size"] == 1
@@ -73,6 +73,45 @@ def test_manager_manager_access_get_subordinate_attendance_by_date_success_empty
     assert response.json() == []
 
 
+def test_manager_manager_access_get_team_attendance_by_range_grouped(client, manager_A):
+    response = client.get(
+        "manager/attendance/range?start_date=2023-04-01&end_date=2023-04-03",
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 200
+    grouped = {
+        g["employee_id"]: [a["attendance_id"] for a in g["attendance"]]
+        for g in response.json()
+    }
+    assert grouped == {4: [14, 13, 16, 15], 5: [22, 21]}
+
+
+def test_manager_manager_access_get_team_attendance_by_range_no_team(client, user_A1):
+    response = client.get(
+        "manager/attendance/range?start_date=2023-04-01&end_date=2023-04-30",
+        headers={"Authorization": f"Bearer {user_A1}"},
+    )
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_manager_manager_access_get_team_attendance_by_range_invalid(client, manager_A):
+    headers = {"Authorization": f"Bearer {manager_A}"}
+    response = client.get(
+        "manager/attendance/range?start_date=2023-04-03&end_date=2023-04-01",
+        headers=headers,
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "end_date must not be before start_date"}
+
+    response = client.get(
+        "manager/attendance/range?start_date=2023-01-01&end_date=2023-04-01",
+        headers=headers,
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Date range cannot exceed 31 days"}
+
+
 def test_manager_manager_access_get_subordinate_attendance_by_empid_and_date_success(
     client, manager_A, read_json
 ):
@@ -154,3 +193,34 @@ def test_manager_admin_access_get_attendance_by_empid_forbidden(
     )
     assert response.status_code == 403
     assert response.json() == {"detail": "Admin privileges required"}
+
+
+def test_manager_manager_access_get_team_attendance_summary(client, manager_A):
+    response = client.get(
+        "manager/attendance/summary?start_date=2023-04-01&end_date=2023-04-30",
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 200
+    assert [(d["fk_employee_id"], d["work_date"]) for d in response.json()] == [
+        (4, "2023-04-01"),
+        (4, "2023-04-03"),
+        (5, "2023-04-02"),
+        (5, "2023-04-06"),
+    ]
+
+
+def test_manager_skip_level_team_attendance_by_depth(client, admin_user):
+    headers = {"Authorization": f"Bearer {admin_user}"}
+    response = client.get("manager/attendance/date/2023-04-02", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == []
+
+    response = client.get("manager/attendance/date/2023-04-02?depth=2", headers=headers)
+    assert response.status_code == 200
+    assert {a["fk_employee_id"] for a in response.json()} == {5, 7}
+
+    response = client.get(
+        "manager/attendance/employee/5/date/2023-04-02?depth=2", headers=headers
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 2
@@ -0,0 +1,107 @@
+from sqlalchemy import event
+
+from tests.conftest import engine
+
+
+def _dashboard(client, token, query=""):
+    return client.get(
+        f"/manager/dashboard/{query}", headers={"Authorization": f"Bearer {token}"}
+    )
+
+
+def test_manager_dashboard_counts_and_recent_pending(client, manager_A):
+    response = _dashboard(client, manager_A, "?on_date=2023-04-01")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["on_date"] == "2023-04-01"
+    assert body["leave_applications"]["counts"] == {
+        "pending": 1,
+        "approved": 2,
+        "rejected": 0,
+    }
+    assert [
+        a["leave_application_id"] for a in body["leave_applications"]["recent_pending"]
+    ] == [1]
+    assert body["expense_claims"]["counts"] == {
+        "pending": 1,
+        "approved": 2,
+        "rejected": 0,
+    }
+    assert [c["claim_id"] for c in body["expense_claims"]["recent_pending"]] == [6]
+    assert body["regularizations"]["counts"] == {
+        "pending": 2,
+        "approved": 0,
+        "rejected": 1,
+    }
+    # Newest first
+    assert [
+        r["regularization_id"] for r in body["regularizations"]["recent_pending"]
+    ] == [7, 3]
+
+
+def test_manager_dashboard_team_check_ins(client, manager_A):
+    team = _dashboard(client, manager_A, "?on_date=2023-04-01").json()["team"]
+    assert team == [
+        {
+            "employee_id": 4,
+            "first_name": team[0]["first_name"],
+            "last_name": team[0]["last_name"],
+            "status": "present",
+            "first_punch": "2023-04-01T07:10:00",
+            "last_punch": "2023-04-01T10:00:00",
+            "punch_count": 2,
+        },
+        {
+            "employee_id": 5,
+            "first_name": team[1]["first_name"],
+            "last_name": team[1]["last_name"],
+            "status": "absent",
+            "first_punch": None,
+            "last_punch": None,
+            "punch_count": 0,
+        },
+    ]
+    # userA2 is on approved leave 2025-07-01..07-07
+    team = _dashboard(client, manager_A, "?on_date=2025-07-02").json()["team"]
+    assert [(m["employee_id"], m["status"]) for m in team] == [
+        (4, "absent"),
+        (5, "on_leave"),
+    ]
+
+
+def test_manager_dashboard_recent_limit_and_depth(client, admin_user):
+    body = _dashboard(client, admin_user, "?recent=1&depth=2").json()
+    assert [c["claim_id"] for c in body["expense_claims"]["recent_pending"]] == [4]
+    assert [m["employee_id"] for m in body["team"]] == [2, 3, 4, 5, 6, 7]
+
+
+def test_manager_dashboard_empty_for_non_manager(client, user_A1):
+    body = _dashboard(client, user_A1).json()
+    assert body["team"] == []
+    assert body["regularizations"] == {
+        "counts": {"pending": 0, "approved": 0, "rejected": 0},
+        "recent_pending": [],
+    }
+
+
+def test_manager_dashboard_runs_a_fixed_number_of_queries(client, manager_A):
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        _dashboard(client, manager_A)
+        baseline = len(statements)
+        statements.clear()
+        _dashboard(client, manager_A, "?recent=50&depth=64")
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    # More items or a deeper tree do not add queries
+    assert len(statements) == baseline == 5
+
+
+def test_manager_dashboard_recent_out_of_range(client, manager_A):
+    assert _dashboard(client, manager_A, "?recent=0").status_code == 422
+    assert _dashboard(client, manager_A, "?recent=51").status_code == 422
@@ -204,3 +204,41 @@ def test_manager_admin_access_delete_employee_by_email_forbidden(
     )
     assert response.status_code == 403
     assert response.json() == {"detail": "Admin privileges required"}
+
+
+def _subordinate_ids(client, token, depth=1):
+    response = client.get(
+        f"manager/subordinates/?depth={depth}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    return [e["employee_id"] for e in response.json()]
+
+
+def test_manager_list_subordinates_by_depth(client, admin_user, manager_A):
+    assert _subordinate_ids(client, admin_user) == [2, 3]
+    assert _subordinate_ids(client, admin_user, depth=2) == [2, 3, 4, 5, 6, 7]
+    assert _subordinate_ids(client, manager_A, depth=5) == [4, 5]
+
+
+def test_manager_get_skip_level_subordinate_needs_depth(client, admin_user):
+    headers = {"Authorization": f"Bearer {admin_user}"}
+    response = client.get("manager/subordinates/id/4", headers=headers)
+    assert response.status_code == 404
+
+    response = client.get("manager/subordinates/id/4?depth=2", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["email"] == "userA1@test.com"
+
+    response = client.get(
+        "manager/subordinates/email/userB2@test.com?depth=2", headers=headers
+    )
+    assert response.status_code == 200
+
+
+def test_manager_subordinates_depth_out_of_range(client, manager_A):
+    response = client.get(
+        "manager/subordinates/?depth=0",
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 422
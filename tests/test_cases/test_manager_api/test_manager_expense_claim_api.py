@@ -298,3 +298,31 @@ def test_manager_admin_access_update_expense_claim_status_forbidden(
     )
     assert response.status_code == 403
     assert response.json() == {"detail": "Admin privileges required"}
+
+
+def test_manager_bulk_update_expense_claim_status_mixed_outcomes(client, manager_A):
+    response = client.put(
+        "/manager/expense-claims/status",
+        json={"ids": [6, 9, 42], "claim_status": "Approved"},
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": 6, "outcome": "updated"},
+        {"id": 9, "outcome": "forbidden"},
+        {"id": 42, "outcome": "not_found"},
+    ]
+    updated = client.get(
+        "/manager/expense-claims/6", headers={"Authorization": f"Bearer {manager_A}"}
+    )
+    assert updated.json()["claim_status"] == "Approved"
+
+
+def test_manager_bulk_update_expense_claim_status_nothing_owned(client, manager_A):
+    response = client.put(
+        "/manager/expense-claims/status",
+        json={"ids": [9, 10], "claim_status": "Rejected"},
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 200
+    assert [r["outcome"] for r in response.json()] == ["forbidden", "forbidden"]
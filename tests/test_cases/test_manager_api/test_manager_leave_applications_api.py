@@ -1,8 +1,14 @@
+from common.leave_application import admin_update_status
+from database.models import LeaveApplication, Status
+from schema.leave_application_schema import LeaveApplicationStatusUpdate
+from tests.conftest import TestingSessionLocal
+
+
 # -------------------------------------------------Test User API ---------------------------------------------------
 def test_manager_create_leave_application_success(client, manager_A, read_json):
     payload = {
-        "from_date": "2025-11-30T10:00:00.000Z",
-        "end_date": "2025-11-30T19:00:00.000Z",
+        "from_date": "2025-12-01T10:00:00.000Z",
+        "end_date": "2025-12-01T19:00:00.000Z",
         "leave_reason": "string",
     }
     response = client.post(
@@ -263,3 +269,163 @@ def test_manager_admin_access_update_employee_leave_application_status_by_id_for
     )
     assert response.status_code == 403
     assert response.json() == {"detail": "Admin privileges required"}
+
+
+def test_manager_bulk_update_leave_application_status_mixed_outcomes(client, manager_A):
+    response = client.put(
+        "/manager/leave-applications/status",
+        json={"ids": [1, 5, 3, 99], "leave_status": "Rejected"},
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": 1, "outcome": "updated"},
+        {"id": 5, "outcome": "updated"},
+        {"id": 3, "outcome": "forbidden"},
+        {"id": 99, "outcome": "not_found"},
+    ]
+    rejected = client.get(
+        "/manager/leave-applications/status/Rejected",
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert {a["leave_application_id"] for a in rejected.json()} == {1, 5}
+
+
+def test_manager_bulk_update_leave_application_status_too_many_ids(client, manager_A):
+    response = client.put(
+        "/manager/leave-applications/status",
+        json={"ids": list(range(1, 502)), "leave_status": "Approved"},
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 422
+
+
+def _apply_for_leave(client, token, start, end):
+    response = client.post(
+        "/user/my/leave-applications/",
+        json={"from_date": start, "end_date": end, "leave_reason": "Long trip home"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 201
+    return response.json()["leave_application_id"]
+
+
+def _balance(client, token, year):
+    response = client.get(
+        f"/user/my/leave/balance/{year}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    return response.json()["balance_leave"]
+
+
+def test_manager_approve_and_reject_leave_moves_balance(client, manager_A, user_A1):
+    headers = {"Authorization": f"Bearer {manager_A}"}
+    assert _balance(client, user_A1, 2025) == 31
+
+    response = client.put(
+        "/manager/leave-applications/1/status",
+        json={"leave_status": "Approved"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert _balance(client, user_A1, 2025) == 28
+
+    # Approving again is not a second debit
+    client.put(
+        "/manager/leave-applications/1/status",
+        json={"leave_status": "Approved"},
+        headers=headers,
+    )
+    assert _balance(client, user_A1, 2025) == 28
+
+    client.put(
+        "/manager/leave-applications/1/status",
+        json={"leave_status": "Rejected"},
+        headers=headers,
+    )
+    assert _balance(client, user_A1, 2025) == 31
+
+
+def test_manager_approve_leave_insufficient_balance(client, manager_A, user_A1):
+    app_id = _apply_for_leave(
+        client, user_A1, "2025-09-01T09:00:00Z", "2025-11-28T18:00:00Z"
+    )
+    response = client.put(
+        f"/manager/leave-applications/{app_id}/status",
+        json={"leave_status": "Approved"},
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Insufficient leave balance for 2025"}
+    assert _balance(client, user_A1, 2025) == 31
+    pending = client.get(
+        "/manager/leave-applications/status/Pending",
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert app_id in {a["leave_application_id"] for a in pending.json()}
+
+
+def test_manager_approve_leave_without_allocation(client, manager_A, user_A1):
+    app_id = _apply_for_leave(
+        client, user_A1, "2030-01-01T09:00:00Z", "2030-01-02T18:00:00Z"
+    )
+    response = client.put(
+        f"/manager/leave-applications/{app_id}/status",
+        json={"leave_status": "Approved"},
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Insufficient leave balance for 2030"}
+
+
+def test_manager_bulk_approve_leave_skips_overdrawn(client, manager_A, user_A1):
+    long_trip = _apply_for_leave(
+        client, user_A1, "2025-09-01T09:00:00Z", "2025-10-31T18:00:00Z"
+    )
+    response = client.put(
+        "/manager/leave-applications/status",
+        json={"ids": [1, long_trip], "leave_status": "Approved"},
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": 1, "outcome": "updated"},
+        {"id": long_trip, "outcome": "insufficient_balance"},
+    ]
+    assert _balance(client, user_A1, 2025) == 28
+
+
+def test_manager_bulk_leave_status_without_balance_change(client, manager_A):
+    response = client.put(
+        "/manager/leave-applications/status",
+        json={"ids": [2], "leave_status": "Approved"},
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.json() == [{"id": 2, "outcome": "updated"}]
+
+
+def test_manager_approve_after_concurrent_approval_debits_once(
+    client, db_session, manager_A, user_A1, monkeypatch
+):
+    # This request's session read the application while it was still Pending,
+    # and kept that copy past the end of its transaction
+    stale = db_session.get(LeaveApplication, 1)
+    assert stale.leave_status == Status.Pending
+    monkeypatch.setattr(db_session, "expire_on_commit", False)
+    db_session.commit()
+    # ... and meanwhile another request approved it
+    with TestingSessionLocal() as other:
+        admin_update_status(
+            other, 1, LeaveApplicationStatusUpdate(leave_status=Status.Approved)
+        )
+    assert _balance(client, user_A1, 2025) == 28
+
+    response = client.put(
+        "/manager/leave-applications/1/status",
+        json={"leave_status": "Approved"},
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 200
+    assert stale.leave_status == Status.Approved
+    assert _balance(client, user_A1, 2025) == 28
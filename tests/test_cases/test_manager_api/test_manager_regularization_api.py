@@ -225,3 +225,49 @@ def test_manager_admin_access_update_regularization_by_id_forbidden(
     )
     assert response.status_code == 403
     assert response.json() == {"detail": "Admin privileges required"}
+
+
+def test_manager_bulk_update_regularization_status_mixed_outcomes(client, manager_A):
+    response = client.put(
+        "/manager/regularizations/status",
+        json={"ids": [3, 7, 6, 16, 3], "regularization_status": "Approved"},
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": 3, "outcome": "updated"},
+        {"id": 7, "outcome": "updated"},
+        {"id": 6, "outcome": "forbidden"},
+        {"id": 16, "outcome": "not_found"},
+    ]
+    for reg_id in (3, 7):
+        updated = client.get(
+            f"/manager/regularizations/{reg_id}",
+            headers={"Authorization": f"Bearer {manager_A}"},
+        )
+        assert updated.json()["regularization_status"] == "Approved"
+
+
+def test_manager_bulk_update_regularization_status_leaves_others_untouched(
+    client, manager_B
+):
+    response = client.put(
+        "/manager/regularizations/status",
+        json={"ids": [3, 7], "regularization_status": "Rejected"},
+        headers={"Authorization": f"Bearer {manager_B}"},
+    )
+    assert response.status_code == 200
+    assert {r["outcome"] for r in response.json()} == {"forbidden"}
+    pending = client.get(
+        "/manager/regularizations/6", headers={"Authorization": f"Bearer {manager_B}"}
+    )
+    assert pending.json()["regularization_status"] == "Pending"
+
+
+def test_manager_bulk_update_regularization_status_empty_ids(client, manager_A):
+    response = client.put(
+        "/manager/regularizations/status",
+        json={"ids": [], "regularization_status": "Approved"},
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    assert response.status_code == 422
@@ -0,0 +1,115 @@
+import asyncio
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from common import metrics
+from common.metrics import (
+    POOL_CHECKOUT_WAIT,
+    Gauge,
+    Histogram,
+    TimedAsyncQueuePool,
+    TimedQueuePool,
+    render_metrics,
+)
+from tests.conftest import get_auth_token
+
+
+def test_metrics_endpoint_reports_route_templates(client):
+    token = get_auth_token(client, "admin@test.com", "pass123")
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/admin/employees/id/4", headers=headers).status_code == 200
+    assert client.get("/no/such/route").status_code == 404
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    route = 'method="GET",route="/admin/employees/id/{employee_id}"'
+    assert f'http_request_duration_seconds_count{{{route},status="200"}}' in body
+    assert f'http_response_size_bytes_bucket{{{route},le="+Inf"}}' in body
+    assert 'route="unmatched",status="404"' in body
+    assert "/employees/id/4" not in body
+    # The scrape itself is the one request in flight
+    assert "\nhttp_requests_in_flight 1\n" in body
+    assert "# TYPE http_request_duration_seconds histogram" in body
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("test_seconds", "Test.", ("path",), buckets=(0.1, 1))
+    try:
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value, 'a"b\\c\n')
+        assert histogram.render() == [
+            "# HELP test_seconds Test.",
+            "# TYPE test_seconds histogram",
+            'test_seconds_bucket{path="a\\"b\\\\c\\n",le="0.1"} 2',
+            'test_seconds_bucket{path="a\\"b\\\\c\\n",le="1"} 3',
+            'test_seconds_bucket{path="a\\"b\\\\c\\n",le="+Inf"} 4',
+            'test_seconds_sum{path="a\\"b\\\\c\\n"} 3.65',
+            'test_seconds_count{path="a\\"b\\\\c\\n"} 4',
+        ]
+    finally:
+        metrics.registry.remove(histogram)
+
+
+def test_gauge_inc_dec_and_set():
+    gauge = Gauge("test_gauge", "Test.", ("pool",))
+    try:
+        gauge.inc("a")
+        gauge.inc("a")
+        gauge.dec("a")
+        gauge.set(7, "b")
+        assert gauge.render()[2:] == [
+            'test_gauge{pool="a"} 1',
+            'test_gauge{pool="b"} 7',
+        ]
+    finally:
+        metrics.registry.remove(gauge)
+
+
+def test_pool_gauges_and_checkout_wait(tmp_path, monkeypatch):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=2,
+        max_overflow=2,
+    )
+    unpooled = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=NullPool)
+    monkeypatch.setitem(metrics._watched_engines, "test", engine)
+    monkeypatch.setitem(metrics._watched_engines, "unpooled", unpooled)
+    waits_before = _count(POOL_CHECKOUT_WAIT, "sync")
+    connections = [engine.connect() for _ in range(3)]
+    try:
+        body = render_metrics()
+    finally:
+        for conn in connections:
+            conn.close()
+        engine.dispose()
+    assert _count(POOL_CHECKOUT_WAIT, "sync") == waits_before + 3
+    assert 'db_pool_size{pool="test"} 2' in body
+    assert 'db_pool_checked_out{pool="test"} 3' in body
+    assert 'db_pool_overflow{pool="test"} 1' in body
+    assert 'db_pool_saturation{pool="test"} 0.75' in body
+    assert 'pool="unpooled"' not in body
+
+
+def test_async_pool_checkout_wait(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", poolclass=TimedAsyncQueuePool
+    )
+
+    async def query():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        await engine.dispose()
+
+    waits_before = _count(POOL_CHECKOUT_WAIT, "async")
+    asyncio.run(query())
+    assert _count(POOL_CHECKOUT_WAIT, "async") == waits_before + 1
+
+
+def _count(histogram: Histogram, *labels: str) -> int:
+    entry = histogram._values.get(labels)
+    return sum(entry[:-1]) if entry else 0
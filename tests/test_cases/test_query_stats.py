@@ -0,0 +1,52 @@
+import logging
+import re
+
+from fastapi.testclient import TestClient
+
+from common import query_stats
+from database.models import Employee
+from main import app
+from tests.conftest import get_auth_token
+
+SERVER_TIMING = re.compile(r'^db;dur=\d+\.\d{2};desc="(\d+) queries"$')
+
+
+def test_server_timing_counts_request_queries(client, caplog):
+    token = get_auth_token(client, "userA1@test.com", "pass123")
+    with caplog.at_level(logging.DEBUG, logger="common.query_stats"):
+        response = client.get(
+            "/user/my/me/", headers={"Authorization": f"Bearer {token}"}
+        )
+    assert response.status_code == 200
+    count = int(SERVER_TIMING.match(response.headers["server-timing"]).group(1))
+    assert count >= 1
+    assert f"GET /user/my/me/: {count} queries in" in caplog.text
+
+
+def test_server_timing_without_queries(client):
+    response = client.get("/")
+    assert response.headers["server-timing"].endswith('desc="0 queries"')
+
+
+def test_over_budget_request_warns_and_notifies(
+    client, caplog, monkeypatch, query_budget
+):
+    monkeypatch.setattr(query_stats, "QUERY_BUDGET", 0)
+    with caplog.at_level(logging.WARNING, logger="common.query_stats"):
+        get_auth_token(client, "admin@test.com", "pass123")
+    (record,) = caplog.records
+    assert record.getMessage().startswith("POST /auth/token ran ")
+    assert "queries (budget 0)" in record.getMessage()
+    assert record.getMessage().endswith("possible N+1")
+    assert len(query_budget) == 1 and query_budget[0].startswith("POST /auth/token:")
+    query_budget.clear()  # expected here; keep the autouse check from failing
+
+
+def test_queries_outside_requests_not_counted(db_session):
+    assert query_stats.current_query_stats() is None
+    assert db_session.get(Employee, 1) is not None
+
+
+def test_lifespan_passes_through(db_session):
+    with TestClient(app) as client:
+        assert client.get("/").status_code == 200
@@ -0,0 +1,107 @@
+import contextlib
+
+from sqlalchemy import event
+
+import common.reference_cache
+from common.reference_cache import (
+    FileInvalidationChannel,
+    ReferenceCache,
+    default_channel,
+)
+from database.models import Role
+
+
+@contextlib.contextmanager
+def _count_queries(db_session):
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+
+def test_reference_reads_skip_the_database_once_loaded(client, db_session, user_A1):
+    headers = {"Authorization": f"Bearer {user_A1}"}
+    assert client.get("/user/my/roles/", headers=headers).status_code == 200
+
+    with _count_queries(db_session) as statements:
+        assert client.get("/user/my/roles/", headers=headers).status_code == 200
+        assert client.get("/user/my/roles/id/4", headers=headers).status_code == 200
+        assert client.get("/user/my/roles/id/14", headers=headers).status_code == 404
+        response = client.get("/user/my/departments/", headers=headers)
+        assert response.status_code == 200
+        client.get("/user/my/departments/", headers=headers)
+    # Only the departments snapshot was loaded
+    assert len(statements) == 1
+
+
+def test_reference_cache_sees_admin_writes(client, admin_user):
+    headers = {"Authorization": f"Bearer {admin_user}"}
+    before = client.get("/user/my/roles/", headers=headers).json()
+
+    response = client.post("/admin/roles/", json={"role": "Auditor"}, headers=headers)
+    assert response.status_code == 201
+    after = client.get("/user/my/roles/", headers=headers).json()
+    assert after == before + [{"role": "Auditor", "role_id": 6}]
+
+    response = client.put(
+        "/admin/departments/name/  finance  ",
+        params={"new_name": "People"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    departments = client.get("/user/my/departments/", headers=headers).json()
+    assert response.json() in departments
+
+
+def test_reference_cache_ttl_and_stats(db_session):
+    cache = ReferenceCache(Role.role_id, Role.role, ttl=0)
+    assert cache.stats() == {"hits": 0, "loads": 0, "size": 0}
+    cache.all(db_session)
+    cache.by_name(db_session, "ACCOUNTANT")
+    assert cache.stats() == {"hits": 0, "loads": 2, "size": 5}
+
+    cache.ttl = 60
+    cache.clear()
+    assert cache.by_name(db_session, " accountant ").role_id == 4
+    assert cache.by_id(db_session, 4).role == "Accountant"
+    assert cache.stats() == {"hits": 1, "loads": 1, "size": 5}
+
+
+def test_file_channel_invalidates_other_workers(db_session, tmp_path):
+    channel = FileInvalidationChannel(str(tmp_path / "reference.version"), 0)
+    assert channel.version() == 0
+    writer = ReferenceCache(Role.role_id, Role.role, channel=channel)
+    reader = ReferenceCache(Role.role_id, Role.role, channel=channel)
+    reader.all(db_session)
+    reader.all(db_session)
+    assert reader.stats()["loads"] == 1
+
+    db_session.add(Role(role="Auditor"))
+    db_session.commit()
+    writer.invalidate()
+    assert channel.version() == 1
+    assert reader.by_name(db_session, "auditor").role_id == 6
+    assert reader.stats()["loads"] == 2
+
+    # Between polls the file is not even stat'ed
+    channel.poll_interval = 60
+    reader.clear()
+    reader.all(db_session)
+    writer.invalidate()
+    reader.all(db_session)
+    assert reader.stats()["loads"] == 1
+
+
+def test_default_channel_follows_config(monkeypatch, tmp_path):
+    monkeypatch.setattr(common.reference_cache, "REFERENCE_CACHE_SYNC_FILE", None)
+    assert default_channel() is None
+
+    path = str(tmp_path / "reference.version")
+    monkeypatch.setattr(common.reference_cache, "REFERENCE_CACHE_SYNC_FILE", path)
+    channel = default_channel()
+    assert channel.path == path
+    assert channel.poll_interval == common.reference_cache.REFERENCE_CACHE_SYNC_INTERVAL
@@ -0,0 +1,98 @@
+import pytest
+
+import serve
+
+
+def test_available_cpus_follows_cgroup_quota(tmp_path):
+    cpu_max = tmp_path / "cpu.max"
+    cpu_max.write_text("200000 100000\n")
+    assert serve.available_cpus(str(cpu_max)) == 2
+    # Fractional quotas, e.g. a quarter-vCPU task, still get one worker
+    cpu_max.write_text("25000 100000\n")
+    assert serve.available_cpus(str(cpu_max)) == 1
+
+
+def test_available_cpus_without_quota_uses_affinity(tmp_path, monkeypatch):
+    monkeypatch.setattr(serve.os, "sched_getaffinity", lambda pid: {0, 1, 2})
+    cpu_max = tmp_path / "cpu.max"
+    cpu_max.write_text("max 100000\n")
+    assert serve.available_cpus(str(cpu_max)) == 3
+    assert serve.available_cpus(str(tmp_path / "missing")) == 3
+
+
+def test_worker_count():
+    assert serve.worker_count({}, cpus=4) == 4
+    assert serve.worker_count({"WEB_CONCURRENCY": "3"}, cpus=4) == 3
+    assert serve.worker_count({"WEB_CONCURRENCY": "0"}, cpus=4) == 1
+
+
+def test_pool_env_splits_budget_across_workers():
+    assert serve.pool_env(40, 4) == {
+        "DB_POOL_SIZE": "5",
+        "DB_MAX_OVERFLOW": "0",
+        "DB_ASYNC_POOL_SIZE": "5",
+        "DB_ASYNC_MAX_OVERFLOW": "0",
+    }
+    sizes = serve.pool_env(23, 3)
+    assert (sizes["DB_POOL_SIZE"], sizes["DB_ASYNC_POOL_SIZE"]) == ("4", "3")
+    with pytest.raises(ValueError, match="fewer than 2 connections"):
+        serve.pool_env(5, 4)
+
+
+def test_build_config_exports_pool_sizes():
+    env = {"WEB_CONCURRENCY": "2", "DB_CONNECTION_BUDGET": "20", "PORT": "9000"}
+    config = serve.build_config(env)
+    assert (config.workers, config.port, config.host) == (2, 9000, "0.0.0.0")
+    assert (config.loop, config.http) == ("uvloop", "httptools")
+    assert config.timeout_graceful_shutdown == 30
+    assert env["DB_POOL_SIZE"] == env["DB_ASYNC_POOL_SIZE"] == "5"
+
+
+def test_build_config_falls_back_without_uvloop(monkeypatch):
+    monkeypatch.setattr(serve.importlib.util, "find_spec", lambda name: None)
+    env = {"WEB_CONCURRENCY": "1"}
+    config = serve.build_config(env)
+    assert (config.loop, config.http) == ("asyncio", "h11")
+    assert "DB_POOL_SIZE" not in env
+
+
+def test_main_runs_workers_under_the_supervisor(monkeypatch):
+    started = {}
+
+    class Supervisor:
+        def __init__(self, config, target, sockets):
+            started.update(config=config, target=target, sockets=sockets)
+
+        def run(self):
+            started["ran"] = True
+
+    class Socket:
+        pass
+
+    monkeypatch.setattr(serve, "Multiprocess", Supervisor)
+    monkeypatch.setattr(serve.uvicorn.Config, "bind_socket", lambda self: Socket())
+    serve.main({"WEB_CONCURRENCY": "1", "WEB_MAX_REQUESTS": "500"})
+    assert started["ran"] and started["config"].workers == 1
+    assert started["target"].args[1:] == (500, 1000)
+    assert isinstance(started["sockets"][0], Socket)
+
+
+def test_serve_worker_sets_jittered_request_limit(monkeypatch):
+    served = []
+
+    class Server:
+        def __init__(self, config):
+            self.config = config
+
+        def run(self, sockets=None):
+            served.append((self.config.limit_max_requests, sockets))
+
+    monkeypatch.setattr(serve.uvicorn, "Server", Server)
+    config = serve.build_config({"WEB_CONCURRENCY": "1"})
+    serve.serve_worker(config, 100, 10, sockets=["sock"])
+    limit, sockets = served[0]
+    assert 100 <= limit <= 110 and sockets == ["sock"]
+
+    config.limit_max_requests = None
+    serve.serve_worker(config, 0, 10)
+    assert served[1] == (None, None)
@@ -0,0 +1,34 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from database.sqlite import enable_sqlite_pragmas
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'local.db'}")
+    enable_sqlite_pragmas(engine)
+    with engine.connect() as conn:
+        pragma = lambda name: conn.execute(text(f"PRAGMA {name}")).scalar()
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("foreign_keys") == 1
+        assert pragma("busy_timeout") == 5000
+        assert pragma("cache_size") == -65536
+        assert pragma("mmap_size") == 256 * 1024 * 1024
+    engine.dispose()
+
+
+def test_sqlite_foreign_keys_enforced(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'local.db'}")
+    enable_sqlite_pragmas(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE parent (id INTEGER PRIMARY KEY)"))
+        conn.execute(
+            text("CREATE TABLE child (id INTEGER, parent_id REFERENCES parent(id))")
+        )
+    with pytest.raises(Exception) as error, engine.begin() as conn:
+        conn.execute(text("INSERT INTO child VALUES (1, 42)"))
+    assert isinstance(error.value.orig, sqlite3.IntegrityError)
+    engine.dispose()
@@ -0,0 +1,96 @@
+from datetime import date, datetime
+
+from common.timesheet import EmployeeStream, build_timesheet
+from common.work_calendar import WorkCalendar
+
+JUNE_1, JUNE_30 = date(2025, 6, 1), date(2025, 6, 30)
+CALENDAR = WorkCalendar({5, 6}, [])
+
+
+def _at(day, hour, minute=0):
+    return datetime(2025, 6, day, hour, minute)
+
+
+def test_build_timesheet_pairs_punches_per_day():
+    rows, totals = build_timesheet(
+        CALENDAR,
+        JUNE_1,
+        JUNE_30,
+        [
+            _at(2, 9),
+            _at(2, 13),
+            _at(2, 14),
+            _at(2, 18),
+            _at(3, 9),
+            _at(3, 17),
+            _at(3, 19),
+        ],
+        [],
+        [],
+    )
+    assert [
+        (r["work_date"].day, r["punched_seconds"], r["incomplete"]) for r in rows
+    ] == [
+        (2, 8 * 3600, False),
+        (3, 8 * 3600, True),
+    ]
+    assert rows[1]["punch_count"] == 3
+    assert totals == {
+        "working_days": 21,
+        "days_present": 2,
+        "leave_days": 0,
+        "incomplete_days": 1,
+        "punched_seconds": 16 * 3600,
+        "worked_seconds": 16 * 3600,
+    }
+
+
+def test_build_timesheet_merges_regularizations_with_sessions():
+    rows, totals = build_timesheet(
+        CALENDAR,
+        JUNE_1,
+        JUNE_30,
+        [_at(2, 9), _at(2, 13)],
+        # Overlaps the session by an hour, then a night shift across midnight
+        [
+            (_at(2, 12), _at(2, 15)),
+            (_at(4, 22), _at(5, 6)),
+            (_at(30, 22), datetime(2025, 7, 1, 6)),
+        ],
+        [],
+    )
+    worked = {
+        r["work_date"].day: (r["punched_seconds"], r["worked_seconds"]) for r in rows
+    }
+    assert worked == {
+        2: (4 * 3600, 6 * 3600),
+        4: (0, 2 * 3600),
+        5: (0, 6 * 3600),
+        30: (0, 2 * 3600),
+    }
+    assert all(r["regularized"] for r in rows)
+    assert totals["days_present"] == 4
+
+
+def test_build_timesheet_marks_working_days_of_leave():
+    rows, totals = build_timesheet(
+        CALENDAR,
+        JUNE_1,
+        JUNE_30,
+        [],
+        [],
+        [(datetime(2025, 5, 29, 9), _at(3, 18)), (_at(6, 9), _at(6, 9))],
+    )
+    assert [r["work_date"].day for r in rows] == [2, 3, 6]
+    assert all(r["on_leave"] and not r["punch_count"] for r in rows)
+    assert (totals["leave_days"], totals["days_present"]) == (3, 0)
+
+
+def test_employee_stream_hands_out_each_employee_once():
+    stream = EmployeeStream([(1, "a"), (1, "b"), (3, "c"), (4, "d"), (6, "e")])
+    assert stream.take(1) == [(1, "a"), (1, "b")]
+    assert stream.take(2) == []
+    # Employee 3 was never asked for
+    assert stream.take(4) == [(4, "d")]
+    assert stream.take(6) == [(6, "e")]
+    assert stream.take(7) == []
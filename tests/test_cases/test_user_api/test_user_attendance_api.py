@@ -1,3 +1,6 @@
+import common.attendance
+
+
 # -------------------------------------------------Test User API ---------------------------------------------------
 def test_user_create_my_attendance_success(client, user_A1, read_json):
     response = client.post(
@@ -25,6 +28,23 @@ def test_user_get_all_my_attendance_success(client, user_A1, read_json):
     assert response.json() == expected
 
 
+def test_user_get_all_my_attendance_paginated(client, user_A1):
+    headers = {"Authorization": f"Bearer {user_A1}"}
+    first = client.get("user/my/attendance/my?limit=3", headers=headers)
+    assert first.status_code == 200
+    assert len(first.json()) == 3
+
+    cursor = first.headers["X-Next-Cursor"]
+    second = client.get(
+        f"user/my/attendance/my?limit=3&cursor={cursor}", headers=headers
+    )
+    assert second.status_code == 200
+    assert "X-Next-Cursor" not in second.headers
+    ids = [a["attendance_id"] for a in first.json() + second.json()]
+    full = client.get("user/my/attendance/my", headers=headers).json()
+    assert ids == [a["attendance_id"] for a in full]
+
+
 def test_user_get_my_attendance_by_date_success(client, user_A1, read_json):
     response = client.get(
         "/user/my/attendance/my/date/2025-10-10",
@@ -111,3 +131,84 @@ def test_user_admin_access_get_attendance_by_empid_forbidden(
     )
     assert response.status_code == 403
     assert response.json() == {"detail": "Admin privileges required"}
+
+
+def test_user_get_my_attendance_summary_success(client, user_A1):
+    response = client.get(
+        "user/my/attendance/summary?start_date=2023-04-01&end_date=2023-04-30",
+        headers={"Authorization": f"Bearer {user_A1}"},
+    )
+    assert response.status_code == 200
+    assert [
+        (d["work_date"], d["first_punch"], d["last_punch"], d["punch_count"])
+        for d in response.json()
+    ] == [
+        ("2023-04-01", "2023-04-01T07:10:00", "2023-04-01T10:00:00", 2),
+        ("2023-04-03", "2023-04-03T07:20:00", "2023-04-03T10:20:00", 2),
+    ]
+    assert [d["worked_seconds"] for d in response.json()] == [10200, 10800]
+
+
+def test_user_punch_updates_my_attendance_summary(client, user_A1):
+    headers = {"Authorization": f"Bearer {user_A1}"}
+    for punch in (
+        "2025-10-10T09:30:00Z",
+        "2025-10-10T18:00:00Z",
+        "2025-10-10T08:45:00Z",
+    ):
+        response = client.post(
+            "user/my/attendance/", json={"punch_time": punch}, headers=headers
+        )
+        assert response.status_code == 201
+
+    response = client.get(
+        "user/my/attendance/summary?start_date=2025-10-10&end_date=2025-10-10",
+        headers=headers,
+    )
+    assert response.status_code == 200
+    [day] = response.json()
+    assert day["first_punch"] == "2025-10-10T08:45:00"
+    assert day["last_punch"] == "2025-10-10T18:00:00"
+    assert day["punch_count"] == 3
+    assert day["worked_seconds"] == 33300
+
+
+def test_user_first_punches_racing_keep_both(client, user_A1, monkeypatch):
+    # The first lookup misses as if another first punch of the day had not
+    # committed yet; the insert then collides with the existing 2023-04-01 row.
+    locked_day = common.attendance._locked_day
+    misses = [None]
+
+    def racing_locked_day(db, employee_id, work_date):
+        return misses.pop() if misses else locked_day(db, employee_id, work_date)
+
+    monkeypatch.setattr(common.attendance, "_locked_day", racing_locked_day)
+    headers = {"Authorization": f"Bearer {user_A1}"}
+    response = client.post(
+        "user/my/attendance/",
+        json={"punch_time": "2023-04-01T12:00:00Z"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+
+    response = client.get(
+        "user/my/attendance/summary?start_date=2023-04-01&end_date=2023-04-01",
+        headers=headers,
+    )
+    [day] = response.json()
+    assert (day["first_punch"], day["last_punch"], day["punch_count"]) == (
+        "2023-04-01T07:10:00",
+        "2023-04-01T12:00:00",
+        3,
+    )
+    response = client.get("user/my/attendance/my/date/2023-04-01", headers=headers)
+    assert len(response.json()) == 3
+
+
+def test_user_get_my_attendance_summary_range_too_long(client, user_A1):
+    response = client.get(
+        "user/my/attendance/summary?start_date=2023-01-01&end_date=2024-01-31",
+        headers={"Authorization": f"Bearer {user_A1}"},
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Date range cannot exceed 366 days"}
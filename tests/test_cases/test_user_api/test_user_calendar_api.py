@@ -0,0 +1,26 @@
+# -------------------------------------------------Test User API ---------------------------------------------------
+def test_user_get_my_working_days(client, user_A1, admin_user):
+    client.post(
+        "/admin/calendar/holidays",
+        json={"holiday_date": "2025-12-25", "holiday_name": "Christmas"},
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    response = client.get(
+        "/user/my/calendar/working-days?start_date=2025-12-01&end_date=2025-12-31",
+        headers={"Authorization": f"Bearer {user_A1}"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "start_date": "2025-12-01",
+        "end_date": "2025-12-31",
+        "working_days": 22,
+    }
+
+
+def test_user_get_my_working_days_bad_range(client, user_A1):
+    response = client.get(
+        "/user/my/calendar/working-days?start_date=2025-12-31&end_date=2025-12-01",
+        headers={"Authorization": f"Bearer {user_A1}"},
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "end_date must not be before start_date"}
@@ -86,3 +86,66 @@ def test_user_admin_access_delete_leave_by_id_forbidden(client, user_A1, read_js
     )
     assert response.status_code == 403
     assert response.json() == {"detail": "Admin privileges required"}
+
+
+def test_user_my_leave_conditional_get_after_admin_changes(client, user_A1, admin_user):
+    headers = {"Authorization": f"Bearer {user_A1}"}
+    admin_headers = {"Authorization": f"Bearer {admin_user}"}
+    tag = client.get("/user/my/leave/year/2024", headers=headers).headers["ETag"]
+    response = client.get(
+        "/user/my/leave/year/2024", headers={**headers, "If-None-Match": tag}
+    )
+    assert response.status_code == 304
+
+    response = client.delete(
+        "/admin/leaves/employee/4/year/2023", headers=admin_headers
+    )
+    assert response.status_code == 204
+    response = client.get(
+        "/user/my/leave/year/2024", headers={**headers, "If-None-Match": tag}
+    )
+    assert response.status_code == 200
+    response = client.get("/user/my/leave/", headers=headers)
+    tag = response.headers["ETag"]
+
+    leave_id = response.json()[0]["leave_id"]
+    response = client.delete(f"/admin/leaves/{leave_id}", headers=admin_headers)
+    assert response.status_code == 204
+    response = client.get("/user/my/leave/", headers={**headers, "If-None-Match": tag})
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+
+def test_user_get_my_leave_balance(client, user_A1):
+    response = client.get(
+        "/user/my/leave/balance/2025", headers={"Authorization": f"Bearer {user_A1}"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "fk_employee_id": 4,
+        "assign_year": 2025,
+        "total_leave": 31,
+        "balance_leave": 31,
+    }
+
+
+def test_user_get_my_leave_balance_not_found(client, user_A1):
+    response = client.get(
+        "/user/my/leave/balance/2030", headers={"Authorization": f"Bearer {user_A1}"}
+    )
+    assert response.status_code == 404
+
+
+def test_user_leave_balance_etag_changes_on_approval(client, user_A1, manager_A):
+    headers = {"Authorization": f"Bearer {user_A1}"}
+    tag = client.get("/user/my/leave/balance/2025", headers=headers).headers["ETag"]
+    client.put(
+        "/manager/leave-applications/1/status",
+        json={"leave_status": "Approved"},
+        headers={"Authorization": f"Bearer {manager_A}"},
+    )
+    response = client.get(
+        "/user/my/leave/balance/2025", headers={**headers, "If-None-Match": tag}
+    )
+    assert response.status_code == 200
+    assert response.json()["balance_leave"] == 28
@@ -1,8 +1,8 @@
 # -------------------------------------------------Test User API ---------------------------------------------------
 def test_user_create_my_leave_application_success(client, user_A1, read_json):
     payload = {
-        "from_date": "2025-11-30T10:00:00.000Z",
-        "end_date": "2025-11-30T19:00:00.000Z",
+        "from_date": "2025-12-01T10:00:00.000Z",
+        "end_date": "2025-12-01T19:00:00.000Z",
         "leave_reason": "string",
     }
     response = client.post(
@@ -224,3 +224,32 @@ def test_user_admin_access_update_employee_leave_application_status_by_id_forbid
     )
     assert response.status_code == 403
     assert response.json() == {"detail": "Admin privileges required"}
+
+
+def _apply(client, token, start, end):
+    return client.post(
+        "/user/my/leave-applications/",
+        json={"from_date": start, "end_date": end, "leave_reason": "Family event"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+
+def test_user_create_leave_application_overlapping_pending_conflict(client, user_A1):
+    response = _apply(client, user_A1, "2025-05-12T14:00:00Z", "2025-05-13T18:00:00Z")
+    assert response.status_code == 409
+    assert response.json() == {
+        "detail": "Overlaps leave application 1 (2025-05-10 to 2025-05-12)"
+    }
+    # Touching days by clock time on either side still counts
+    response = _apply(client, user_A1, "2025-06-05T20:00:00Z", "2025-06-06T09:00:00Z")
+    assert response.json()["detail"].startswith("Overlaps leave application 2 ")
+
+
+def test_user_create_leave_application_next_to_existing_success(client, user_A1):
+    response = _apply(client, user_A1, "2025-05-13T09:00:00Z", "2025-05-13T18:00:00Z")
+    assert response.status_code == 201
+
+
+def test_user_create_leave_application_over_rejected_success(client, user_B1):
+    response = _apply(client, user_B1, "2025-05-12T09:00:00Z", "2025-05-12T18:00:00Z")
+    assert response.status_code == 201
@@ -93,3 +93,64 @@ def test_user_admin_access_delete_payslips_by_id_forbidden(client, user_A1, read
     )
     assert response.status_code == 403
     assert response.json() == {"detail": "Admin privileges required"}
+
+
+def test_user_my_payslips_conditional_get(client, user_A1, user_A2, admin_user):
+    headers = {"Authorization": f"Bearer {user_A1}"}
+    response = client.get("/user/my/payslips/", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    tag = response.headers["ETag"]
+    assert tag.startswith('W/"')
+
+    for if_none_match in (tag, tag.removeprefix("W/"), f'"other", {tag}', "*"):
+        response = client.get(
+            "/user/my/payslips/", headers={**headers, "If-None-Match": if_none_match}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == tag
+
+    # Another user's copy of the same URL never matches
+    response = client.get(
+        "/user/my/payslips/",
+        headers={"Authorization": f"Bearer {user_A2}", "If-None-Match": tag},
+    )
+    assert response.status_code == 200
+    # Nor does the same user's tag for a different URL
+    response = client.get(
+        "/user/my/payslips/?limit=1", headers={**headers, "If-None-Match": tag}
+    )
+    assert response.status_code == 200
+
+    payload = {
+        "basic_amount": 1,
+        "hra": 0,
+        "special_allowance": 0,
+        "internet_allowance": 0,
+        "payslip_month": "2025-11-01T00:00:00Z",
+        "fk_employee_id": 4,
+    }
+    response = client.post(
+        "/admin/payslips/",
+        json=payload,
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 201
+    response = client.get(
+        "/user/my/payslips/", headers={**headers, "If-None-Match": tag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != tag
+    assert len(response.json()) == 4
+    tag = response.headers["ETag"]
+
+    response = client.delete(
+        "/admin/payslips/employee/4/month/2025/11",
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 204
+    response = client.get(
+        "/user/my/payslips/", headers={**headers, "If-None-Match": tag}
+    )
+    assert response.status_code == 200
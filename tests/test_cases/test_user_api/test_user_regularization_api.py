@@ -140,3 +140,27 @@ def test_user_admin_access_update_employee_regularization_by_id_forbidden(
     )
     assert response.status_code == 403
     assert response.json() == {"detail": "Admin privileges required"}
+
+
+def _regularize(client, token, day):
+    return client.post(
+        "/user/my/regularizations/",
+        json={
+            "regularization_start_time": f"{day}T09:00:00Z",
+            "regularization_end_time": f"{day}T18:00:00Z",
+            "regularization_reason": "Forgot to punch",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+
+def test_user_create_regularization_on_approved_leave_conflict(client, user_A1):
+    response = _regularize(client, user_A1, "2025-06-03")
+    assert response.status_code == 409
+    assert response.json() == {
+        "detail": "Overlaps leave application 2 (2025-06-01 to 2025-06-05)"
+    }
+
+
+def test_user_create_regularization_on_pending_leave_success(client, user_A1):
+    assert _regularize(client, user_A1, "2025-05-12").status_code == 201
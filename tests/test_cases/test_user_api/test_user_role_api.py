@@ -70,3 +70,24 @@ def test_user_admin_access_delete_role_by_name_forbidden(client, user_A1, read_j
     )
     assert response.status_code == 403
     assert response.json() == {"detail": "Admin privileges required"}
+
+
+def test_user_roles_and_departments_conditional_get(client, user_A1, admin_user):
+    headers = {"Authorization": f"Bearer {user_A1}"}
+    for url in ("/user/my/roles/", "/user/my/departments/"):
+        tag = client.get(url, headers=headers).headers["ETag"]
+        response = client.get(url, headers={**headers, "If-None-Match": tag})
+        assert response.status_code == 304
+
+    roles_tag = client.get("/user/my/roles/", headers=headers).headers["ETag"]
+    response = client.post(
+        "/admin/roles/",
+        json={"role": "Auditor"},
+        headers={"Authorization": f"Bearer {admin_user}"},
+    )
+    assert response.status_code == 201
+    response = client.get(
+        "/user/my/roles/", headers={**headers, "If-None-Match": roles_tag}
+    )
+    assert response.status_code == 200
+    assert response.json()[-1] == {"role": "Auditor", "role_id": 6}
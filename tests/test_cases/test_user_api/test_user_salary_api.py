@@ -86,3 +86,21 @@ def test_user_admin_access_delete_salary_by_salaryid_forbidden(
     )
     assert response.status_code == 403
     assert response.json() == {"detail": "Admin privileges required"}
+
+
+def test_user_my_salary_conditional_get_after_delete(client, admin_user):
+    headers = {"Authorization": f"Bearer {admin_user}"}
+    response = client.get("/user/my/salary/", headers=headers)
+    tag = response.headers["ETag"]
+    response = client.get("/user/my/salary/", headers={**headers, "If-None-Match": tag})
+    assert response.status_code == 304
+
+    assert client.delete("admin/salaries/1", headers=headers).status_code == 204
+    response = client.get("/user/my/salary/", headers={**headers, "If-None-Match": tag})
+    assert response.status_code == 200
+    tag = response.headers["ETag"]
+
+    response = client.delete("admin/salaries/employee/1/year/2025", headers=headers)
+    assert response.status_code == 204
+    response = client.get("/user/my/salary/", headers={**headers, "If-None-Match": tag})
+    assert response.status_code == 200
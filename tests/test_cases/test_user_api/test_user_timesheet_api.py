@@ -0,0 +1,63 @@
+def test_user_get_my_timesheet_success(client, user_A1):
+    response = client.get(
+        "/user/my/timesheet/2023/4", headers={"Authorization": f"Bearer {user_A1}"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "fk_employee_id": 4,
+        "year": 2023,
+        "month": 4,
+        "working_days": 20,
+        "days_present": 2,
+        "leave_days": 0,
+        "incomplete_days": 0,
+        "punched_seconds": 21000,
+        "worked_seconds": 21000,
+        "days": [
+            {
+                "work_date": "2023-04-01",
+                "punch_count": 2,
+                "punched_seconds": 10200,
+                "worked_seconds": 10200,
+                "regularized": False,
+                "on_leave": False,
+                "incomplete": False,
+            },
+            {
+                "work_date": "2023-04-03",
+                "punch_count": 2,
+                "punched_seconds": 10800,
+                "worked_seconds": 10800,
+                "regularized": False,
+                "on_leave": False,
+                "incomplete": False,
+            },
+        ],
+    }
+
+
+def test_user_get_my_timesheet_with_approved_leave(client, user_A1):
+    response = client.get(
+        "/user/my/timesheet/2025/6", headers={"Authorization": f"Bearer {user_A1}"}
+    )
+    body = response.json()
+    # 2025-06-01 is a Sunday; the leave runs to Thursday the 5th
+    assert [day["work_date"] for day in body["days"]] == [
+        "2025-06-02",
+        "2025-06-03",
+        "2025-06-04",
+        "2025-06-05",
+    ]
+    assert (body["leave_days"], body["days_present"], body["worked_seconds"]) == (
+        4,
+        0,
+        0,
+    )
+
+
+def test_user_get_my_timesheet_invalid_month(client, user_A1):
+    response = client.get(
+        "/user/my/timesheet/2025/13", headers={"Authorization": f"Bearer {user_A1}"}
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid year or month"}
@@ -0,0 +1,86 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from common.work_calendar import CalendarCache, WorkCalendar, recompute_leave_days
+from database.models import Holiday, WorkLocation
+from schema.calendar_schema import parse_weekly_offs
+from tests.conftest import engine
+
+NEW_YEAR = date(2025, 1, 1)
+
+
+def _naive(start, end, weekly_offs, holidays):
+    days = (start + timedelta(n) for n in range((end - start).days + 1))
+    return sum(d.weekday() not in weekly_offs and d not in holidays for d in days)
+
+
+def test_working_days_skip_weekly_offs_and_holidays():
+    cal = WorkCalendar({5, 6}, [NEW_YEAR])
+    assert cal.working_days(date(2025, 12, 1), date(2025, 12, 5)) == 5
+    assert cal.working_days(date(2025, 12, 6), date(2025, 12, 7)) == 0
+    assert cal.working_days(date(2024, 12, 30), date(2025, 1, 2)) == 3
+    assert cal.working_days(date(2025, 1, 2), date(2025, 1, 1)) == 0
+    assert cal.is_working_day(date(2025, 1, 2))
+    assert not cal.is_working_day(NEW_YEAR)
+
+
+def test_working_days_match_a_day_by_day_count():
+    rng = random.Random(17)
+    holidays = {date(2024, 2, 29), date(2025, 8, 15), date(2026, 1, 26)}
+    cal = WorkCalendar({4, 5}, holidays)
+    for _ in range(200):
+        start = date(2023, 1, 1) + timedelta(rng.randrange(1500))
+        end = start + timedelta(rng.randrange(900))
+        assert cal.working_days(start, end) == _naive(start, end, {4, 5}, holidays)
+
+
+def test_parse_weekly_offs():
+    assert parse_weekly_offs(" fri, SAT ") == {4, 5}
+    assert parse_weekly_offs("") == frozenset()
+    with pytest.raises(ValueError, match="Funday"):
+        parse_weekly_offs("Sun,Funday")
+
+
+def test_calendar_cache_per_location_and_expiry(db_session):
+    cache = CalendarCache(ttl=0)
+    db_session.add(
+        WorkLocation(location_id=1, location_name="Dubai", weekly_offs="Fri,Sat")
+    )
+    db_session.flush()  # the location row must exist before its holidays
+    db_session.add(Holiday(holiday_date=NEW_YEAR, holiday_name="New Year"))
+    db_session.add(
+        Holiday(
+            holiday_date=date(2025, 12, 2),
+            holiday_name="National Day",
+            fk_location_id=1,
+        )
+    )
+    db_session.commit()
+
+    dubai = cache.for_location(db_session, 1)
+    assert dubai.weekly_offs == {4, 5}
+    assert dubai.holidays == {NEW_YEAR, date(2025, 12, 2)}
+    # Unknown or missing locations get the default Sat/Sun calendar
+    default = cache.for_location(db_session, 99)
+    assert default.weekly_offs == {5, 6}
+    assert default.holidays == {NEW_YEAR}
+    # ttl=0: every lookup reloads
+    assert cache.for_location(db_session, None) is not default
+
+
+def test_recompute_loads_calendars_before_streaming(db_session):
+    statements = []
+    listener = lambda conn, cursor, statement, *rest: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        recompute_leave_days(db_session, {"id": 1, "is_admin": True})
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    selects = [
+        s.split("FROM ")[1].split()[0] for s in statements if s.startswith("SELECT")
+    ]
+    # The cold calendar cache is filled before the leave cursor, never during it
+    assert selects[:3] == ["holiday", "work_location", "leave_application"]
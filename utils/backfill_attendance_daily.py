@@ -0,0 +1,41 @@
+# backfill_attendance_daily.py
+import os, sys
+from datetime import timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func
+from database.database import engine, sessionlocal as SessionLocal
+from database.models import Attendance, AttendanceDaily
+from common.attendance import rebuild_attendance_daily
+
+
+def backfill_attendance_daily():
+    """Build the attendance_daily rollup from existing punches, month by month.
+
+    Safe to re-run: each month's summaries are replaced, not appended.
+    """
+    AttendanceDaily.__table__.create(bind=engine, checkfirst=True)
+    db = SessionLocal()
+    try:
+        first, last = db.query(
+            func.min(Attendance.punch_time), func.max(Attendance.punch_time)
+        ).one()
+        if first is None:
+            print("No attendance to backfill")
+            return
+
+        month = first.date().replace(day=1)
+        while month <= last.date():
+            next_month = (month + timedelta(days=32)).replace(day=1)
+            written = rebuild_attendance_daily(
+                db, month, next_month - timedelta(days=1)
+            )
+            print(f"✅ {month:%Y-%m}: {written} days")
+            month = next_month
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_attendance_daily()
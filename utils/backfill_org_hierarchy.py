@@ -0,0 +1,27 @@
+# backfill_org_hierarchy.py
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.database import engine, sessionlocal as SessionLocal
+from database.models import EmployeeHierarchy
+from common.org import rebuild_org_hierarchy
+
+
+def backfill_org_hierarchy():
+    """Build the employee_hierarchy closure table from fk_manager_id.
+
+    Safe to re-run: the table is emptied and rebuilt in one transaction.
+    """
+    EmployeeHierarchy.__table__.create(bind=engine, checkfirst=True)
+    db = SessionLocal()
+    try:
+        levels = rebuild_org_hierarchy(db)
+        rows = db.query(EmployeeHierarchy).count()
+        print(f"✅ employee_hierarchy: {rows} rows across {levels} levels")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_org_hierarchy()
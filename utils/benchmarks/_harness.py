@@ -0,0 +1,144 @@
+# _harness.py
+"""Shared setup for the scripts in utils/benchmarks.
+
+Each benchmark runs the real FastAPI app in-process through httpx's ASGI
+transport against a throwaway SQLite database seeded from tests/test_data.
+"""
+import contextlib, os, sqlite3, sys, tempfile, time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from main import app
+from database.models import Base
+from routers.auth import get_async_db, get_db
+from common.department import department_cache
+from common.metrics import TimedAsyncQueuePool, TimedQueuePool, watch_engine
+from common.role import role_cache
+from common.work_calendar import calendar_cache
+from tests.seed_db import seed_all_tables
+
+TEST_DATA_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "tests", "test_data"
+)
+PASSWORD = "pass123"
+# aiosqlite connections own non-daemon threads; close them before exiting
+_async_engines = []
+
+
+def _connection_factory(db_latency_ms: float):
+    class SlowConnection(sqlite3.Connection):
+        """Sleeps before every statement on the thread that executes it."""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            if db_latency_ms:
+                self.set_trace_callback(lambda sql: time.sleep(db_latency_ms / 1000))
+
+    return SlowConnection
+
+
+def seeded_app(
+    db_latency_ms: float = 0.0, pool_size: int = 5, pool_timeout: float = 30.0
+):
+    """Point the app at a fresh seeded SQLite file and return its engine.
+
+    ``db_latency_ms`` adds a blocking sleep before every statement to mimic
+    the round-trip to a remote MySQL instance. The sleep runs on whichever
+    thread executes the statement: a worker thread for the sync engine and
+    aiosqlite's connection thread for the async one, as real network I/O
+    would. Both engines get ``pool_size`` connections plus as many overflow
+    and give up waiting for one after ``pool_timeout`` seconds. Their pools
+    are the ones ``/metrics`` reports.
+    """
+    fd, path = tempfile.mkstemp(suffix=".sqlite3")
+    os.close(fd)
+    connect_args = {
+        "check_same_thread": False,
+        "factory": _connection_factory(db_latency_ms),
+    }
+    pool_args = {
+        "pool_size": pool_size,
+        "max_overflow": pool_size,
+        "pool_timeout": pool_timeout,
+    }
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args=connect_args,
+        poolclass=TimedQueuePool,
+        **pool_args,
+    )
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        seed_all_tables(session, TEST_DATA_DIR)
+    role_cache.clear()
+    department_cache.clear()
+    calendar_cache.invalidate()
+
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}",
+        connect_args=connect_args,
+        poolclass=TimedAsyncQueuePool,
+        **pool_args,
+    )
+    _async_engines.append(async_engine)
+    watch_engine("sync", engine)
+    watch_engine("async", async_engine.sync_engine)
+    AsyncSession = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return engine
+
+
+@contextlib.asynccontextmanager
+async def client():
+    """httpx client bound to the app; disposes async engines on exit."""
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://bench",
+            timeout=None,
+        ) as http:
+            yield http
+    finally:
+        while _async_engines:
+            await _async_engines.pop().dispose()
+
+
+async def token_for(http: httpx.AsyncClient, email: str) -> str:
+    response = await http.post(
+        "/auth/token", data={"username": email, "password": PASSWORD}
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(label: str, samples_ms) -> None:
+    print(
+        f"{label:<32} n={len(samples_ms):<6} "
+        f"p50={percentile(samples_ms, 50):8.2f}ms "
+        f"p99={percentile(samples_ms, 99):8.2f}ms "
+        f"max={max(samples_ms):8.2f}ms"
+    )
@@ -0,0 +1,83 @@
+# bench_async_reads.py
+"""Sync vs async throughput of GET /user/my/attendance/my at high concurrency.
+
+Usage:
+    python utils/benchmarks/bench_async_reads.py --clients 500 --db-latency-ms 10
+
+The async endpoint is the real route on AsyncSession. The sync twin is the
+same query through the sync Session and ``paginate``, mounted here only for
+the comparison. Each mode runs ``--clients`` concurrent clients issuing
+``--requests`` requests each; failed requests are counted, not retried.
+"""
+import argparse, asyncio, time
+from typing import List
+from _harness import client, report, seeded_app, token_for
+from main import app
+from common.pagination import page_dependency, paginate
+from database.models import Attendance
+from routers.auth import db_dependency, user_dependency
+from schema.attendance_schema import AttendanceResponse
+
+USERS = ["userA1@test.com", "userA2@test.com", "userB1@test.com", "userB2@test.com"]
+
+
+@app.get("/bench/sync/my-attendance", response_model=List[AttendanceResponse])
+def sync_my_attendance(db: db_dependency, user: user_dependency, page: page_dependency):
+    query = db.query(Attendance).filter(Attendance.fk_employee_id == user["id"])
+    return paginate(query, page, Attendance.attendance_id)
+
+
+async def run(http, path: str, tokens: list, clients: int, requests: int):
+    samples, failures = [], 0
+
+    async def one_client(i: int):
+        nonlocal failures
+        headers = {"Authorization": f"Bearer {tokens[i % len(tokens)]}"}
+        for _ in range(requests):
+            start = time.perf_counter()
+            try:
+                response = await http.get(path, headers=headers)
+                response.raise_for_status()
+            except Exception:
+                # e.g. the sync pool timing out once every worker thread is
+                # blocked on a connection held by a session awaiting teardown
+                failures += 1
+                continue
+            samples.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_client(i) for i in range(clients)))
+    return samples, failures, time.perf_counter() - start
+
+
+async def main(args):
+    seeded_app(
+        db_latency_ms=args.db_latency_ms,
+        pool_size=args.pool_size,
+        pool_timeout=args.pool_timeout,
+    )
+    async with client() as http:
+        tokens = [await token_for(http, email) for email in USERS]
+        for label, path in (
+            ("sync Session", "/bench/sync/my-attendance"),
+            ("AsyncSession", "/user/my/attendance/my"),
+        ):
+            samples, failures, elapsed = await run(
+                http, path, tokens, args.clients, args.requests
+            )
+            if samples:
+                report(label, samples)
+            print(
+                f"{label:<32} {len(samples) / elapsed:.0f} req/s, "
+                f"{failures} failed, {elapsed:.1f}s"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=2)
+    parser.add_argument("--db-latency-ms", type=float, default=10.0)
+    parser.add_argument("--pool-size", type=int, default=50)
+    parser.add_argument("--pool-timeout", type=float, default=5.0)
+    asyncio.run(main(parser.parse_args()))
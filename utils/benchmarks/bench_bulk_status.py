@@ -0,0 +1,91 @@
+# bench_bulk_status.py
+"""A manager clearing a backlog of pending regularizations, one PUT per id vs one bulk PUT.
+
+Usage:
+    python utils/benchmarks/bench_bulk_status.py --pending 200 --db-latency-ms 2
+
+managerA gets ``--pending`` extra pending regularizations from userA1. The
+first pass approves them with PUT /manager/regularizations/{id}/status, as
+the inbox did before; the second resets them to Pending and approves them
+all with a single PUT /manager/regularizations/status.
+"""
+import argparse, asyncio, time
+from datetime import datetime, timedelta
+from _harness import client, seeded_app, token_for
+from sqlalchemy import insert, select, update
+from database.models import Regularization
+
+MANAGER_ID, MANAGER_EMAIL, EMPLOYEE_ID = 2, "managerA@test.com", 4
+
+
+def add_pending(engine, count: int):
+    start = datetime(2025, 12, 1, 9)
+    rows = [
+        {
+            "regularization_start_time": start + timedelta(days=d),
+            "regularization_end_time": start + timedelta(days=d, hours=9),
+            "regularization_reason": "Missed punch after holiday",
+            "regularization_status": "Pending",
+            "fk_employee_id": EMPLOYEE_ID,
+            "fk_manager_id": MANAGER_ID,
+        }
+        for d in range(count)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Regularization), rows)
+        return list(
+            conn.scalars(
+                select(Regularization.regularization_id).where(
+                    Regularization.regularization_start_time >= start
+                )
+            )
+        )
+
+
+def reset(engine, ids):
+    with engine.begin() as conn:
+        conn.execute(
+            update(Regularization)
+            .where(Regularization.regularization_id.in_(ids))
+            .values(regularization_status="Pending")
+        )
+
+
+async def main(args):
+    engine = seeded_app(db_latency_ms=args.db_latency_ms)
+    ids = add_pending(engine, args.pending)
+    async with client() as http:
+        headers = {"Authorization": f"Bearer {await token_for(http, MANAGER_EMAIL)}"}
+        body = {"regularization_status": "Approved"}
+        print(
+            f"{len(ids)} pending regularizations, {args.db_latency_ms}ms per statement"
+        )
+
+        start = time.perf_counter()
+        for reg_id in ids:
+            response = await http.put(
+                f"/manager/regularizations/{reg_id}/status", json=body, headers=headers
+            )
+            response.raise_for_status()
+        one_by_one = time.perf_counter() - start
+        print(f"{'one PUT per id':<24} {one_by_one * 1000:10.1f}ms")
+
+        reset(engine, ids)
+        start = time.perf_counter()
+        response = await http.put(
+            "/manager/regularizations/status",
+            json={**body, "ids": ids},
+            headers=headers,
+        )
+        response.raise_for_status()
+        bulk = time.perf_counter() - start
+        updated = sum(r["outcome"] == "updated" for r in response.json())
+        print(f"{'one bulk PUT':<24} {bulk * 1000:10.1f}ms  ({updated} updated)")
+        print(f"{'speedup':<24} {one_by_one / bulk:10.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pending", type=int, default=200)
+    parser.add_argument("--db-latency-ms", type=float, default=2.0)
+    asyncio.run(main(parser.parse_args()))
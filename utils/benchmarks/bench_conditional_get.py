@@ -0,0 +1,77 @@
+# bench_conditional_get.py
+"""Replay of a "my" dashboard load with and without If-None-Match.
+
+Usage:
+    python utils/benchmarks/bench_conditional_get.py --loads 200 --db-latency-ms 2
+
+A dashboard load is one GET of each read-mostly "my" page. The first pass
+ignores ETags, as the frontend did before; the second sends back the ETag
+each URL returned last time, as a browser does for a ``no-cache`` response.
+``--payslips`` months of extra payslips give the user a realistic history.
+"""
+import argparse, asyncio, time
+from datetime import datetime
+from _harness import client, report, seeded_app, token_for
+from sqlalchemy import insert
+from database.models import Payslip
+
+DASHBOARD = [
+    "/user/my/payslips/",
+    "/user/my/salary/",
+    "/user/my/leave/",
+    "/user/my/roles/",
+    "/user/my/departments/",
+]
+USER_ID, USER_EMAIL = 4, "userA1@test.com"
+
+
+def add_payslip_history(engine, months: int) -> None:
+    rows = [
+        {
+            "basic_amount": 50000,
+            "hra": 20000,
+            "special_allowance": 5000,
+            "internet_allowance": 1000,
+            "payslip_month": datetime(2000 + m // 12, m % 12 + 1, 1),
+            "fk_employee_id": USER_ID,
+        }
+        for m in range(months)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Payslip), rows)
+
+
+async def replay(http, token: str, loads: int, conditional: bool):
+    etags, samples, sent, statuses = {}, [], 0, {}
+    for _ in range(loads):
+        start = time.perf_counter()
+        for url in DASHBOARD:
+            headers = {"Authorization": f"Bearer {token}"}
+            if conditional and url in etags:
+                headers["If-None-Match"] = etags[url]
+            response = await http.get(url, headers=headers)
+            etags[url] = response.headers["ETag"]
+            sent += len(response.content)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples, sent, statuses
+
+
+async def main(args):
+    engine = seeded_app(db_latency_ms=args.db_latency_ms)
+    add_payslip_history(engine, args.payslips)
+    async with client() as http:
+        token = await token_for(http, USER_EMAIL)
+        print(f"{len(DASHBOARD)} URLs per load, {args.payslips} payslips on file")
+        for label, conditional in (("full responses", False), ("If-None-Match", True)):
+            samples, sent, statuses = await replay(http, token, args.loads, conditional)
+            report(label, samples)
+            print(f"{'':<32} body bytes/load={sent / args.loads:9.0f} {statuses}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loads", type=int, default=200)
+    parser.add_argument("--payslips", type=int, default=120)
+    parser.add_argument("--db-latency-ms", type=float, default=2.0)
+    asyncio.run(main(parser.parse_args()))
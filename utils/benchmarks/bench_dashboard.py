@@ -0,0 +1,52 @@
+# bench_dashboard.py
+"""A manager's landing page: four inbox/attendance requests vs one dashboard request.
+
+Usage:
+    python utils/benchmarks/bench_dashboard.py --loads 200 --db-latency-ms 2
+
+Each page load as it was fetched the pending leave applications, expense
+claims and regularizations plus the team's attendance for the day, one
+request each. The dashboard returns the same, with status counts, in one.
+"""
+import argparse, asyncio, time
+from _harness import client, report, seeded_app, token_for
+
+DAY = "2023-04-01"
+OLD_PAGE = [
+    "/manager/leave-applications/status/Pending",
+    "/manager/expense-claims/status/Pending",
+    "/manager/regularizations/pending",
+    f"/manager/attendance/date/{DAY}",
+]
+
+
+async def load(http, headers, urls):
+    start = time.perf_counter()
+    for url in urls:
+        response = await http.get(url, headers=headers)
+        # An empty inbox answers 404 on the older endpoints
+        assert response.status_code in (200, 404), (url, response.status_code)
+    return (time.perf_counter() - start) * 1000
+
+
+async def main(args):
+    seeded_app(db_latency_ms=args.db_latency_ms)
+    async with client() as http:
+        headers = {
+            "Authorization": f"Bearer {await token_for(http, 'managerA@test.com')}"
+        }
+        print(f"{args.loads} page loads, {args.db_latency_ms}ms per statement")
+        old = [await load(http, headers, OLD_PAGE) for _ in range(args.loads)]
+        new = [
+            await load(http, headers, [f"/manager/dashboard/?on_date={DAY}"])
+            for _ in range(args.loads)
+        ]
+        report("four requests", old)
+        report("one dashboard request", new)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loads", type=int, default=200)
+    parser.add_argument("--db-latency-ms", type=float, default=2.0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,114 @@
+# bench_employee_import.py
+"""Bulk employee import vs create_employee per row, and import memory vs file size.
+
+Usage:
+    python utils/benchmarks/bench_employee_import.py --rows 10000 100000
+
+Each run gets a fresh SQLite file and a generated CSV in which every tenth
+row reports to the row before it by ``manager_email``. Peak memory is
+measured with tracemalloc, so absolute timings are somewhat pessimistic.
+IMPORT_BCRYPT_ROUNDS defaults to 4 here; bcrypt dominates at production cost.
+"""
+import argparse, os, sys, tempfile, time, tracemalloc
+
+os.environ.setdefault("IMPORT_BCRYPT_ROUNDS", "4")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from database.models import Base, Department, Role
+from schema.employee_schema import EmployeeCreate
+from common.department import department_cache
+from common.employee import create_employee
+from common.employee_import import import_employees
+from common.export import ExportFormat
+from common.role import role_cache
+
+ADMIN = {"id": 0, "is_admin": True}
+HEADER = "first_name,last_name,email,joining_date,isadmin,department,role,manager_email,password\n"
+
+
+def fresh_db(path: str):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Department(department_name="Engineering"))
+    db.add(Role(role="Developer"))
+    db.commit()
+    role_cache.clear()
+    department_cache.clear()
+    return engine, db
+
+
+def write_csv(path: str, rows: int) -> None:
+    with open(path, "w") as f:
+        f.write(HEADER)
+        for i in range(rows):
+            manager = f"e{i - 1}@acq.test" if i % 10 else ""
+            f.write(
+                f"E,{i},e{i}@acq.test,2025-01-06,false,engineering,developer,"
+                f"{manager},pw{i}\n"
+            )
+
+
+def per_row(tmp: str, sample: int) -> float:
+    engine, db = fresh_db(os.path.join(tmp, "loop.sqlite3"))
+    start = time.perf_counter()
+    for i in range(sample):
+        create_employee(
+            EmployeeCreate(
+                first_name="E",
+                last_name=str(i),
+                email=f"e{i}@loop.test",
+                joining_date=date(2025, 1, 6),
+                isadmin=False,
+                fk_department_id=1,
+                fk_role_id=1,
+                password=f"pw{i}",
+            ),
+            db,
+            ADMIN,
+        )
+    elapsed = time.perf_counter() - start
+    db.close()
+    engine.dispose()
+    return sample / elapsed
+
+
+def bulk(tmp: str, rows: int) -> None:
+    csv_path = os.path.join(tmp, f"import-{rows}.csv")
+    write_csv(csv_path, rows)
+    engine, db = fresh_db(os.path.join(tmp, f"bulk-{rows}.sqlite3"))
+    tracemalloc.start()
+    with open(csv_path, "rb") as f:
+        result = import_employees(db, f, ExportFormat.csv, ADMIN)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.close()
+    engine.dispose()
+    print(
+        f"import {rows:>7} rows   {result['rows_per_second']:8.0f} rows/s  "
+        f"{result['duration_ms'] / 1000:6.1f}s  created={result['created']}  "
+        f"file={os.path.getsize(csv_path) / 1e6:5.1f}MB  peak={peak / 1e6:5.1f}MB"
+    )
+
+
+def main(args):
+    tmp = tempfile.mkdtemp()
+    try:
+        print(f"create_employee loop    {per_row(tmp, args.sample):8.0f} rows/s")
+        for rows in args.rows:
+            bulk(tmp, rows)
+    finally:
+        for name in os.listdir(tmp):
+            os.remove(os.path.join(tmp, name))
+        os.rmdir(tmp)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--sample", type=int, default=1000)
+    main(parser.parse_args())
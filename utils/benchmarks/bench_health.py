@@ -0,0 +1,60 @@
+# bench_health.py
+"""Readiness probes under a probe storm, with and without the result cache.
+
+Usage:
+    python utils/benchmarks/bench_health.py --probes 2000 --concurrency 20
+
+Many load balancer nodes and the container health check all probe every
+worker. This sends --probes requests to /health/ready from --concurrency
+clients against a ReadinessProbe on the seeded engine, first with results
+that expire at once and then kept HEALTH_CACHE_TTL seconds. Each run reports
+probe latency and how many SELECT 1 statements reached the database.
+"""
+import argparse, asyncio, time
+from _harness import client, report, seeded_app
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import main as api
+from common.health import HEALTH_CACHE_TTL, ReadinessProbe
+
+
+async def storm(http, probes: int, concurrency: int):
+    samples, queue = [], iter(range(probes))
+
+    async def prober():
+        for _ in queue:
+            start = time.perf_counter()
+            response = await http.get("/health/ready")
+            response.raise_for_status()
+            samples.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(prober() for _ in range(concurrency)))
+    return samples
+
+
+async def main(args):
+    engine = seeded_app(db_latency_ms=args.db_latency_ms)
+    selects = [0]
+
+    @event.listens_for(Engine, "before_cursor_execute")
+    def count(conn, cursor, statement, *rest):
+        selects[0] += statement == "SELECT 1"
+
+    async with client() as http:
+        for label, ttl in (("no cache", 0.0), (f"cached {HEALTH_CACHE_TTL:g}s", None)):
+            probe = ReadinessProbe({"sync": engine})
+            if ttl is not None:
+                probe.ttl = ttl
+            api.readiness = probe
+            selects[0] = 0
+            samples = await storm(http, args.probes, args.concurrency)
+            report(label, samples)
+            print(f"{'':<32} SELECT 1 run: {selects[0]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--probes", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--db-latency-ms", type=float, default=2.0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,76 @@
+# bench_login_storm.py
+"""Latency of unrelated endpoints while a burst of logins is in flight.
+
+Usage:
+    python utils/benchmarks/bench_login_storm.py --logins 500 --db-latency-ms 20
+
+A probe task keeps calling GET /user/my/roles/ with an existing token. The
+probe's p99 is reported once on an idle server and once during the storm;
+with the auth path off the event loop the two should stay close.
+"""
+import argparse, asyncio, time
+from _harness import client, percentile, report, seeded_app, token_for
+
+USERS = [
+    "admin@test.com",
+    "managerA@test.com",
+    "managerB@test.com",
+    "userA1@test.com",
+    "userA2@test.com",
+    "userB1@test.com",
+    "userB2@test.com",
+]
+
+
+async def probe(http, token: str, stop: asyncio.Event, samples: list):
+    headers = {"Authorization": f"Bearer {token}"}
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await http.get("/user/my/roles/", headers=headers)
+        response.raise_for_status()
+        samples.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.005)
+
+
+async def storm(http, logins: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        async with semaphore:
+            await token_for(http, USERS[i % len(USERS)])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(logins)))
+    return time.perf_counter() - start
+
+
+async def main(args):
+    seeded_app(db_latency_ms=args.db_latency_ms)
+    async with client() as http:
+        token = await token_for(http, "userA1@test.com")
+
+        idle, stop = [], asyncio.Event()
+        task = asyncio.create_task(probe(http, token, stop, idle))
+        await asyncio.sleep(args.idle_seconds)
+        stop.set()
+        await task
+
+        busy, stop = [], asyncio.Event()
+        task = asyncio.create_task(probe(http, token, stop, busy))
+        elapsed = await storm(http, args.logins, args.concurrency)
+        stop.set()
+        await task
+
+    report("probe idle", idle)
+    report("probe during login storm", busy)
+    print(f"{args.logins} logins in {elapsed:.2f}s ({args.logins / elapsed:.0f}/s)")
+    print(f"p99 ratio storm/idle: {percentile(busy, 99) / percentile(idle, 99):.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--db-latency-ms", type=float, default=10.0)
+    parser.add_argument("--idle-seconds", type=float, default=2.0)
+    asyncio.run(main(parser.parse_args()))
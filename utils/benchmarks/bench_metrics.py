@@ -0,0 +1,100 @@
+# bench_metrics.py
+"""Per-request cost of MetricsMiddleware and the time to render /metrics.
+
+Usage:
+    python utils/benchmarks/bench_metrics.py --requests 2000
+    python utils/benchmarks/bench_metrics.py --concurrency 32 --pool-size 2
+
+Sends GETs from --concurrency clients to a few read endpoints, first with
+the metrics middleware in place and then with it removed, and reports the
+latency of each pass; compare the two at --concurrency 1. During the first
+pass /metrics is scraped every 50ms and the peak pool saturation is kept:
+with more clients than connections, checkouts queue, which shows in
+db_pool_saturation and db_pool_checkout_wait_seconds.
+"""
+import argparse, asyncio, time
+from _harness import client, report, seeded_app, token_for
+from main import app
+from common.metrics import MetricsMiddleware
+
+ENDPOINTS = [
+    "/admin/employees/id/4",
+    "/admin/leave-applications/overlaps",
+    "/user/my/me/",
+    "/user/my/payslips/",
+]
+ADMIN_EMAIL = "admin@test.com"
+
+
+def remove_metrics_middleware() -> None:
+    """Starlette rebuilds its middleware stack on the next request."""
+    app.user_middleware = [
+        m for m in app.user_middleware if m.cls is not MetricsMiddleware
+    ]
+    app.middleware_stack = None
+
+
+async def load(http, token: str, requests: int, concurrency: int):
+    headers = {"Authorization": f"Bearer {token}"}
+    samples, queue = [], iter(range(requests))
+
+    async def worker():
+        for n in queue:
+            start = time.perf_counter()
+            response = await http.get(ENDPOINTS[n % len(ENDPOINTS)], headers=headers)
+            response.raise_for_status()
+            samples.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples
+
+
+async def scrape_during(http, task, interval: float = 0.05):
+    """Scrape /metrics every ``interval`` seconds until ``task`` finishes."""
+    scrapes, peak = [], {}
+    while not task.done():
+        start = time.perf_counter()
+        response = await http.get("/metrics")
+        scrapes.append((time.perf_counter() - start) * 1000)
+        for line in response.text.splitlines():
+            if line.startswith("db_pool_saturation"):
+                name, value = line.rsplit(" ", 1)
+                peak[name] = max(peak.get(name, 0.0), float(value))
+        await asyncio.sleep(interval)
+    return scrapes, peak, response.text
+
+
+async def main(args):
+    seeded_app(db_latency_ms=args.db_latency_ms, pool_size=args.pool_size)
+    async with client() as http:
+        token = await token_for(http, ADMIN_EMAIL)
+        await load(http, token, 50, args.concurrency)  # warm caches
+        task = asyncio.create_task(load(http, token, args.requests, args.concurrency))
+        scrapes, peak, text = await scrape_during(http, task)
+        with_metrics = await task
+        remove_metrics_middleware()
+        without = await load(http, token, args.requests, args.concurrency)
+
+    print(f"{args.concurrency} clients, pool of {args.pool_size} (+ as many overflow)")
+    report("metrics on", with_metrics)
+    report("metrics off", without)
+    mean = lambda samples: sum(samples) / len(samples)
+    print(f"overhead per request: {mean(with_metrics) - mean(without):+.3f}ms")
+    report("/metrics scrape", scrapes)
+    print(f"{'':<32} {len(text)} bytes")
+    for name, value in sorted(peak.items()):
+        print(f"peak {name} {value}")
+    for line in text.splitlines():
+        if line.startswith(
+            ("db_pool_checkout_wait_seconds_sum", "db_pool_checkout_wait_seconds_count")
+        ):
+            print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--db-latency-ms", type=float, default=1.0)
+    asyncio.run(main(parser.parse_args()))
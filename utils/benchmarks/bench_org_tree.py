@@ -0,0 +1,146 @@
+# bench_org_tree.py
+"""Descendant and is-in-tree lookups: naive recursion vs CTE vs closure table.
+
+Usage:
+    python utils/benchmarks/bench_org_tree.py --employees 50000 --fanout 8
+
+Builds a synthetic org of ``--employees`` people where every manager has
+``--fanout`` direct reports, then times the three strategies against the
+same SQLite file. "Naive" walks the tree one ``fk_manager_id`` query per
+manager, the way direct-report scoping would have to be extended without a
+precomputed structure.
+"""
+import argparse, os, random, sys, tempfile, time
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+from database.models import Base, Department, Employee, Role
+from common.org import is_in_tree, rebuild_org_hierarchy, subordinate_ids
+
+
+def build_org(db, employees: int, fanout: int) -> None:
+    db.add(Department(department_id=1, department_name="Bench"))
+    db.add(Role(role_id=1, role="Bench"))
+    rows = [
+        {
+            "employee_id": i,
+            "first_name": "E",
+            "last_name": str(i),
+            "email": f"e{i}@bench.test",
+            "password": "x",
+            "joining_date": date(2024, 1, 1),
+            "isadmin": False,
+            "fk_department_id": 1,
+            "fk_role_id": 1,
+            # Heap numbering: employee i reports to (i - 2) // fanout + 1
+            "fk_manager_id": (i - 2) // fanout + 1 if i > 1 else None,
+        }
+        for i in range(1, employees + 1)
+    ]
+    db.execute(insert(Employee), rows)
+    db.commit()
+
+
+def naive_descendants(db, manager_id: int) -> set:
+    found, frontier = set(), [manager_id]
+    while frontier:
+        manager = frontier.pop()
+        for (child,) in db.query(Employee.employee_id).filter(
+            Employee.fk_manager_id == manager
+        ):
+            found.add(child)
+            frontier.append(child)
+    return found
+
+
+def naive_in_tree(db, manager_id: int, employee_id: int) -> bool:
+    # Walk up the chain from the employee, one query per level
+    current = employee_id
+    while current is not None:
+        current = (
+            db.query(Employee.fk_manager_id)
+            .filter(Employee.employee_id == current)
+            .scalar()
+        )
+        if current == manager_id:
+            return True
+    return False
+
+
+def cte_descendants(db, manager_id: int) -> set:
+    tree = (
+        select(Employee.employee_id)
+        .where(Employee.fk_manager_id == manager_id)
+        .cte(recursive=True)
+    )
+    tree = tree.union_all(
+        select(Employee.employee_id).where(Employee.fk_manager_id == tree.c.employee_id)
+    )
+    return set(db.scalars(select(tree.c.employee_id)))
+
+
+def closure_descendants(db, manager_id: int) -> set:
+    return set(db.scalars(subordinate_ids(manager_id, depth=64)))
+
+
+def timed(func, calls) -> float:
+    start = time.perf_counter()
+    for args in calls:
+        func(*args)
+    return (time.perf_counter() - start) / len(calls) * 1000
+
+
+def main(args):
+    fd, path = tempfile.mkstemp(suffix=".sqlite3")
+    os.close(fd)
+    try:
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+
+        build_org(db, args.employees, args.fanout)
+        start = time.perf_counter()
+        levels = rebuild_org_hierarchy(db)
+        print(
+            f"{args.employees} employees, fanout {args.fanout}, {levels} levels; "
+            f"closure rebuilt in {time.perf_counter() - start:.2f}s"
+        )
+
+        rng = random.Random(0)
+        # Managers near the top have the big subtrees that make this matter
+        managers = [(db, rng.randint(1, 1 + args.fanout)) for _ in range(args.samples)]
+        pairs = [
+            (db, rng.randint(1, 1 + args.fanout), rng.randint(1, args.employees))
+            for _ in range(args.samples * 20)
+        ]
+
+        sizes = {len(closure_descendants(*m)) for m in managers}
+        assert all(
+            naive_descendants(*m) == cte_descendants(*m) == closure_descendants(*m)
+            for m in managers[:3]
+        )
+        print(f"all descendants (subtree sizes {min(sizes)}..{max(sizes)})")
+        print(f"  naive recursion  {timed(naive_descendants, managers):9.2f}ms/call")
+        print(f"  recursive CTE    {timed(cte_descendants, managers):9.2f}ms/call")
+        print(f"  closure table    {timed(closure_descendants, managers):9.2f}ms/call")
+
+        closure_in_tree = lambda db, m, e: is_in_tree(db, m, e, depth=64)
+        assert all(naive_in_tree(*p) == closure_in_tree(*p) for p in pairs)
+        print("is X in Y's tree")
+        print(f"  naive recursion  {timed(naive_in_tree, pairs):9.3f}ms/call")
+        print(f"  closure table    {timed(closure_in_tree, pairs):9.3f}ms/call")
+        db.close()
+        engine.dispose()
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=50000)
+    parser.add_argument("--fanout", type=int, default=8)
+    parser.add_argument("--samples", type=int, default=10)
+    main(parser.parse_args())
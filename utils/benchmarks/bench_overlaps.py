@@ -0,0 +1,96 @@
+# bench_overlaps.py
+"""Overlap checks: the create-time lookup with and without the range index, then the report.
+
+Usage:
+    python utils/benchmarks/bench_overlaps.py --employees 2000 --per-employee 50
+
+Seeds ``--per-employee`` back-to-back leave applications for each of
+``--employees`` employees, plus one overlapping pair per 100 employees.
+Times ``--checks`` find_overlapping_leave calls and one get_overlap_report
+against the indexed table, then the checks again with the index dropped.
+"""
+import argparse, os, random, sys, tempfile, time
+from datetime import date, datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+from database.models import Base, LeaveApplication
+from common.leave_application import find_overlapping_leave, get_overlap_report
+
+FIRST_DAY = date(2020, 1, 1)
+
+
+def seed(db, employees: int, per_employee: int):
+    rows = []
+    for employee_id in range(1, employees + 1):
+        for n in range(per_employee):
+            start = datetime.combine(FIRST_DAY + timedelta(n * 7), datetime.min.time())
+            rows.append(_row(employee_id, start, start + timedelta(days=2)))
+        if employee_id % 100 == 0:
+            start = datetime.combine(FIRST_DAY + timedelta(1), datetime.min.time())
+            rows.append(_row(employee_id, start, start + timedelta(days=2)))
+    for i in range(0, len(rows), 10000):
+        db.execute(insert(LeaveApplication), rows[i : i + 10000])
+    db.commit()
+    return len(rows)
+
+
+def _row(employee_id, start, end):
+    return {
+        "from_date": start,
+        "end_date": end,
+        "total_days": 3,
+        "leave_status": "Approved",
+        "leave_reason": "Bench",
+        "fk_employee_id": employee_id,
+        "fk_manager_id": 1,
+    }
+
+
+def time_checks(db, args) -> float:
+    rng = random.Random(7)
+    start = time.perf_counter()
+    for _ in range(args.checks):
+        day = FIRST_DAY + timedelta(rng.randrange(args.per_employee * 7))
+        find_overlapping_leave(db, rng.randint(1, args.employees), day, day)
+    return (time.perf_counter() - start) / args.checks
+
+
+def main(args):
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "overlaps.sqlite3")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        count = seed(db, args.employees, args.per_employee)
+        print(f"{count} leave applications, {args.checks} checks")
+        indexed = time_checks(db, args)
+        start = time.perf_counter()
+        report = get_overlap_report(db)
+        report_ms = (time.perf_counter() - start) * 1000
+        db.execute(text("DROP INDEX ix_leave_application_employee_range"))
+        scan = time_checks(db, args)
+        print(f"{'full scan':<20} {scan * 1e6:10.1f}us/check")
+        print(f"{'range index':<20} {indexed * 1e6:10.1f}us/check")
+        print(f"{'speedup':<20} {scan / indexed:10.1f}x")
+        print(
+            f"{'overlap report':<20} {report_ms:10.1f}ms  "
+            f"({len(report['overlaps'])} pairs)"
+        )
+
+    finally:
+        db.close()
+        engine.dispose()
+        os.remove(path)
+        os.rmdir(tmp)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=2000)
+    parser.add_argument("--per-employee", type=int, default=50)
+    parser.add_argument("--checks", type=int, default=2000)
+    main(parser.parse_args())
@@ -0,0 +1,104 @@
+# bench_payroll_run.py
+"""Monthly payroll for a synthetic org: one create_payslip per employee vs run_payroll.
+
+Usage:
+    python utils/benchmarks/bench_payroll_run.py --employees 10000
+
+Both paths run against their own fresh SQLite file. The per-employee path
+is what a client looping over POST /admin/payslips/ costs, minus HTTP; it
+is timed over ``--sample`` employees and extrapolated.
+"""
+import argparse, os, sys, tempfile, time
+from datetime import date, datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from database.models import Base, Department, Employee, Role, Salary
+from schema.payslip_schema import PayslipCreate
+from common.payslip import _payslip_components, create_payslip, run_payroll
+
+YEAR, MONTH = 2025, 4
+
+
+def build_org(path: str, employees: int):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Department(department_id=1, department_name="Bench"))
+    db.add(Role(role_id=1, role="Bench"))
+    ids = range(1, employees + 1)
+    db.execute(
+        insert(Employee),
+        [
+            {
+                "employee_id": i,
+                "first_name": "E",
+                "last_name": str(i),
+                "email": f"e{i}@bench.test",
+                "password": "x",
+                "joining_date": date(2024, 1, 1),
+                "isadmin": False,
+                "fk_department_id": 1,
+                "fk_role_id": 1,
+            }
+            for i in ids
+        ],
+    )
+    db.execute(
+        insert(Salary),
+        [{"lpa": 3 + i % 40, "salary_year": YEAR, "fk_employee_id": i} for i in ids],
+    )
+    db.commit()
+    return engine, db
+
+
+def per_employee(db, sample: int) -> float:
+    start = time.perf_counter()
+    for employee_id, lpa in db.query(Salary.fk_employee_id, Salary.lpa).limit(sample):
+        create_payslip(
+            db,
+            PayslipCreate(
+                **_payslip_components(lpa),
+                payslip_month=datetime(YEAR, MONTH, 1),
+                fk_employee_id=employee_id,
+            ),
+        )
+    return time.perf_counter() - start
+
+
+def main(args):
+    tmp = tempfile.mkdtemp()
+    try:
+        engine, db = build_org(os.path.join(tmp, "loop.sqlite3"), args.employees)
+        elapsed = per_employee(db, args.sample)
+        db.close()
+        engine.dispose()
+        rate = args.sample / elapsed
+        print(f"{args.employees} employees with a {YEAR} salary")
+        print(
+            f"create_payslip loop  {rate:10.0f} rows/s  "
+            f"(~{args.employees / rate:.1f}s for all, from {args.sample})"
+        )
+
+        engine, db = build_org(os.path.join(tmp, "bulk.sqlite3"), args.employees)
+        result = run_payroll(db, YEAR, MONTH)
+        db.close()
+        engine.dispose()
+        print(
+            f"run_payroll          {result['rows_per_second']:10.0f} rows/s  "
+            f"({result['duration_ms'] / 1000:.2f}s for {result['created']})"
+        )
+        print(f"speedup              {result['rows_per_second'] / rate:10.1f}x")
+    finally:
+        for name in os.listdir(tmp):
+            os.remove(os.path.join(tmp, name))
+        os.rmdir(tmp)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=10000)
+    parser.add_argument("--sample", type=int, default=1000)
+    main(parser.parse_args())
@@ -0,0 +1,74 @@
+# bench_query_stats.py
+"""Cost of per-request query counting, and each read endpoint's query count.
+
+Usage:
+    python utils/benchmarks/bench_query_stats.py --rounds 200
+
+Replays a set of GET endpoints as a manager, first with QueryStatsMiddleware
+and its cursor listeners in place and then with both removed, and reports
+the latency of each pass. The first pass also prints the Server-Timing
+header of every endpoint, which is how an N+1 shows up in a browser.
+"""
+import argparse, asyncio, time
+from _harness import client, report, seeded_app, token_for
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from main import app
+from common import query_stats
+
+ENDPOINTS = [
+    "/manager/dashboard/",
+    "/manager/subordinates/?depth=2",
+    "/manager/regularizations/pending",
+    "/user/my/me/",
+    "/user/my/regularizations/",
+    "/user/my/payslips/",
+    "/user/my/timesheet/2023/6",
+]
+MANAGER_EMAIL = "managerA@test.com"
+
+
+def remove_query_stats() -> None:
+    """Drop the middleware and listeners; Starlette rebuilds its stack lazily."""
+    app.user_middleware = [
+        m for m in app.user_middleware if m.cls is not query_stats.QueryStatsMiddleware
+    ]
+    app.middleware_stack = None
+    event.remove(Engine, "before_cursor_execute", query_stats._before_cursor_execute)
+    event.remove(Engine, "after_cursor_execute", query_stats._after_cursor_execute)
+
+
+async def replay(http, token: str, rounds: int, show: bool):
+    headers = {"Authorization": f"Bearer {token}"}
+    samples = []
+    for n in range(rounds):
+        for url in ENDPOINTS:
+            start = time.perf_counter()
+            response = await http.get(url, headers=headers)
+            samples.append((time.perf_counter() - start) * 1000)
+            if show and n == 0:
+                timing = response.headers.get("server-timing", "-")
+                print(f"  {response.status_code} {url:<34} {timing}")
+    return samples
+
+
+async def main(args):
+    seeded_app(db_latency_ms=args.db_latency_ms)
+    async with client() as http:
+        token = await token_for(http, MANAGER_EMAIL)
+        await replay(http, token, 5, False)  # warm caches
+        print(f"{len(ENDPOINTS)} endpoints x {args.rounds} rounds")
+        with_stats = await replay(http, token, args.rounds, True)
+        remove_query_stats()
+        without = await replay(http, token, args.rounds, False)
+    report("query stats on", with_stats)
+    report("query stats off", without)
+    mean = lambda samples: sum(samples) / len(samples)
+    print(f"overhead per request: {mean(with_stats) - mean(without):+.3f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--db-latency-ms", type=float, default=0.0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,59 @@
+# bench_reference_cache.py
+"""Role/department lookups straight from the database vs the reference cache.
+
+Usage:
+    python utils/benchmarks/bench_reference_cache.py --calls 5000 --db-latency-ms 1
+
+Calls the lookup functions directly against a seeded SQLite file, so the
+numbers are the lookup cost alone. ``--db-latency-ms`` adds a sleep before
+every statement to stand in for the network hop to MySQL.
+"""
+import argparse, time
+
+from _harness import seeded_app
+from sqlalchemy.orm import sessionmaker
+from database.models import Department, Role
+from common.department import department_cache
+from common.role import role_cache
+
+NAMES = ["accountant", "DEVELOPER", " Manager ", "hr executive"]
+
+
+def uncached(db, i):
+    db.query(Role).all()
+    db.query(Department).all()
+    db.query(Role).filter(Role.role.ilike(NAMES[i % len(NAMES)].strip())).first()
+
+
+def cached(db, i):
+    role_cache.all(db)
+    department_cache.all(db)
+    role_cache.by_name(db, NAMES[i % len(NAMES)])
+
+
+def run(func, db, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        func(db, i)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main(args):
+    engine = seeded_app(db_latency_ms=args.db_latency_ms)
+    with sessionmaker(bind=engine)() as db:
+        direct = run(uncached, db, args.calls)
+        served = run(cached, db, args.calls)
+
+    print(f"{args.calls} x (all roles + all departments + one role by name)")
+    print(f"db latency {args.db_latency_ms}ms per statement")
+    print(f"database every call   {direct:10.1f}us/iteration")
+    print(f"reference cache       {served:10.1f}us/iteration")
+    print(f"speedup               {direct / served:10.1f}x")
+    print(f"role cache stats      {role_cache.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--db-latency-ms", type=float, default=0.0)
+    main(parser.parse_args())
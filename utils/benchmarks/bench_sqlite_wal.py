@@ -0,0 +1,94 @@
+# bench_sqlite_wal.py
+"""Local SQLite under mixed load: rollback journal vs WAL and the other pragmas.
+
+Usage:
+    python utils/benchmarks/bench_sqlite_wal.py --writers 4 --readers 4 --seconds 5
+
+Seeds a file database from tests/test_data. Writer threads punch in through
+create_attendance, which commits once per punch. At the same time, reader
+threads load the manager dashboard. The run is repeated with
+enable_sqlite_pragmas, and each run reports throughput and read latency.
+"""
+import argparse, os, sys, tempfile, threading, time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from database.models import Base
+from database.sqlite import enable_sqlite_pragmas
+from common.attendance import create_attendance
+from common.dashboard import get_manager_dashboard
+from common.work_calendar import calendar_cache
+from tests.seed_db import seed_all_tables
+from _harness import TEST_DATA_DIR, report
+
+MANAGER = {"id": 2}
+
+
+def run(label: str, pragmas: bool, args):
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(directory, 'greythr.db')}",
+            connect_args={"check_same_thread": False},
+            pool_size=args.writers + args.readers,
+        )
+        if pragmas:
+            enable_sqlite_pragmas(engine)
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        with Session() as session:
+            seed_all_tables(session, TEST_DATA_DIR)
+        calendar_cache.invalidate()
+
+        stop_at = time.perf_counter() + args.seconds
+        writes, reads, locked = [], [], [0]
+
+        def writer(n):
+            punch = datetime(2025, 1, 1) + timedelta(minutes=n)
+            while time.perf_counter() < stop_at:
+                start = time.perf_counter()
+                with Session() as db:
+                    try:
+                        create_attendance(db, punch, {"id": 4 + n % 4})
+                    except OperationalError:  # database is locked
+                        locked[0] += 1
+                        continue
+                writes.append((time.perf_counter() - start) * 1000)
+                punch += timedelta(hours=1)
+
+        def reader():
+            while time.perf_counter() < stop_at:
+                start = time.perf_counter()
+                with Session() as db:
+                    get_manager_dashboard(db, MANAGER, on_date=datetime(2025, 1, 1))
+                reads.append((time.perf_counter() - start) * 1000)
+
+        threads = [
+            threading.Thread(target=writer, args=(n,)) for n in range(args.writers)
+        ]
+        threads += [threading.Thread(target=reader) for _ in range(args.readers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        engine.dispose()
+
+    print(
+        f"{label}: {len(writes) / args.seconds:.0f} punches/s, "
+        f"{len(reads) / args.seconds:.0f} dashboards/s, {locked[0]} locked errors"
+    )
+    report("  punch-in commit", writes)
+    report("  dashboard read", reads)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+    run("rollback journal", False, args)
+    run("WAL + pragmas", True, args)
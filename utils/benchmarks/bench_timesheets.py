@@ -0,0 +1,137 @@
+# bench_timesheets.py
+"""A company's monthly timesheets: one query set per employee vs the one-pass bulk mode.
+
+Usage:
+    python utils/benchmarks/bench_timesheets.py --employees 2000
+
+Seeds ``--employees`` employees with four punches on each working day of
+June 2025, an approved regularization per employee and approved leave for
+one in ten. The first pass builds each timesheet on its own, as a client
+looping over employees would; the second runs company_timesheets once.
+"""
+import argparse, os, random, sys, tempfile, time
+from datetime import date, datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from database.models import (
+    Attendance,
+    Base,
+    Department,
+    Employee,
+    LeaveApplication,
+    Regularization,
+    Role,
+)
+from common.timesheet import company_timesheets, get_employee_timesheet_admin
+from common.work_calendar import calendar_cache
+
+YEAR, MONTH = 2025, 6
+ADMIN = {"id": 1, "is_admin": True}
+
+
+def seed(db, employees: int):
+    rng = random.Random(7)
+    db.add(Department(department_id=1, department_name="Bench"))
+    db.add(Role(role_id=1, role="Bench"))
+    db.execute(
+        insert(Employee),
+        [
+            {
+                "employee_id": n,
+                "first_name": "E",
+                "last_name": str(n),
+                "email": f"e{n}@bench.test",
+                "password": "x",
+                "joining_date": datetime(2024, 1, 1),
+                "isadmin": n == 1,
+                "fk_department_id": 1,
+                "fk_role_id": 1,
+            }
+            for n in range(1, employees + 1)
+        ],
+    )
+    days = [date(YEAR, MONTH, 1) + timedelta(n) for n in range(30)]
+    punches = [
+        {
+            "fk_employee_id": n,
+            "punch_time": datetime(d.year, d.month, d.day, h, rng.randrange(60)),
+        }
+        for n in range(1, employees + 1)
+        for d in days
+        if d.weekday() < 5
+        for h in (9, 13, 14, 18)
+    ]
+    for i in range(0, len(punches), 10000):
+        db.execute(insert(Attendance), punches[i : i + 10000])
+    db.execute(
+        insert(Regularization),
+        [
+            {
+                "regularization_start_time": datetime(YEAR, MONTH, 7, 10),
+                "regularization_end_time": datetime(YEAR, MONTH, 7, 14),
+                "regularization_reason": "Bench",
+                "regularization_status": "Approved",
+                "fk_employee_id": n,
+                "fk_manager_id": 1,
+            }
+            for n in range(1, employees + 1)
+        ],
+    )
+    db.execute(
+        insert(LeaveApplication),
+        [
+            {
+                "from_date": datetime(YEAR, MONTH, 16, 9),
+                "end_date": datetime(YEAR, MONTH, 20, 18),
+                "total_days": 5,
+                "leave_status": "Approved",
+                "leave_reason": "Bench",
+                "fk_employee_id": n,
+                "fk_manager_id": 1,
+            }
+            for n in range(1, employees + 1, 10)
+        ],
+    )
+    db.commit()
+    return len(punches)
+
+
+def main(args):
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "timesheets.sqlite3")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        punches = seed(db, args.employees)
+        calendar_cache.invalidate()
+        print(f"{args.employees} employees, {punches} punches in {YEAR}-{MONTH:02d}")
+
+        start = time.perf_counter()
+        one_by_one = [
+            get_employee_timesheet_admin(db, ADMIN, n, YEAR, MONTH)["worked_seconds"]
+            for n in range(1, args.employees + 1)
+        ]
+        per_employee = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bulk = [row["worked_seconds"] for row in company_timesheets(db, YEAR, MONTH)]
+        one_pass = time.perf_counter() - start
+        assert bulk == one_by_one
+        print(f"{'per employee':<16} {per_employee * 1000:10.1f}ms")
+        print(f"{'one pass':<16} {one_pass * 1000:10.1f}ms")
+        print(f"{'speedup':<16} {per_employee / one_pass:10.1f}x")
+    finally:
+        db.close()
+        engine.dispose()
+        os.remove(path)
+        os.rmdir(tmp)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=2000)
+    main(parser.parse_args())
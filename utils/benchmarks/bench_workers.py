@@ -0,0 +1,115 @@
+# bench_workers.py
+"""Throughput as serve.py workers scale: requests/s and latency per worker count.
+
+Usage:
+    python utils/benchmarks/bench_workers.py --workers 1 2 4 --concurrency 32 --seconds 10
+
+For each worker count, starts ``python serve.py`` against a freshly seeded
+local SQLite database in a temporary directory. It then keeps
+``--concurrency`` clients requesting the manager dashboard (a few queries
+plus response serialisation) for ``--seconds``. Throughput should grow with
+workers until they outnumber the CPUs.
+"""
+import argparse, asyncio, os, socket, subprocess, sys, tempfile, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(ROOT)
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from database.models import Base
+from tests.seed_db import seed_all_tables
+from _harness import PASSWORD, TEST_DATA_DIR, report
+from serve import available_cpus
+
+URL = "/manager/dashboard/?on_date=2023-04-01"
+
+
+def seed(directory: str):
+    engine = create_engine(f"sqlite:///{os.path.join(directory, 'greythr.db')}")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        seed_all_tables(session, TEST_DATA_DIR)
+    engine.dispose()
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def wait_until_up(base: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base) as http:
+        while True:
+            try:
+                (await http.get("/")).raise_for_status()
+                return
+            except httpx.TransportError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.2)
+
+
+async def drive(base: str, concurrency: int, seconds: float):
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base, limits=limits, timeout=30) as http:
+        response = await http.post(
+            "/auth/token",
+            data={"username": "managerA@test.com", "password": PASSWORD},
+        )
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        samples, stop_at = [], time.perf_counter() + seconds
+
+        async def client():
+            while time.perf_counter() < stop_at:
+                start = time.perf_counter()
+                (await http.get(URL, headers=headers)).raise_for_status()
+                samples.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        return samples, time.perf_counter() - start
+
+
+def run(workers: int, args):
+    with tempfile.TemporaryDirectory() as directory:
+        seed(directory)
+        port = free_port()
+        env = {
+            **os.environ,
+            "DB_CONNECT": "local",
+            "PORT": str(port),
+            "HOST": "127.0.0.1",
+            "WEB_CONCURRENCY": str(workers),
+            "WEB_MAX_REQUESTS": "0",
+        }
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "serve.py")],
+            cwd=directory,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            base = f"http://127.0.0.1:{port}"
+            asyncio.run(wait_until_up(base))
+            samples, elapsed = asyncio.run(drive(base, args.concurrency, args.seconds))
+        finally:
+            server.terminate()
+            server.wait(timeout=60)
+    report(f"{workers} worker(s) {len(samples) / elapsed:8.1f} req/s", samples)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+    print(f"{available_cpus()} CPU(s) available, {args.concurrency} clients")
+    for workers in args.workers:
+        run(workers, args)
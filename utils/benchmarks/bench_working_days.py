@@ -0,0 +1,116 @@
+# bench_working_days.py
+"""Working-day counts: a day-by-day loop vs WorkCalendar prefix sums, then a bulk recount.
+
+Usage:
+    python utils/benchmarks/bench_working_days.py --ranges 100000 --applications 50000
+
+The first part counts ``--ranges`` random leave ranges of up to 60 days
+both ways. The second seeds ``--applications`` leave applications counted
+in calendar days and times recompute_leave_days over all of them.
+"""
+import argparse, os, random, sys, tempfile, time
+from datetime import date, datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from database.models import Base, Department, Employee, Holiday, LeaveApplication, Role
+from common.work_calendar import WorkCalendar, calendar_cache, recompute_leave_days
+
+WEEKLY_OFFS = {5, 6}
+HOLIDAYS = {date(2025, 1, 26), date(2025, 8, 15), date(2025, 10, 2), date(2025, 12, 25)}
+
+
+def naive_working_days(start: date, end: date) -> int:
+    days = (start + timedelta(n) for n in range((end - start).days + 1))
+    return sum(d.weekday() not in WEEKLY_OFFS and d not in HOLIDAYS for d in days)
+
+
+def random_ranges(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    for _ in range(count):
+        start = date(2024, 1, 1) + timedelta(rng.randrange(730))
+        yield start, start + timedelta(rng.randrange(60))
+
+
+def bench_counts(count: int):
+    ranges = list(random_ranges(count))
+    start = time.perf_counter()
+    expected = [naive_working_days(a, b) for a, b in ranges]
+    naive = time.perf_counter() - start
+
+    cal = WorkCalendar(WEEKLY_OFFS, HOLIDAYS)
+    start = time.perf_counter()
+    got = [cal.working_days(a, b) for a, b in ranges]
+    prefix = time.perf_counter() - start
+    assert got == expected
+    print(f"{count} ranges of up to 60 days")
+    print(f"day-by-day loop      {naive * 1e6 / count:8.2f}us/range")
+    print(f"prefix sums          {prefix * 1e6 / count:8.2f}us/range")
+    print(f"speedup              {naive / prefix:8.1f}x")
+
+
+def bench_recompute(count: int):
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "recompute.sqlite3")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        db.add(Department(department_id=1, department_name="Bench"))
+        db.add(Role(role_id=1, role="Bench"))
+        db.add(
+            Employee(
+                employee_id=1,
+                first_name="E",
+                last_name="1",
+                email="e1@bench.test",
+                password="x",
+                joining_date=datetime(2024, 1, 1),
+                isadmin=True,
+                fk_department_id=1,
+                fk_role_id=1,
+            )
+        )
+        db.execute(
+            insert(Holiday),
+            [{"holiday_date": d, "holiday_name": "Holiday"} for d in HOLIDAYS],
+        )
+        db.execute(
+            insert(LeaveApplication),
+            [
+                {
+                    "from_date": datetime.combine(a, datetime.min.time()),
+                    "end_date": datetime.combine(b, datetime.min.time()),
+                    "total_days": (b - a).days + 1,
+                    "leave_status": "Pending",
+                    "leave_reason": "Bench",
+                    "fk_employee_id": 1,
+                    "fk_manager_id": 1,
+                }
+                for a, b in random_ranges(count)
+            ],
+        )
+        db.commit()
+        calendar_cache.invalidate()
+        result = recompute_leave_days(db, {"id": 1, "is_admin": True})
+        print(
+            f"recompute_leave_days {result['checked']} checked, "
+            f"{result['updated']} updated in {result['duration_ms'] / 1000:.2f}s "
+            f"({result['checked'] / result['duration_ms'] * 1000:.0f} rows/s)"
+        )
+    finally:
+        db.close()
+        engine.dispose()
+        os.remove(path)
+        os.rmdir(tmp)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ranges", type=int, default=100000)
+    parser.add_argument("--applications", type=int, default=50000)
+    args = parser.parse_args()
+    bench_counts(args.ranges)
+    bench_recompute(args.applications)
@@ -0,0 +1,23 @@
+# create_indexes.py
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.database import engine
+from database.models import Base
+
+
+def create_missing_indexes():
+    """Create indexes declared in database/models.py on an existing database.
+
+    `Base.metadata.create_all` only creates indexes together with new tables,
+    so databases created before an index was added need this one-off step.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+            print(f"✅ {table.name}: {index.name}")
+
+
+if __name__ == "__main__":
+    create_missing_indexes()
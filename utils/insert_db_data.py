@@ -1,4 +1,3 @@
-import bcrypt
 import os, sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -13,6 +12,10 @@ from database.models import (
     Salary,
     Regularization,
 )  # Import your SQLAlchemy models
+from database.common import hash_password
+
+# One hash shared by every seeded account keeps seeding fast.
+TESTING_HASH = hash_password("Testing")
 
 
 def seed_data():
@@ -66,7 +69,7 @@ def seed_data():
                 fk_role_id=1,  # Developer
                 fk_manager_id=None,
                 isadmin=1,
-                password="Testing",  # Use bcrypt.hashpw in production
+                password=TESTING_HASH,
             ),
             Employee(
                 first_name="John",
@@ -78,7 +81,7 @@ def seed_data():
                 fk_role_id=2,  # Manager
                 fk_manager_id=1,
                 isadmin=0,
-                password="Testing",
+                password=TESTING_HASH,
             ),
             Employee(
                 first_name="Alice",
@@ -90,7 +93,7 @@ def seed_data():
                 fk_role_id=1,
                 fk_manager_id=1,
                 isadmin=0,
-                password="Testing",
+                password=TESTING_HASH,
             ),
             Employee(
                 first_name="Robert",
@@ -102,7 +105,7 @@ def seed_data():
                 fk_role_id=3,
                 fk_manager_id=2,
                 isadmin=0,
-                password="Testing",
+                password=TESTING_HASH,
             ),
             Employee(
                 first_name="Emily",
@@ -114,7 +117,7 @@ def seed_data():
                 fk_role_id=2,
                 fk_manager_id=2,
                 isadmin=0,
-                password="Testing",
+                password=TESTING_HASH,
             ),
             Employee(
                 first_name="David",
@@ -126,7 +129,7 @@ def seed_data():
                 fk_role_id=1,
                 fk_manager_id=1,
                 isadmin=0,
-                password="Testing",
+                password=TESTING_HASH,
             ),
         ]
 
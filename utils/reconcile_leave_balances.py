@@ -0,0 +1,40 @@
+# reconcile_leave_balances.py
+import argparse, os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.database import engine, sessionlocal as SessionLocal
+from database.models import LeaveLedgerEntry
+from common.leave_ledger import reconcile_leave_balances
+
+
+def reconcile(year=None, fix=False):
+    """Compare every leave balance with its approved applications.
+
+    Read-only unless ``fix`` is set; then drifted balances are corrected and
+    each correction is recorded in the leave_ledger table. Safe to re-run.
+    """
+    LeaveLedgerEntry.__table__.create(bind=engine, checkfirst=True)
+    db = SessionLocal()
+    try:
+        result = reconcile_leave_balances(db, year=year, fix=fix)
+        for row in result["drift"]:
+            print(
+                f"  employee {row['fk_employee_id']} {row['assign_year']}: "
+                f"balance {row['balance_leave']}, expected {row['expected_balance']}"
+            )
+        action = "fixed" if fix else "found"
+        print(
+            f"✅ leave balances: {result['checked']} checked, "
+            f"{result['drifted']} drifted ({action}) in {result['duration_ms']}ms"
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reconcile leave balances")
+    parser.add_argument("--year", type=int)
+    parser.add_argument("--fix", action="store_true")
+    args = parser.parse_args()
+    reconcile(year=args.year, fix=args.fix)